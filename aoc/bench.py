@@ -0,0 +1,236 @@
+from __future__ import annotations
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+from typing import Any, NamedTuple
+
+from aoc.generate import generate
+from aoc.testing import parametrize
+from aoc.runner import Puzzle, discover, load, select
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+SUPERLINEAR = 1.3
+
+# Sizes are passed to `aoc.generate.generate`, so they are lines or records for list
+# days, side lengths for grid days and digits for day 9.
+LADDERS: dict[int, list[int]] = {
+    1: [2500, 5000, 10000, 20000],
+    2: [1000, 2000, 4000, 8000],
+    3: [2500, 5000, 10000, 20000],
+    4: [25, 50, 100, 200],
+    5: [250, 500, 1000, 2000],
+    6: [20, 40, 80, 160],
+    7: [50, 100, 200, 400],
+    8: [25, 50, 100, 200],
+    9: [500, 1000, 2000, 4000],
+    10: [25, 50, 100, 200],
+    11: [25, 50, 100, 200],
+    12: [25, 50, 100, 200],
+    13: [250, 500, 1000, 2000],
+}
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+class Sample(NamedTuple):
+    n: int
+    size: int
+    seconds: float
+
+
+class Scaling(NamedTuple):
+    day: int
+    part: int
+    samples: list[Sample]
+    exponent: float | None
+
+    @property
+    def superlinear(self) -> bool:
+        return self.exponent is not None and self.exponent > SUPERLINEAR
+
+
+def measure(puzzle: Puzzle, input_string: str, repeat: int = 3) -> float:
+    """Times `solve` on one input, keeping the best of several runs to cut noise.
+
+    Args:
+        puzzle (Puzzle): puzzle to time
+        input_string (str): input to solve
+        repeat (int): number of runs
+
+    Returns:
+        float: fastest wall time in seconds
+    """
+
+    solve = load(puzzle).solve
+
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solve(input_string)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def fit_exponent(samples: list[Sample]) -> float | None:
+    """Fits `seconds = c * size^k` with least squares on the log-log points and returns
+    `k`. A `k` of 1 is linear growth and 2 is quadratic.
+
+    Args:
+        samples (list[Sample]): timings at different input sizes
+
+    Returns:
+        float | None: growth exponent, or None with fewer than two usable samples
+    """
+
+    points = [
+        (math.log(s.size), math.log(s.seconds))
+        for s in samples
+        if s.size > 0 and s.seconds > 0
+    ]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if var == 0:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def scale(
+    puzzle: Puzzle,
+    ladder: list[int],
+    seed: int = 0,
+    repeat: int = 3,
+    max_seconds: float = 10.0,
+) -> Scaling:
+    """Times a puzzle across a ladder of generated input sizes. The ladder stops early
+    once a single run takes longer than max_seconds.
+
+    Args:
+        puzzle (Puzzle): puzzle to time
+        ladder (list[int]): increasing sizes to pass to the generator
+        seed (int): generator seed
+        repeat (int): runs per size
+        max_seconds (float): time after which larger sizes are skipped
+
+    Returns:
+        Scaling: samples and fitted growth exponent
+    """
+
+    samples: list[Sample] = []
+    for n in ladder:
+        input_string = generate(puzzle.day, n, seed)
+        seconds = measure(puzzle, input_string, repeat)
+        samples.append(Sample(n, len(input_string.encode()), seconds))
+
+        if seconds > max_seconds:
+            break
+
+    return Scaling(puzzle.day, puzzle.part, samples, fit_exponent(samples))
+
+
+def to_report(results: list[Scaling]) -> dict[str, Any]:
+    """Builds a JSON friendly report. Keys are stable so reports diff cleanly.
+
+    Args:
+        results (list[Scaling]): results to report
+
+    Returns:
+        dict[str, Any]: report
+    """
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "threshold": SUPERLINEAR,
+        "results": [
+            {
+                "day": r.day,
+                "part": r.part,
+                "exponent": None if r.exponent is None else round(r.exponent, 3),
+                "superlinear": r.superlinear,
+                "samples": [
+                    {"n": s.n, "bytes": s.size, "seconds": round(s.seconds, 6)}
+                    for s in r.samples
+                ],
+            }
+            for r in results
+        ],
+    }
+
+
+def format_scaling(result: Scaling) -> str:
+    exponent = "n/a" if result.exponent is None else f"{result.exponent:.2f}"
+    flag = "  SUPERLINEAR" if result.superlinear else ""
+    timings = " ".join(f"{s.size}B:{s.seconds:.4f}s" for s in result.samples)
+    return f"day{result.day:02d} part{result.part}: k={exponent}{flag}  {timings}"
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize(
+    ("power", "expected"),
+    ((1, 1.0), (2, 2.0)),
+)
+def test_fit_exponent(power: int, expected: float) -> None:
+    import pytest
+
+    samples = [Sample(n, n, 1e-6 * n**power) for n in (10, 20, 40, 80)]
+    assert fit_exponent(samples) == pytest.approx(expected)
+
+
+def test_scale() -> None:
+    result = scale(Puzzle(1, 1, "day01.part1"), [100, 200], repeat=1)
+    assert [s.n for s in result.samples] == [100, 200]
+    assert to_report([result])["results"][0]["day"] == 1
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time each part across growing inputs and fit a growth exponent."
+    )
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument(
+        "-p", "--part", dest="parts", type=int, action="append", choices=(1, 2)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--factor", type=float, default=1.0, help="multiply every ladder size"
+    )
+    parser.add_argument("--max-seconds", type=float, default=10.0)
+    parser.add_argument("-o", "--output", help="write a JSON report to this file")
+    args = parser.parse_args()
+
+    puzzles = select(discover(), args.days, args.parts)
+    results: list[Scaling] = []
+    for puzzle in puzzles:
+        if puzzle.day not in LADDERS:
+            continue
+
+        ladder = [max(1, int(n * args.factor)) for n in LADDERS[puzzle.day]]
+        result = scale(puzzle, ladder, args.seed, args.repeat, args.max_seconds)
+        results.append(result)
+        print(format_scaling(result), file=sys.stdout if args.output else sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(to_report(results), f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(to_report(results), sys.stdout, indent=2)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
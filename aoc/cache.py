@@ -0,0 +1,372 @@
+from __future__ import annotations
+import os
+import ast
+import struct
+import contextlib
+import hashlib
+import inspect
+import collections
+import importlib.util
+from array import array
+from types import CodeType, ModuleType
+from typing import TYPE_CHECKING, Any, Callable
+from aoc.testing import parametrize
+
+if TYPE_CHECKING:
+    import pytest
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(DIR)
+CACHE_DIR = os.environ.get("AOC_CACHE_DIR", os.path.join(ROOT, ".aoc_cache"))
+MAGIC = b"AOC1"
+HEADER = struct.Struct("<4sQQ")
+MEMORY_ENTRIES = 8  # Parsed inputs kept in memory, enough for both parts of a few days
+MAX_ENTRIES = 256  # Cache files kept on disk, least recently used are deleted first
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+# A module opts in to the cache by setting `CACHE` to one of the codecs below. The value
+# returned by its `parse` has to match the shape the codec expects. Both parts of a day
+# get the same parsed object, so `solve_parsed` must not modify its argument.
+#   rows:   list[list[int]], ragged rows of 64 bit integers
+#   grid:   list[str], rows of equal width made of single byte characters
+#   digits: list[int], values between 0 and 255
+def _encode_rows(rows: list[list[int]]) -> bytes:
+    offsets = array("q", [0])
+    values = array("q")
+    for row in rows:
+        values.extend(row)
+        offsets.append(len(values))
+
+    return (
+        HEADER.pack(MAGIC, len(rows), len(values))
+        + offsets.tobytes()
+        + values.tobytes()
+    )
+
+
+def _decode_rows(blob: bytes) -> list[list[int]]:
+    _, n_rows, n_values = HEADER.unpack_from(blob)
+
+    start = HEADER.size
+    offsets = array("q")
+    offsets.frombytes(blob[start : start + 8 * (n_rows + 1)])
+
+    start += 8 * (n_rows + 1)
+    values = array("q")
+    values.frombytes(blob[start : start + 8 * n_values])
+
+    flat = values.tolist()
+    return [flat[offsets[i] : offsets[i + 1]] for i in range(n_rows)]
+
+
+def _encode_grid(rows: list[str]) -> bytes:
+    width = len(rows[0]) if rows else 0
+    if any(len(row) != width for row in rows):
+        raise ValueError("Grid rows must all have the same width")
+
+    return HEADER.pack(MAGIC, len(rows), width) + "".join(rows).encode("latin-1")
+
+
+def _decode_grid(blob: bytes) -> list[str]:
+    _, height, width = HEADER.unpack_from(blob)
+    text = blob[HEADER.size :].decode("latin-1")
+    return [text[i * width : (i + 1) * width] for i in range(height)]
+
+
+def _encode_digits(digits: list[int]) -> bytes:
+    return HEADER.pack(MAGIC, len(digits), 0) + bytes(digits)
+
+
+def _decode_digits(blob: bytes) -> list[int]:
+    return list(blob[HEADER.size :])
+
+
+CODECS: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "rows": (_encode_rows, _decode_rows),
+    "grid": (_encode_grid, _decode_grid),
+    "digits": (_encode_digits, _decode_digits),
+}
+
+# Parsed inputs recently seen by this process, so the second part never touches disk.
+# Least recently used first, so long running processes only hold the last few.
+_memory: collections.OrderedDict[str, Any] = collections.OrderedDict()
+_fingerprints: dict[Callable[..., Any], str] = {}
+
+
+def aoc_imports(source: str) -> list[str]:
+    """Names of the `aoc` modules imported by a piece of source code.
+
+    Args:
+        source (str): module source
+
+    Returns:
+        list[str]: imported module names, e.g. `aoc.grid`
+    """
+
+    names: list[str] = []
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, ast.ImportFrom) or not node.module:
+            continue
+
+        if node.module == "aoc":
+            names.extend(f"aoc.{alias.name}" for alias in node.names)
+        elif node.module.startswith("aoc."):
+            names.append(node.module)
+
+    return sorted(set(names))
+
+
+def _source(name: str) -> bytes:
+    spec = importlib.util.find_spec(name)
+    if spec is None or not spec.origin:
+        return b""
+
+    with open(spec.origin, "rb") as f:
+        return f.read()
+
+
+def dependencies(parse: Callable[..., Any]) -> list[str]:
+    """Names of the `aoc` modules a parse function uses, through the globals it reads
+    (such as `tokenize` or `Grid`) and whatever those modules import in turn.
+
+    Args:
+        parse (Callable[..., Any]): parse function of a module
+
+    Returns:
+        list[str]: module names, e.g. `aoc.tokenize`
+    """
+
+    names: set[str] = set()
+    codes: list[CodeType] = [parse.__code__]
+    while codes:
+        code = codes.pop()
+        codes.extend(c for c in code.co_consts if isinstance(c, CodeType))
+        for name in code.co_names:
+            value = parse.__globals__.get(name)
+            module = (
+                value.__name__
+                if isinstance(value, ModuleType)
+                else getattr(value, "__module__", None)
+            )
+            if isinstance(module, str) and module.startswith("aoc."):
+                names.add(module)
+
+    pending = list(names)
+    while pending:
+        for name in aoc_imports(_source(pending.pop()).decode()):
+            if name not in names:
+                names.add(name)
+                pending.append(name)
+
+    return sorted(names)
+
+
+def fingerprint(parse: Callable[..., Any]) -> str:
+    """Hashes the source of a parse function along with the `aoc` modules it uses.
+    Parts whose parse functions are identical share cache entries, and editing a parser
+    or a helper it relies on, such as `aoc.tokenize`, invalidates its entries.
+
+    Args:
+        parse (Callable[..., Any]): parse function of a module
+
+    Returns:
+        str: hex digest of the sources
+    """
+
+    if parse not in _fingerprints:
+        h = hashlib.sha256(inspect.getsource(parse).encode())
+        for name in dependencies(parse):
+            h.update(_source(name))
+
+        _fingerprints[parse] = h.hexdigest()
+
+    return _fingerprints[parse]
+
+
+def cache_key(module: ModuleType, input_string: str) -> str:
+    """Builds the cache key of a module's parsed input.
+
+    Args:
+        module (ModuleType): module with `parse` and `CACHE`
+        input_string (str): puzzle input
+
+    Returns:
+        str: hex digest naming the cache entry
+    """
+
+    h = hashlib.sha256()
+    h.update(module.__name__.rpartition(".")[0].encode())
+    h.update(module.CACHE.encode())
+    h.update(fingerprint(module.parse).encode())
+    h.update(input_string.encode())
+    return h.hexdigest()
+
+
+def load_parsed(
+    module: ModuleType, input_string: str, cache_dir: str | None = CACHE_DIR
+) -> Any:
+    """Returns `module.parse(input_string)`, reusing an earlier parse of the same input
+    when there is one. Modules without a `CACHE` codec are always parsed.
+
+    Args:
+        module (ModuleType): module with `parse`
+        input_string (str): puzzle input
+        cache_dir (str | None): directory of cache files, None keeps it in memory
+
+    Returns:
+        Any: parsed input
+    """
+
+    codec = getattr(module, "CACHE", None)
+    if codec is None:
+        return module.parse(input_string)
+
+    key = cache_key(module, input_string)
+    if key in _memory:
+        _memory.move_to_end(key)
+        return _memory[key]
+
+    encode, decode = CODECS[codec]
+    path = os.path.join(cache_dir, key) if cache_dir else None
+
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            parsed = decode(f.read())
+
+        # Reads count as uses for eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+    else:
+        parsed = module.parse(input_string)
+        if path and cache_dir:
+            _write(path, parsed, encode)
+            evict(cache_dir)
+
+    _memory[key] = parsed
+    while len(_memory) > MEMORY_ENTRIES:
+        _memory.popitem(last=False)
+
+    return parsed
+
+
+def _write(path: str, parsed: Any, encode: Callable[[Any], bytes]) -> None:
+    """Writes a cache file. Values the codec cannot hold, such as integers over 64 bits,
+    are silently left out of the cache.
+
+    Args:
+        path (str): cache file to write
+        parsed (Any): parsed input
+        encode (Callable[[Any], bytes]): codec encoder
+    """
+
+    try:
+        blob = encode(parsed)
+    except (OverflowError, ValueError, UnicodeEncodeError):
+        return
+
+    # Write then rename so a reader never sees half a file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+def evict(cache_dir: str = CACHE_DIR, max_entries: int = MAX_ENTRIES) -> int:
+    """Deletes the least recently used cache files until at most max_entries are left.
+
+    Args:
+        cache_dir (str): directory of cache files
+        max_entries (int): files to keep
+
+    Returns:
+        int: number of deleted files
+    """
+
+    entries = [e for e in os.scandir(cache_dir) if not e.name.endswith(".tmp")]
+    if len(entries) <= max_entries:
+        return 0
+
+    entries.sort(key=lambda e: e.stat().st_mtime_ns)
+    for entry in entries[: len(entries) - max_entries]:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(entry.path)
+
+    return len(entries) - max_entries
+
+
+def clear_memory() -> None:
+    _memory.clear()
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize(
+    ("codec", "parsed"),
+    (
+        ("rows", [[3, 4], [], [1, 2, 99999999999999]]),
+        ("grid", ["MMMS", "XAMA", "..#."]),
+        ("digits", [2, 3, 3, 3, 1, 0, 9]),
+    ),
+)
+def test_codecs(codec: str, parsed: Any) -> None:
+    encode, decode = CODECS[codec]
+    assert decode(encode(parsed)) == parsed
+
+
+@parametrize(
+    "day",
+    ("day01", "day02", "day04", "day06", "day07", "day08", "day09", "day10", "day13"),
+)
+def test_parts_share_parser(day: str) -> None:
+    import importlib
+
+    part1 = importlib.import_module(f"{day}.part1")
+    part2 = importlib.import_module(f"{day}.part2")
+    assert cache_key(part1, part1.INPUT_S) == cache_key(part2, part1.INPUT_S)
+
+
+def test_load_parsed(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+    import day01.part1 as module
+
+    parse = module.parse
+    expected = parse(module.INPUT_S)
+
+    clear_memory()
+    assert load_parsed(module, module.INPUT_S, str(tmp_path)) == expected
+    assert len(os.listdir(tmp_path)) == 1
+
+    # A fresh process reads the file instead of parsing again
+    clear_memory()
+    monkeypatch.setattr(module, "parse", _fail)
+    fingerprints = {**_fingerprints, _fail: fingerprint(parse)}
+    monkeypatch.setattr(sys.modules[__name__], "_fingerprints", fingerprints)
+    assert load_parsed(module, module.INPUT_S, str(tmp_path)) == expected
+
+
+def test_dependencies() -> None:
+    import day01.part1 as part1
+    import day01.part2 as part2
+
+    assert "aoc.tokenize" in dependencies(part1.parse)
+    assert "aoc.lazy" in dependencies(part1.parse)
+    assert fingerprint(part1.parse) == fingerprint(part2.parse)
+
+
+def test_bounds(tmp_path: Any) -> None:
+    import day01.part1 as module
+
+    clear_memory()
+    for i in range(MEMORY_ENTRIES + 4):
+        load_parsed(module, f"{i}   {i}\n", str(tmp_path))
+
+    assert len(_memory) == MEMORY_ENTRIES
+    assert evict(str(tmp_path), 3) == MEMORY_ENTRIES + 1
+    assert len(os.listdir(tmp_path)) == 3
+    clear_memory()
+
+
+def _fail(input_string: str) -> Any:
+    raise AssertionError("parsed again")
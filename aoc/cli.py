@@ -0,0 +1,291 @@
+from __future__ import annotations
+import os
+import sys
+import time
+import argparse
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+from aoc import engines, loader
+from aoc.testing import parametrize
+
+if TYPE_CHECKING:
+    import pytest
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+MIB = 1024 * 1024
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+class Phase(NamedTuple):
+    name: str
+    seconds: float
+    peak: int
+
+
+def profile(
+    parse: Callable[[str], Any],
+    solve_parsed: Callable[[Any], Any],
+    input_string: str,
+) -> tuple[Any, list[Phase]]:
+    """Runs parse and solve separately, recording wall time and the peak memory
+    allocated by Python (tracemalloc) during each phase. Tracing slows allocation
+    heavy code, so times are higher than in a normal run.
+
+    Args:
+        parse (Callable[[str], Any]): parse function of a part
+        solve_parsed (Callable[[Any], Any]): solve function of a part
+        input_string (str): puzzle input
+
+    Returns:
+        tuple[int, list[Phase]]: answer and the parse and solve phases
+    """
+
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        parsed = parse(input_string)
+        parse_phase = Phase(
+            "parse", time.perf_counter() - start, tracemalloc.get_traced_memory()[1]
+        )
+
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        answer = solve_parsed(parsed)
+        solve_phase = Phase(
+            "solve", time.perf_counter() - start, tracemalloc.get_traced_memory()[1]
+        )
+    finally:
+        tracemalloc.stop()
+
+    return answer, [parse_phase, solve_phase]
+
+
+def format_phase(phase: Phase) -> str:
+    return f"{phase.name:<6}{phase.seconds:>10.4f}s  peak {phase.peak / MIB:.2f} MiB"
+
+
+def format_answer(answer: int | tuple[int, ...]) -> str:
+    """Formats an answer, one line per part for solvers that return both parts.
+
+    Args:
+        answer (int | tuple[int, ...]): answer of a part, or of several parts
+
+    Returns:
+        str: answer to print
+    """
+    return "\n".join(map(str, answer)) if isinstance(answer, tuple) else str(answer)
+
+
+def default_pstats(solve_parsed: Callable[..., Any]) -> str:
+    """Names the pstats file after the part, e.g. `day10.part2.pstats`.
+
+    Args:
+        solve_parsed (Callable[..., Any]): solve function of a part
+
+    Returns:
+        str: file name
+    """
+
+    module = sys.modules[solve_parsed.__module__]
+    path = os.path.abspath(module.__file__ or "solution.py")
+    part = os.path.splitext(os.path.basename(path))[0]
+    return f"{os.path.basename(os.path.dirname(path))}.{part}.pstats"
+
+
+def main(
+    parse: Callable[[str], Any],
+    solve_parsed: Callable[[Any], Any],
+    input_txt: str,
+    argv: list[str] | None = None,
+) -> int:
+    """Command line entry point shared by every part.
+
+    Args:
+        parse (Callable[[str], Any]): parse function of the part
+        solve_parsed (Callable[[Any], Any]): solve function of the part
+        input_txt (str): default input file
+        argv (list[str] | None): arguments, defaults to `sys.argv`
+
+    Returns:
+        int: exit code
+    """
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "data_file", nargs="?", default=input_txt, help="input file, - for stdin"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="report parse and solve time and peak memory separately",
+    )
+    parser.add_argument(
+        "--pstats",
+        nargs="?",
+        const="",
+        metavar="FILE",
+        help="dump cProfile stats (default file: dayNN.partN.pstats)",
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="memory map the input if the part can parse straight from bytes",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="fold the input line by line if the part can, instead of reading it all",
+    )
+    parser.add_argument(
+        "--engine",
+        default=engines.REFERENCE,
+        help=f"solve with another engine of the part (default: {engines.REFERENCE})",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="also solve with the reference engine and fail if the answers differ",
+    )
+    args = parser.parse_args(argv)
+
+    # Look extras up next to the solver, since `both` modules reuse a part's parse
+    module = sys.modules[solve_parsed.__module__]
+    engine_parse = engines.engine_parser(module, args.engine)
+    if args.engine != engines.REFERENCE:
+        try:
+            solve_parsed = engines.select_engine(module, args.engine)
+        except ValueError as e:
+            parser.error(str(e))
+
+    # Parts that define `solve_lines` never need the whole input in memory
+    solve_lines = getattr(module, "solve_lines", None)
+    if args.stream and solve_lines is not None:
+        if args.data_file == "-":
+            print(format_answer(solve_lines(sys.stdin)))
+        else:
+            with open(args.data_file) as f:
+                print(format_answer(solve_lines(f)))
+        return 0
+
+    # Parts that define `parse_buffer` can read a memory mapped file directly, unless
+    # the engine parses into another shape
+    parse_buffer = getattr(module, "parse_buffer", None)
+    if (
+        args.mmap
+        and parse_buffer is not None
+        and engine_parse is None
+        and args.data_file != "-"
+    ):
+        with loader.mapped(args.data_file) as buffer:
+            print(format_answer(solve_parsed(parse_buffer(buffer))))
+        return 0
+
+    if args.data_file == "-":
+        input_string = sys.stdin.read()
+    else:
+        with open(args.data_file) as f:
+            input_string = f.read()
+
+    if args.verify:
+        verification = engines.verify(module, input_string, args.engine, parse)
+        print(format_answer(verification.answer))
+        print(engines.format_verification(verification), file=sys.stderr)
+        return 0 if verification.ok else 1
+
+    if engine_parse is not None:
+        parse = engine_parse
+
+    profiler = None
+    if args.pstats is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    if args.profile:
+        answer, phases = profile(parse, solve_parsed, input_string)
+    else:
+        answer = solve_parsed(parse(input_string))
+
+    if profiler is not None:
+        profiler.disable()
+        path = args.pstats or default_pstats(solve_parsed)
+        profiler.dump_stats(path)
+        print(f"wrote {path}", file=sys.stderr)
+
+    print(format_answer(answer))
+    if args.profile:
+        for phase in phases:
+            print(format_phase(phase), file=sys.stderr)
+
+    return 0
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_profile() -> None:
+    import day01.part1 as module
+
+    answer, phases = profile(module.parse, module.solve_parsed, module.INPUT_S)
+    assert answer == module.EXPECTED
+    assert [phase.name for phase in phases] == ["parse", "solve"]
+    assert all(phase.peak > 0 for phase in phases)
+
+
+def test_main_mmap(tmp_path: Any, capsys: pytest.CaptureFixture[str]) -> None:
+    import day10.part2 as module
+
+    data_file = tmp_path / "input.txt"
+    data_file.write_text(module.INPUT_S)
+
+    argv = [str(data_file), "--mmap"]
+    assert main(module.parse, module.solve_parsed, module.INPUT_TXT, argv) == 0
+    assert capsys.readouterr().out == f"{module.EXPECTED}\n"
+
+
+@parametrize("module_name", ("day01.part1", "day13.part2"))
+def test_main_stream(
+    module_name: str,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    import io
+    import importlib
+
+    module = importlib.import_module(module_name)
+    monkeypatch.setattr(sys, "stdin", io.StringIO(module.INPUT_S))
+
+    argv = ["-", "--stream"]
+    assert main(module.parse, module.solve_parsed, module.INPUT_TXT, argv) == 0
+    assert capsys.readouterr().out == f"{module.EXPECTED}\n"
+
+
+@parametrize("flags", ([], ["--verify"], ["--engine", "heaps", "--verify"]))
+def test_main_engine(
+    flags: list[str], tmp_path: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    import day09.part2 as module
+
+    data_file = tmp_path / "input.txt"
+    data_file.write_text(module.INPUT_S)
+
+    argv = [str(data_file), *flags]
+    assert main(module.parse, module.solve_parsed, module.INPUT_TXT, argv) == 0
+    assert capsys.readouterr().out == f"{module.EXPECTED}\n"
+
+
+@parametrize("flags", ([], ["--profile"]))
+def test_main(
+    flags: list[str], tmp_path: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    import pstats
+    import day01.part2 as module
+
+    data_file, stats_file = tmp_path / "input.txt", tmp_path / "out.pstats"
+    data_file.write_text(module.INPUT_S)
+
+    argv = [str(data_file), "--pstats", str(stats_file), *flags]
+    assert main(module.parse, module.solve_parsed, module.INPUT_TXT, argv) == 0
+    assert capsys.readouterr().out == f"{module.EXPECTED}\n"
+    assert pstats.Stats(str(stats_file)).get_stats_profile().func_profiles
@@ -0,0 +1,108 @@
+from __future__ import annotations
+import functools
+from typing import Any, Callable, TypeVar
+
+# CONSTANTS ----------------------------------------------------------------------------
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Off unless a caller asks for counters. Hot code checks this flag once per call, or
+# counts in a local variable and only adds the total when it is set, so disabled
+# counters cost next to nothing.
+ENABLED = False
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+_counts: dict[str, int] = {}
+_caches: dict[str, Any] = {}
+_cache_base: dict[str, tuple[int, int]] = {}
+
+
+def enable(enabled: bool = True) -> None:
+    global ENABLED
+    ENABLED = enabled
+
+
+def add(name: str, n: int = 1) -> None:
+    _counts[name] = _counts.get(name, 0) + n
+
+
+def track_cache(fn: F) -> F:
+    """Reports the hits and misses of a `functools.cache` function in `snapshot`. Use
+    it as a decorator above `functools.cache`.
+
+    Args:
+        fn (F): cached function
+
+    Returns:
+        F: the same function
+    """
+
+    _caches[f"{fn.__module__}.{fn.__name__}"] = fn
+    return fn
+
+
+def reset() -> None:
+    """Clears counters and starts counting cache hits and misses from now."""
+
+    _counts.clear()
+    for name, fn in _caches.items():
+        info = fn.cache_info()
+        _cache_base[name] = (info.hits, info.misses)
+
+
+def snapshot() -> dict[str, int]:
+    """Counters and cache statistics since the last `reset`. Caches that were not
+    used are left out.
+
+    Returns:
+        dict[str, int]: value of each counter, sorted by name
+    """
+
+    values = dict(_counts)
+    for name, fn in _caches.items():
+        info = fn.cache_info()
+        base_hits, base_misses = _cache_base.get(name, (0, 0))
+
+        # A cache cleared since the reset starts again from zero
+        hits = info.hits - base_hits if info.hits >= base_hits else info.hits
+        misses = (
+            info.misses - base_misses if info.misses >= base_misses else info.misses
+        )
+        if hits or misses:
+            values[f"{name}.hits"] = hits
+            values[f"{name}.misses"] = misses
+            values[f"{name}.size"] = info.currsize
+
+    return dict(sorted(values.items()))
+
+
+def format_counters(values: dict[str, int]) -> str:
+    return "\n".join(f"  {name}: {value}" for name, value in values.items())
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_counters() -> None:
+
+    @track_cache
+    @functools.cache
+    def square(n: int) -> int:
+        return n * n
+
+    square(2)
+    reset()
+    add("calls")
+    add("calls", 2)
+    square(2)
+    square(3)
+
+    name = f"{__name__}.square"
+    assert snapshot() == {
+        "calls": 3,
+        f"{name}.hits": 1,
+        f"{name}.misses": 1,
+        f"{name}.size": 2,
+    }
+
+    _caches.pop(name)
+    reset()
+    assert snapshot() == {}
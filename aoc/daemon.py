@@ -0,0 +1,265 @@
+from __future__ import annotations
+import os
+import sys
+import json
+import socket
+import asyncio
+import argparse
+import tempfile
+from typing import TYPE_CHECKING, Any
+from aoc import cache
+from aoc.runner import Puzzle, Result, discover, load, run
+
+if TYPE_CHECKING:
+    import pytest
+    from concurrent.futures import Executor
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET = os.environ.get(
+    "AOC_SOCKET", os.path.join(tempfile.gettempdir(), f"aoc-{os.getuid()}.sock")
+)
+LIMIT = 1 << 26  # Longest request line, inline inputs included
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+# The protocol is one JSON object per line in each direction. A request names the
+# puzzle and where its input comes from, the reply holds the result or an error:
+#   {"day": 7, "part": 2, "path": "/abs/input.txt"}    input read by the worker
+#   {"day": 7, "part": 2, "input": "190: 10 19\n..."}  input sent inline
+#   {"day": 7, "part": 2}                              the day's own input.txt
+#   {"day": 7, "part": 2, "answer": 3749, "seconds": 0.001} or {"error": "..."}
+_puzzles: dict[tuple[int, int], Puzzle] = {}
+
+
+def _warm() -> None:
+    """Imports every part once when a worker starts, so requests never pay for it and
+    module level caches such as `functools.cache` stay warm between requests."""
+
+    for puzzle in discover():
+        _puzzles[(puzzle.day, puzzle.part)] = puzzle
+        load(puzzle)
+
+
+def _solve(day: int, part: int, path: str | None, input_string: str | None) -> Result:
+    if not _puzzles:
+        _warm()
+
+    puzzle = _puzzles.get((day, part))
+    if puzzle is None:
+        raise ValueError(f"No puzzle for day {day} part {part}")
+
+    if input_string is None:
+        with open(path or load(puzzle).INPUT_TXT) as f:
+            input_string = f.read()
+
+    # Parsed inputs are dropped after every request, since a worker lives forever and
+    # most inputs are only sent once. Module level memos such as `functools.cache`
+    # stay warm.
+    try:
+        return run(puzzle, input_string)
+    finally:
+        cache.clear_memory()
+
+
+async def _handle(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, executor: Executor
+) -> None:
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                # The rest of a line over LIMIT cannot be told apart from the next
+                # request, so the connection is closed after replying
+                await _reply(writer, {"error": f"Request over {LIMIT} bytes"})
+                break
+
+            if not line:
+                break
+
+            try:
+                request = json.loads(line)
+                result = await loop.run_in_executor(
+                    executor,
+                    _solve,
+                    int(request["day"]),
+                    int(request["part"]),
+                    request.get("path"),
+                    request.get("input"),
+                )
+                reply: dict[str, Any] = result._asdict()
+            except Exception as e:
+                reply = {"error": f"{type(e).__name__}: {e}"}
+
+            await _reply(writer, reply)
+    except ConnectionError:
+        pass  # The client went away, there is no one left to reply to
+    finally:
+        writer.close()
+
+
+async def _reply(writer: asyncio.StreamWriter, reply: dict[str, Any]) -> None:
+    writer.write(json.dumps(reply).encode() + b"\n")
+    await writer.drain()
+
+
+async def start(socket_path: str, executor: Executor) -> asyncio.Server:
+    """Starts accepting connections on a Unix socket. Every connection can send any
+    number of requests, which are solved on executor.
+
+    Args:
+        socket_path (str): path of the socket, a stale socket file is replaced
+        executor (Executor): pool the solves run on
+
+    Returns:
+        asyncio.Server: running server
+    """
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    return await asyncio.start_unix_server(
+        lambda reader, writer: _handle(reader, writer, executor),
+        socket_path,
+        limit=LIMIT,
+    )
+
+
+async def serve(socket_path: str = SOCKET, jobs: int | None = None) -> None:
+    """Serves requests until cancelled on a pool of warm worker processes.
+
+    Args:
+        socket_path (str): path of the socket
+        jobs (int | None): number of processes, defaults to the number of cores
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=jobs or os.cpu_count(), initializer=_warm
+    ) as executor:
+        server = await start(socket_path, executor)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+
+def submit(
+    day: int,
+    part: int,
+    path: str | None = None,
+    input_string: str | None = None,
+    socket_path: str = SOCKET,
+) -> dict[str, Any]:
+    """Sends one request to a running daemon and waits for the reply.
+
+    Args:
+        day (int): day to solve
+        part (int): part to solve
+        path (str | None): input file, read by the daemon
+        input_string (str | None): input sent inline instead of a path
+        socket_path (str): path of the socket
+
+    Returns:
+        dict[str, Any]: reply, with `answer` and `seconds` or `error`
+    """
+
+    request: dict[str, Any] = {"day": day, "part": part}
+    if path is not None:
+        request["path"] = os.path.abspath(path)
+    if input_string is not None:
+        request["input"] = input_string
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_daemon(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+    import day01.part2 as module
+
+    socket_path = str(tmp_path / "aoc.sock")
+    monkeypatch.setattr(sys.modules[__name__], "LIMIT", 1024)
+
+    async def session() -> list[dict[str, Any]]:
+        with ThreadPoolExecutor(1) as executor:
+            async with await start(socket_path, executor):
+                return [
+                    await asyncio.to_thread(
+                        submit,
+                        1,
+                        2,
+                        input_string=module.INPUT_S,
+                        socket_path=socket_path,
+                    ),
+                    await asyncio.to_thread(submit, 99, 1, socket_path=socket_path),
+                    await asyncio.to_thread(
+                        submit,
+                        1,
+                        2,
+                        input_string="1 1\n" * 1024,
+                        socket_path=socket_path,
+                    ),
+                ]
+
+    ok, error, too_long = asyncio.run(session())
+    assert ok["answer"] == module.EXPECTED
+    assert not cache._memory
+    assert "No puzzle" in error["error"]
+    assert "over 1024 bytes" in too_long["error"]
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Keep solutions imported in a warm process and solve over a socket."
+    )
+    parser.add_argument("--socket", default=SOCKET, help="path of the Unix socket")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the daemon")
+    serve_parser.add_argument(
+        "-j", "--jobs", type=int, help="worker processes (default: number of cores)"
+    )
+
+    submit_parser = commands.add_parser("submit", help="solve through the daemon")
+    submit_parser.add_argument("day", type=int)
+    submit_parser.add_argument("part", type=int, choices=(1, 2))
+    submit_parser.add_argument(
+        "data_file", nargs="?", help="input file, - for stdin (default: input.txt)"
+    )
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args.socket, args.jobs))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.data_file == "-":
+        reply = submit(
+            args.day, args.part, input_string=sys.stdin.read(), socket_path=args.socket
+        )
+    else:
+        reply = submit(args.day, args.part, args.data_file, socket_path=args.socket)
+
+    if "error" in reply:
+        print(reply["error"], file=sys.stderr)
+        return 1
+
+    print(reply["answer"])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
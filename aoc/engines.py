@@ -0,0 +1,142 @@
+from __future__ import annotations
+import time
+from types import ModuleType
+from typing import Any, Callable, NamedTuple
+
+# CONSTANTS ----------------------------------------------------------------------------
+REFERENCE = "reference"
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+# A part's own `solve_parsed` is always its `reference` engine. Parts with faster
+# implementations list them in an optional module level `ENGINES` dict, mapping a name
+# to a function with the same signature as `solve_parsed`. Every engine is given the
+# same parsed input, so none of them may modify it. An engine that wants its input in
+# another shape, such as an array, names its own parse function in an optional `PARSERS`
+# dict, which takes the input text like `parse`.
+class Verification(NamedTuple):
+    engine: str
+    answer: int
+    expected: int
+    seconds: float
+    reference_seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.answer == self.expected
+
+
+def engines(module: ModuleType) -> dict[str, Callable[[Any], int]]:
+    """Returns the engines of a part, the reference first.
+
+    Args:
+        module (ModuleType): part module
+
+    Returns:
+        dict[str, Callable[[Any], int]]: solve functions by engine name
+    """
+    return {REFERENCE: module.solve_parsed, **getattr(module, "ENGINES", {})}
+
+
+def select_engine(
+    module: ModuleType, name: str, fallback: bool = False
+) -> Callable[[Any], int]:
+    """Looks up an engine of a part by name.
+
+    Args:
+        module (ModuleType): part module
+        name (str): engine name
+        fallback (bool): use the reference when the part has no such engine
+
+    Raises:
+        ValueError: the part has no such engine and fallback is off
+
+    Returns:
+        Callable[[Any], int]: solve function of the engine
+    """
+
+    available = engines(module)
+    if name in available:
+        return available[name]
+
+    if fallback:
+        return available[REFERENCE]
+
+    raise ValueError(
+        f"{module.__name__} has no engine {name!r}, choose from {', '.join(available)}"
+    )
+
+
+def engine_parser(module: ModuleType, name: str) -> Callable[[str], Any] | None:
+    """Looks up the parse function of an engine that does not use the part's `parse`.
+
+    Args:
+        module (ModuleType): part module
+        name (str): engine name
+
+    Returns:
+        Callable[[str], Any] | None: parse function, None if the engine uses `parse`
+    """
+    return getattr(module, "PARSERS", {}).get(name)
+
+
+def verify(
+    module: ModuleType,
+    input_string: str,
+    name: str,
+    parse: Callable[[str], Any] | None = None,
+) -> Verification:
+    """Runs an engine and the reference on the same input. Both share one parsed
+    input, unless the engine has its own parse function.
+
+    Args:
+        module (ModuleType): part module
+        input_string (str): puzzle input
+        name (str): engine to check
+        parse (Callable[[str], Any] | None): parse function of the reference, defaults
+            to the part's `parse`
+
+    Returns:
+        Verification: both answers and timings
+    """
+
+    solve = select_engine(module, name)
+    parsed = (parse or module.parse)(input_string)
+    engine_parse = engine_parser(module, name)
+
+    start = time.perf_counter()
+    answer = solve(engine_parse(input_string) if engine_parse else parsed)
+    seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = module.solve_parsed(parsed)
+    reference_seconds = time.perf_counter() - start
+
+    return Verification(name, answer, expected, seconds, reference_seconds)
+
+
+def format_verification(verification: Verification) -> str:
+    status = "ok" if verification.ok else "MISMATCH"
+    return (
+        f"{verification.engine}: {verification.answer} "
+        f"({verification.seconds:.3f}s), {REFERENCE}: {verification.expected} "
+        f"({verification.reference_seconds:.3f}s) {status}"
+    )
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_engines() -> None:
+    import pytest
+    import day01.part1 as module
+
+    assert list(engines(module))[0] == REFERENCE
+    assert select_engine(module, "missing", fallback=True) is module.solve_parsed
+    with pytest.raises(ValueError):
+        select_engine(module, "missing")
+
+    verification = verify(module, module.INPUT_S, REFERENCE)
+    assert verification.ok and verification.answer == module.EXPECTED
+
+    assert engine_parser(module, REFERENCE) is None
+    verification = verify(module, module.INPUT_S, "numpy")
+    assert verification.ok and verification.answer == module.EXPECTED
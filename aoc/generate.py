@@ -0,0 +1,351 @@
+from __future__ import annotations
+import os
+import sys
+import string
+import random
+import argparse
+from typing import Callable
+from aoc.testing import parametrize
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+# Every generator takes a seeded `random.Random` and a size `n`. The meaning of `n`
+# depends on the day: number of lines or records for list inputs, side length for
+# grid inputs, and number of digits for the disk map.
+def _day01(rng: random.Random, n: int) -> str:
+    left = [rng.randint(10000, 99999) for _ in range(n)]
+
+    # Part 2 only scores ids that show up in both lists
+    right = [
+        rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999)
+        for _ in range(n)
+    ]
+
+    lines = [f"{i}   {j}" for i, j in zip(left, right)]
+    return "\n".join(lines) + "\n"
+
+
+def _day02(rng: random.Random, n: int) -> str:
+    lines = []
+    for _ in range(n):
+        size = rng.randint(5, 8)
+        sign = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(size - 1):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+
+        # Break roughly half of the reports with one or two bad levels
+        for _ in range(rng.choice((0, 0, 1, 2))):
+            levels[rng.randrange(size)] += rng.randint(-4, 4)
+
+        # Real levels are positive, long decreasing runs could otherwise go below 1
+        levels = [max(1, level) for level in levels]
+        lines.append(" ".join(map(str, levels)))
+
+    return "\n".join(lines) + "\n"
+
+
+def _day03(rng: random.Random, n: int) -> str:
+    tokens = ["do()", "don't()", "mul(4*", "mul[3,7]", "?(12,34)", "select()", "%&"]
+    chunks = []
+    for _ in range(n):
+        if rng.random() < 0.6:
+            chunks.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        else:
+            chunks.append(rng.choice(tokens))
+
+    # Keep lines around the length of the real input
+    lines = [" ".join(chunks[i : i + 250]) for i in range(0, len(chunks), 250)]
+    return "\n".join(lines) + "\n"
+
+
+def _day04(rng: random.Random, n: int) -> str:
+    return _grid(rng, n, n, "XMAS")
+
+
+def _day05(rng: random.Random, n: int) -> str:
+
+    # The puzzle gives a rule for every pair of pages that can appear together
+    pages = rng.sample(range(10, 100), 49)
+    rules = [
+        f"{pages[i]}|{pages[j]}"
+        for i in range(len(pages) - 1)
+        for j in range(i + 1, len(pages))
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(n):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def _day06(rng: random.Random, n: int) -> str:
+
+    # Retry until the guard walks off the map, otherwise part 1 never terminates
+    while True:
+        area = [
+            ["#" if rng.random() < 0.05 else "." for _ in range(n)] for _ in range(n)
+        ]
+        x, y = rng.randrange(n), rng.randrange(n)
+        area[y][x] = "^"
+        if _guard_leaves(area, (x, y)):
+            return "\n".join("".join(row) for row in area) + "\n"
+
+
+def _guard_leaves(area: list[list[str]], start: tuple[int, int]) -> bool:
+    """Walks the guard like day 6 part 1 does.
+
+    Args:
+        area (list[list[str]]): 2D array representing the area
+        start (tuple[int, int]): position of the guard
+
+    Returns:
+        bool: True if the guard leaves the area, False if it walks in a loop
+    """
+
+    (x, y), direction = start, 0
+    seen = set()
+    while (x, y, direction) not in seen:
+        seen.add((x, y, direction))
+
+        dx, dy = DIRECTIONS[direction]
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < len(area[0]) and 0 <= ny < len(area)):
+            return True
+
+        if area[ny][nx] == "#":
+            direction = (direction + 1) % len(DIRECTIONS)
+        else:
+            x, y = nx, ny
+
+    return False
+
+
+def _day07(rng: random.Random, n: int) -> str:
+    lines: list[str] = []
+    while len(lines) < n:
+        nums = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+
+        # Build a reachable target most of the time, and a random one otherwise
+        if rng.random() < 0.6:
+            target = nums[0]
+            for num in nums[1:]:
+                op = rng.choice("+*|")
+                if op == "+":
+                    target += num
+                elif op == "*":
+                    target *= num
+                else:
+                    target = int(f"{target}{num}")
+        else:
+            target = rng.randint(1, 10 ** rng.randint(3, 14))
+
+        # Real targets stay well within 64 bits
+        if target < 10**15:
+            lines.append(f"{target}: {' '.join(map(str, nums))}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _day08(rng: random.Random, n: int) -> str:
+    area = [["." for _ in range(n)] for _ in range(n)]
+    for _ in range(max(1, n * n // 50)):
+        area[rng.randrange(n)][rng.randrange(n)] = rng.choice(FREQUENCIES)
+
+    return "\n".join("".join(row) for row in area) + "\n"
+
+
+def _day09(rng: random.Random, n: int) -> str:
+
+    # Odd length so the map ends with a file, and at least one free block
+    n = max(3, n | 1)
+    digits = [
+        str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9))
+        for i in range(n)
+    ]
+    digits[1] = str(rng.randint(1, 9))
+
+    return "".join(digits) + "\n"
+
+
+def _day10(rng: random.Random, n: int) -> str:
+    area = [[rng.randint(0, 9) for _ in range(n)] for _ in range(n)]
+
+    # Random terrain has almost no trails, so lay some down with random walks
+    for _ in range(max(1, n * n // 20)):
+        x, y = rng.randrange(n), rng.randrange(n)
+        for height in range(10):
+            area[y][x] = height
+            dx, dy = rng.choice(DIRECTIONS)
+            x, y = min(max(x + dx, 0), n - 1), min(max(y + dy, 0), n - 1)
+
+    return "\n".join("".join(map(str, row)) for row in area) + "\n"
+
+
+def _day11(rng: random.Random, n: int) -> str:
+    return " ".join(str(rng.randint(0, 999999)) for _ in range(n)) + "\n"
+
+
+def _day12(rng: random.Random, n: int) -> str:
+
+    # Regions come from a coarse grid of plants with some noise on top
+    block = 4
+    coarse = _grid(rng, n // block + 1, n // block + 1, string.ascii_uppercase[:8])
+    rows = coarse.splitlines()
+    area = [
+        [
+            (
+                rows[y // block][x // block]
+                if rng.random() > 0.1
+                else rng.choice(string.ascii_uppercase[:8])
+            )
+            for x in range(n)
+        ]
+        for y in range(n)
+    ]
+
+    return "\n".join("".join(row) for row in area) + "\n"
+
+
+def _day13(rng: random.Random, n: int) -> str:
+    machines = []
+    for _ in range(n):
+
+        # Buttons must be linearly independent for the linear solve, and no prize may
+        # only be reachable with a negative number of presses
+        while True:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+            if ax * by == ay * bx:
+                continue
+
+            if rng.random() < 0.5:
+                sa, sb = rng.randint(1, 100), rng.randint(1, 100)
+                px, py = sa * ax + sb * bx, sa * ay + sb * by
+            else:
+                px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+
+            if all(
+                _presses((ax, ay), (bx, by), (px + offset, py + offset))
+                for offset in (0, 10000000000000)
+            ):
+                break
+
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={px}, Y={py}"
+        )
+
+    return "\n\n".join(machines) + "\n"
+
+
+def _presses(a: tuple[int, int], b: tuple[int, int], prize: tuple[int, int]) -> bool:
+    """Returns False if the prize can only be won with a negative number of presses.
+
+    Args:
+        a (tuple[int, int]): movement of button A
+        b (tuple[int, int]): movement of button B
+        prize (tuple[int, int]): location of the prize
+
+    Returns:
+        bool: False if the exact solution is integral but negative, True otherwise
+    """
+
+    (ax, ay), (bx, by), (px, py) = a, b, prize
+    det = ax * by - ay * bx
+    sa, ra = divmod(px * by - py * bx, det)
+    sb, rb = divmod(ax * py - ay * px, det)
+
+    return ra != 0 or rb != 0 or (sa >= 0 and sb >= 0)
+
+
+def _grid(rng: random.Random, width: int, height: int, alphabet: str) -> str:
+    rows = ["".join(rng.choices(alphabet, k=width)) for _ in range(height)]
+    return "\n".join(rows) + "\n"
+
+
+GENERATORS: dict[int, Callable[[random.Random, int], str]] = {
+    1: _day01,
+    2: _day02,
+    3: _day03,
+    4: _day04,
+    5: _day05,
+    6: _day06,
+    7: _day07,
+    8: _day08,
+    9: _day09,
+    10: _day10,
+    11: _day11,
+    12: _day12,
+    13: _day13,
+}
+
+
+def generate(day: int, n: int, seed: int = 0) -> str:
+    """Generates a synthetic input for a day. The same seed always produces the same
+    input.
+
+    Args:
+        day (int): day to generate an input for
+        n (int): size of the input, see the note above the generators
+        seed (int): seed for the random number generator
+
+    Returns:
+        str: input in the same format as the day's `input.txt`
+    """
+
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+
+    return GENERATORS[day](random.Random(f"{day}-{n}-{seed}"), n)
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize("day", sorted(GENERATORS))
+def test_generate(day: int) -> None:
+    from aoc.runner import discover, load, select
+
+    assert generate(day, 12, seed=1) == generate(day, 12, seed=1)
+    assert generate(day, 12, seed=1) != generate(day, 12, seed=2)
+
+    input_string = generate(day, 12)
+    for puzzle in select(discover(), [day], None):
+        assert isinstance(load(puzzle).solve(input_string), int)
+
+
+def test_day02_levels() -> None:
+    levels = generate(2, 2000, seed=0).split()
+    assert min(map(int, levels)) >= 1
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic puzzle input.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    args = parser.parse_args()
+
+    input_string = generate(args.day, args.size, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(input_string)
+    else:
+        sys.stdout.write(input_string)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
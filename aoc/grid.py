@@ -0,0 +1,114 @@
+from __future__ import annotations
+from typing import Iterator, Sequence
+from aoc.testing import parametrize
+
+# CONSTANTS ----------------------------------------------------------------------------
+BORDER = 0  # Value of the padding cells, never a printable character
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+class Grid:
+    """A 2D grid of single byte cells stored row by row in one flat `bytearray`.
+
+    Cells are addressed by a flat index instead of `(x, y)` tuples, so moving in a
+    direction is adding the offset from `offset`. The grid is surrounded by `pad` rings
+    of `BORDER` cells, which lets walks of up to `pad` steps past the edge read a
+    border cell instead of checking bounds on every step.
+    """
+
+    def __init__(self, rows: Sequence[str | bytes], pad: int = 1):
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.pad = pad
+        self.stride = self.width + 2 * pad
+
+        if any(len(row) != self.width for row in rows):
+            raise ValueError("Grid rows must all have the same width")
+
+        self.cells = bytearray(self.stride * (self.height + 2 * pad))
+        for y, row in enumerate(rows):
+            start = self.index(0, y)
+            self.cells[start : start + self.width] = (
+                row.encode("latin-1") if isinstance(row, str) else row
+            )
+
+    def index(self, x: int, y: int) -> int:
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def coordinates(self, i: int) -> tuple[int, int]:
+        y, x = divmod(i, self.stride)
+        return x - self.pad, y - self.pad
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def offset(self, direction: tuple[int, int]) -> int:
+        dx, dy = direction
+        return dy * self.stride + dx
+
+    def offsets(self, directions: Sequence[tuple[int, int]]) -> list[int]:
+        """Converts `(dx, dy)` directions into flat index offsets.
+
+        Args:
+            directions (Sequence[tuple[int, int]]): directions to convert
+
+        Returns:
+            list[int]: offsets in the same order as directions
+        """
+        return [self.offset(direction) for direction in directions]
+
+    def positions(self) -> Iterator[int]:
+        """Yields the index of every cell inside the grid, row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, value: int) -> list[int]:
+        """Returns the index of every cell holding value, row by row.
+
+        Args:
+            value (int): byte to look for
+
+        Returns:
+            list[int]: indices of matching cells
+        """
+
+        found: list[int] = []
+        i = self.cells.find(value)
+        while i != -1:
+            found.append(i)
+            i = self.cells.find(value, i + 1)
+
+        return found
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value: int) -> None:
+        self.cells[i] = value
+
+    def __repr__(self) -> str:
+        return f"Grid(width={self.width}, height={self.height}, pad={self.pad})"
+
+
+# TEST CASES ---------------------------------------------------------------------------
+ROWS_S = ["..#", "^.."]
+
+
+@parametrize("pad", (1, 3))
+def test_grid(pad: int) -> None:
+    grid = Grid(ROWS_S, pad=pad)
+
+    assert (grid.width, grid.height) == (3, 2)
+    assert len(grid.cells) == (3 + 2 * pad) * (2 + 2 * pad)
+    assert grid[grid.index(2, 0)] == ord("#")
+    assert grid.coordinates(grid.index(2, 1)) == (2, 1)
+    assert grid.find(ord("^")) == [grid.index(0, 1)]
+    assert [grid[i] for i in grid.positions()] == list(b"..#^..")
+
+    # Walking off any edge lands on a border cell
+    up, right, down, left = grid.offsets([(0, -1), (1, 0), (0, 1), (-1, 0)])
+    assert grid[grid.index(0, 0) + up] == BORDER
+    assert grid[grid.index(2, 0) + right] == BORDER
+    assert grid[grid.index(0, 1) + down] == BORDER
+    assert grid[grid.index(0, 1) + left] == BORDER
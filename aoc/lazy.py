@@ -0,0 +1,84 @@
+from __future__ import annotations
+import os
+import sys
+import importlib.util
+from types import ModuleType
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(DIR)
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+def lazy_import(name: str) -> ModuleType:
+    """Returns a module that is only executed on its first attribute access. Heavy
+    dependencies such as numpy then cost nothing until a solution actually uses them.
+
+    Args:
+        name (str): absolute module name
+
+    Returns:
+        ModuleType: the module, loaded lazily unless it was already imported
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
+
+def load_pending() -> None:
+    """Executes every module returned by `lazy_import` that has not been used yet, for
+    code that has to pay for its imports up front, such as a solve that is about to have
+    its memory capped."""
+
+    for module in list(sys.modules.values()):
+        if type(module).__name__ == "_LazyModule":
+            dir(module)
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_lazy_import() -> None:
+    import subprocess
+
+    # Run in a fresh interpreter so the module is not already imported
+    code = (
+        "from aoc.lazy import lazy_import; "
+        "colorsys = lazy_import('colorsys'); "
+        "print(type(colorsys).__name__); "
+        "print(colorsys.rgb_to_hls(0, 0, 0)[0]); "
+        "print(type(colorsys).__name__)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    ).stdout
+    assert out.split() == ["_LazyModule", "0.0", "module"]
+
+    code = (
+        "from aoc.lazy import lazy_import, load_pending; "
+        "colorsys = lazy_import('colorsys'); "
+        "load_pending(); "
+        "print(type(colorsys).__name__)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    ).stdout
+    assert out.split() == ["module"]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+import os
+import mmap
+import contextlib
+from typing import TYPE_CHECKING, Any, Iterator
+from aoc.testing import parametrize
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+@contextlib.contextmanager
+def mapped(path: str) -> Iterator[memoryview]:
+    """Memory maps a file read only. Pages are read from disk as they are touched, so
+    large inputs are never copied into a `str` first.
+
+    Args:
+        path (str): file to map
+
+    Yields:
+        memoryview: view over the whole file
+    """
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            view.release()
+
+            # Slices handed out by the parsers keep the map alive, in which case it is
+            # closed once they are garbage collected
+            with contextlib.suppress(BufferError):
+                mm.close()
+
+
+def lines(buffer: Any) -> list[memoryview]:
+    """Splits a buffer into lines without copying them. Trailing `\\r` and the empty
+    line after a final newline are dropped.
+
+    Args:
+        buffer (Any): bytes like object
+
+    Returns:
+        list[memoryview]: one view per line
+    """
+
+    # Search the object behind the view, since memoryview has no `find`
+    view = memoryview(buffer)
+    raw = view.obj
+    if not isinstance(raw, (bytes, bytearray, mmap.mmap)) or len(raw) != view.nbytes:
+        raw = bytes(view)
+
+    rows: list[memoryview] = []
+    start, end = 0, len(view)
+    while start < end:
+        stop = raw.find(b"\n", start)
+        if stop == -1:
+            stop = end
+
+        line_end = stop
+        if line_end > start and view[line_end - 1] == ord("\r"):
+            line_end -= 1
+
+        rows.append(view[start:line_end])
+        start = stop + 1
+
+    return rows
+
+
+def digits(buffer: Any) -> bytes:
+    """Parses a line of digits into their values with one compact copy.
+
+    Args:
+        buffer (Any): bytes like object
+
+    Returns:
+        bytes: value of each digit, 0 to 9
+    """
+    return b"".join(bytes(line).strip() for line in lines(buffer)).translate(DIGITS)
+
+
+def grid_array(buffer: Any) -> np.ndarray:
+    """Views a grid input as a 2D `uint8` NumPy array without copying. The row stride
+    includes the newline, so rows must all be the same width and end in `\\n`.
+
+    Args:
+        buffer (Any): bytes like object
+
+    Returns:
+        np.ndarray: array of shape `(height, width)` over the buffer
+    """
+
+    import numpy as np
+
+    flat = np.frombuffer(buffer, dtype=np.uint8)
+    newlines = np.flatnonzero(flat == ord("\n"))
+    width = int(newlines[0]) if len(newlines) else len(flat)
+    height = (len(flat) + 1) // (width + 1)
+
+    if len(newlines) and not np.array_equal(
+        newlines[: height - 1], np.arange(1, height) * (width + 1) - 1
+    ):
+        raise ValueError("Grid rows must all have the same width")
+
+    return np.lib.stride_tricks.as_strided(
+        flat, shape=(height, width), strides=(width + 1, 1), writeable=False
+    )
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize(
+    ("input_s", "expected"),
+    (
+        (b"ab\ncd\n", [b"ab", b"cd"]),
+        (b"ab\r\ncd", [b"ab", b"cd"]),
+        (b"ab\n\ncd\n", [b"ab", b"", b"cd"]),
+        (b"", []),
+    ),
+)
+def test_lines(input_s: bytes, expected: list[bytes]) -> None:
+    assert [bytes(line) for line in lines(input_s)] == expected
+
+
+def test_mapped(tmp_path: Any) -> None:
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"..#\n^..\n")
+
+    with mapped(str(path)) as view:
+        rows = lines(view)
+        assert [bytes(row) for row in rows] == [b"..#", b"^.."]
+
+        array = grid_array(view)
+        assert array.shape == (2, 3)
+        assert bytes(array[1]) == b"^.."
+        assert array.base is not None
+
+
+def test_digits() -> None:
+    assert digits(b"2333133\n") == bytes([2, 3, 3, 3, 1, 3, 3])
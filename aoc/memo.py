@@ -0,0 +1,192 @@
+from __future__ import annotations
+import os
+import hashlib
+import inspect
+import importlib.util
+from types import ModuleType
+from typing import Any
+from aoc import cache, engines
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+MEMO_DIR = os.environ.get("AOC_MEMO_DIR", os.path.join(cache.CACHE_DIR, "results"))
+MAX_ENTRIES = 4096
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+# Every answer is stored in its own small file named after its key. Reading an entry
+# bumps its modification time, so evicting the oldest files drops the least recently
+# used answers first.
+_fingerprints: dict[str, str] = {}
+
+
+def fingerprint(module: ModuleType) -> str:
+    """Hashes the source of a part along with the `aoc` modules it imports, so editing
+    the solver or a helper it uses invalidates its answers.
+
+    Args:
+        module (ModuleType): part module
+
+    Returns:
+        str: hex digest of the sources
+    """
+
+    if module.__name__ not in _fingerprints:
+        source = inspect.getsource(module)
+
+        h = hashlib.sha256(source.encode())
+        for name in cache.aoc_imports(source):
+            spec = importlib.util.find_spec(name)
+            if spec is not None and spec.origin:
+                with open(spec.origin, "rb") as f:
+                    h.update(f.read())
+
+        _fingerprints[module.__name__] = h.hexdigest()
+
+    return _fingerprints[module.__name__]
+
+
+def memo_key(
+    module: ModuleType, input_string: str, engine: str = engines.REFERENCE
+) -> str:
+    """Builds the key of a part's answer on an input. Every engine stores its own
+    answers, so timing an engine never reads the reference's.
+
+    Args:
+        module (ModuleType): part module
+        input_string (str): puzzle input
+        engine (str): engine that solved it
+
+    Returns:
+        str: hex digest naming the entry
+    """
+
+    h = hashlib.sha256()
+    h.update(module.__name__.encode())
+    h.update(fingerprint(module).encode())
+    h.update(engine.encode())
+    h.update(hashlib.sha256(input_string.encode()).digest())
+    return h.hexdigest()
+
+
+def get(key: str, memo_dir: str = MEMO_DIR) -> int | None:
+    """Looks up a stored answer and marks it as recently used.
+
+    Args:
+        key (str): entry key
+        memo_dir (str): directory of the store
+
+    Returns:
+        int | None: stored answer, or None when there is none
+    """
+
+    path = os.path.join(memo_dir, key)
+    try:
+        with open(path) as f:
+            answer = int(f.read())
+    except (OSError, ValueError):
+        return None
+
+    # Another process may evict the entry in between
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+    return answer
+
+
+def put(
+    key: str, answer: int, memo_dir: str = MEMO_DIR, max_entries: int = MAX_ENTRIES
+) -> None:
+    """Stores an answer, evicting the least recently used entries over max_entries.
+
+    Args:
+        key (str): entry key
+        answer (int): answer to store
+        memo_dir (str): directory of the store
+        max_entries (int): entries kept in the store
+    """
+
+    # Write then rename so a reader never sees half a file
+    os.makedirs(memo_dir, exist_ok=True)
+    path = os.path.join(memo_dir, key)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(str(answer))
+    os.replace(tmp, path)
+
+    evict(memo_dir, max_entries)
+
+
+def evict(memo_dir: str = MEMO_DIR, max_entries: int = MAX_ENTRIES) -> int:
+    """Deletes the least recently used entries until at most max_entries are left.
+
+    Args:
+        memo_dir (str): directory of the store
+        max_entries (int): entries to keep
+
+    Returns:
+        int: number of deleted entries
+    """
+
+    entries = [e for e in os.scandir(memo_dir) if not e.name.endswith(".tmp")]
+    if len(entries) <= max_entries:
+        return 0
+
+    entries.sort(key=lambda e: e.stat().st_mtime_ns)
+    for entry in entries[: len(entries) - max_entries]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+    return len(entries) - max_entries
+
+
+def solve(module: ModuleType, input_string: str, memo_dir: str = MEMO_DIR) -> int:
+    """Returns `module.solve(input_string)`, reusing the stored answer when the part
+    and the input are unchanged since it was stored.
+
+    Args:
+        module (ModuleType): part module
+        input_string (str): puzzle input
+        memo_dir (str): directory of the store
+
+    Returns:
+        int: answer
+    """
+
+    key = memo_key(module, input_string)
+    answer = get(key, memo_dir)
+    if answer is None:
+        answer = module.solve(input_string)
+        put(key, answer, memo_dir)
+
+    return answer
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_solve(tmp_path: Any) -> None:
+    import day01.part1 as module
+
+    memo_dir = str(tmp_path)
+    assert solve(module, module.INPUT_S, memo_dir) == module.EXPECTED
+
+    # A stored answer is returned without solving again
+    put(memo_key(module, module.INPUT_S), -1, memo_dir)
+    assert solve(module, module.INPUT_S, memo_dir) == -1
+    assert solve(module, module.INPUT_S + "1   1\n", memo_dir) != -1
+    assert memo_key(module, module.INPUT_S, "numpy") != memo_key(module, module.INPUT_S)
+
+
+def test_evict(tmp_path: Any) -> None:
+    memo_dir = str(tmp_path)
+    for i, key in enumerate("abc"):
+        put(key, i, memo_dir, max_entries=3)
+        os.utime(os.path.join(memo_dir, key), ns=(i, i))
+
+    # Reading "a" makes it the most recently used entry
+    assert get("a", memo_dir) == 0
+    put("d", 3, memo_dir, max_entries=3)
+    assert sorted(os.listdir(memo_dir)) == ["a", "c", "d"]
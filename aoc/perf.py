@@ -0,0 +1,308 @@
+from __future__ import annotations
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+from typing import Any, NamedTuple
+
+from aoc.bench import LADDERS
+from aoc.generate import generate
+from aoc.testing import parametrize
+from aoc.runner import Puzzle, discover, load, select
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(DIR, "perf_baseline.json")
+
+# Relative slowdown and memory growth allowed before a check fails. Timings are noisy,
+# so changes smaller than MIN_SECONDS are never reported.
+TIME_TOLERANCE = 0.5
+MEMORY_TOLERANCE = 0.2
+MIN_SECONDS = 0.005
+
+# Every timing run solves the same input again until this much time has passed, so
+# inputs solved in microseconds are not timed by a single call
+MIN_RUN_SECONDS = 0.05
+
+# Opt in to the timing checks under pytest, since they depend on the machine
+PERF_ENV = "AOC_PERF"
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+class Measurement(NamedTuple):
+    day: int
+    part: int
+    n: int
+    seconds: float
+    peak: int
+
+    @property
+    def key(self) -> str:
+        return f"day{self.day:02d}.part{self.part}.n{self.n}"
+
+
+class Regression(NamedTuple):
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def perf_size(day: int) -> int:
+    """Input size checked for a day, the second rung of its benchmark ladder. Small
+    enough to keep the whole gate to a few seconds, see `time_solve` for the timing.
+
+    Args:
+        day (int): day to size
+
+    Returns:
+        int: size to pass to `aoc.generate.generate`
+    """
+    return LADDERS[day][1]
+
+
+def time_solve(puzzle: Puzzle, input_string: str, repeat: int = 3) -> float:
+    """Times `solve` on one input. Like `timeit`'s autorange, each run calls it until
+    `MIN_RUN_SECONDS` have passed and divides by the number of calls, then the best of
+    several runs is kept.
+
+    Args:
+        puzzle (Puzzle): puzzle to time
+        input_string (str): input to solve
+        repeat (int): number of runs
+
+    Returns:
+        float: fastest wall time of one call in seconds
+    """
+
+    solve = load(puzzle).solve
+
+    best = math.inf
+    for _ in range(repeat):
+        calls, start = 0, time.perf_counter()
+        while True:
+            solve(input_string)
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= MIN_RUN_SECONDS:
+                break
+
+        best = min(best, elapsed / calls)
+
+    return best
+
+
+def peak_memory(puzzle: Puzzle, input_string: str) -> int:
+    """Peak memory allocated by Python (tracemalloc) while solving one input. Runs
+    separately from timing since tracing slows allocation heavy code.
+
+    Args:
+        puzzle (Puzzle): puzzle to run
+        input_string (str): input to solve
+
+    Returns:
+        int: peak traced memory in bytes
+    """
+
+    import tracemalloc
+
+    solve = load(puzzle).solve
+    tracemalloc.start()
+    try:
+        solve(input_string)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def collect(puzzle: Puzzle, seed: int = 0, repeat: int = 3) -> Measurement:
+    """Measures time and peak memory of a puzzle on its generated perf input.
+
+    Args:
+        puzzle (Puzzle): puzzle to measure
+        seed (int): generator seed
+        repeat (int): timing runs, see `time_solve`
+
+    Returns:
+        Measurement: timing and memory of the puzzle
+    """
+
+    n = perf_size(puzzle.day)
+    input_string = generate(puzzle.day, n, seed)
+    return Measurement(
+        puzzle.day,
+        puzzle.part,
+        n,
+        time_solve(puzzle, input_string, repeat),
+        peak_memory(puzzle, input_string),
+    )
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: list[Measurement],
+    time_tolerance: float = TIME_TOLERANCE,
+    memory_tolerance: float = MEMORY_TOLERANCE,
+) -> list[Regression]:
+    """Finds measurements that got worse than the baseline by more than the tolerance.
+    Measurements missing from the baseline are skipped.
+
+    Args:
+        baseline (dict[str, Any]): baseline as written by `to_baseline`
+        current (list[Measurement]): new measurements
+        time_tolerance (float): allowed relative slowdown
+        memory_tolerance (float): allowed relative growth of peak memory
+
+    Returns:
+        list[Regression]: regressions, in the order of current
+    """
+
+    regressions: list[Regression] = []
+    for m in current:
+        entry = baseline["results"].get(m.key)
+        if entry is None:
+            continue
+
+        seconds = entry["seconds"]
+        if (
+            m.seconds > seconds * (1 + time_tolerance)
+            and m.seconds - seconds > MIN_SECONDS
+        ):
+            regressions.append(Regression(m.key, "seconds", seconds, m.seconds))
+
+        if m.peak > entry["peak"] * (1 + memory_tolerance):
+            regressions.append(Regression(m.key, "peak", entry["peak"], m.peak))
+
+    return regressions
+
+
+def to_baseline(measurements: list[Measurement]) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {
+            m.key: {"seconds": round(m.seconds, 6), "peak": m.peak}
+            for m in measurements
+        },
+    }
+
+
+def read_baseline(path: str = BASELINE) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_baseline(measurements: list[Measurement], path: str = BASELINE) -> None:
+    """Writes measurements to the baseline, keeping the entries of parts that were not
+    measured this time.
+
+    Args:
+        measurements (list[Measurement]): new measurements
+        path (str): baseline file
+    """
+
+    baseline = to_baseline(measurements)
+    if os.path.exists(path):
+        baseline["results"] = {**read_baseline(path)["results"], **baseline["results"]}
+
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def format_regression(regression: Regression) -> str:
+    if regression.metric == "seconds":
+        before = f"{regression.baseline:.4f}s"
+        after = f"{regression.current:.4f}s"
+    else:
+        before = f"{regression.baseline / 1024:.0f}KiB"
+        after = f"{regression.current / 1024:.0f}KiB"
+
+    return (
+        f"{regression.key:<22}{regression.metric:<8}"
+        f"{before:>12} -> {after:>12}  x{regression.ratio:.2f}"
+    )
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_compare() -> None:
+    baseline = to_baseline([Measurement(1, 1, 10, 0.1, 1000)])
+    ok, slow, big = (
+        Measurement(1, 1, 10, 0.12, 1100),
+        Measurement(1, 1, 10, 0.2, 1000),
+        Measurement(1, 1, 10, 0.1, 2000),
+    )
+
+    assert compare(baseline, [ok, Measurement(2, 1, 10, 9.0, 9000)]) == []
+    assert [r.metric for r in compare(baseline, [slow])] == ["seconds"]
+    assert [r.metric for r in compare(baseline, [big])] == ["peak"]
+    assert "x2.00" in format_regression(compare(baseline, [big])[0])
+
+
+def test_time_solve() -> None:
+    puzzle = Puzzle(6, 1, "day06.part1")
+    seconds = time_solve(puzzle, load(puzzle).INPUT_S, repeat=2)
+    assert 0 < seconds < MIN_RUN_SECONDS
+
+
+@parametrize("puzzle", discover())
+def test_perf(puzzle: Puzzle) -> None:
+    import pytest
+
+    if not os.environ.get(PERF_ENV):
+        pytest.skip(f"set {PERF_ENV}=1 to check timings against the baseline")
+
+    regressions = compare(read_baseline(), [collect(puzzle)])
+    assert not regressions, "\n".join(map(format_regression, regressions))
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare timings and peak memory against the stored baseline."
+    )
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument(
+        "-p", "--part", dest="parts", type=int, action="append", choices=(1, 2)
+    )
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON file")
+    parser.add_argument(
+        "--update", action="store_true", help="write the baseline instead of checking"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=TIME_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE)
+    args = parser.parse_args()
+
+    puzzles = select(discover(), args.days, args.parts)
+    measurements = [collect(puzzle, repeat=args.repeat) for puzzle in puzzles]
+
+    if args.update:
+        write_baseline(measurements, args.baseline)
+        print(f"wrote {args.baseline}", file=sys.stderr)
+        return 0
+
+    baseline = read_baseline(args.baseline)
+    if baseline.get("machine") != platform.machine():
+        print(
+            f"baseline was recorded on {baseline.get('machine')}, timings may differ",
+            file=sys.stderr,
+        )
+
+    regressions = compare(baseline, measurements, args.tolerance, args.memory_tolerance)
+    for regression in regressions:
+        print(format_regression(regression))
+
+    print(f"{len(regressions)} regressions over {len(measurements)} parts")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,248 @@
+from __future__ import annotations
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import platform
+import functools
+import contextlib
+import subprocess
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aoc.runner import Result
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(DIR)
+HISTORY = os.environ.get("AOC_HISTORY", os.path.join(ROOT, ".aoc_history.sqlite"))
+
+# Columns of the history table, in the order of the JSON records
+COLUMNS: dict[str, str] = {
+    "day": "INTEGER",
+    "part": "INTEGER",
+    "answer": "TEXT",
+    "seconds": "REAL",
+    "cpu_seconds": "REAL",
+    "peak_rss": "INTEGER",
+    "input": "TEXT",
+    "input_bytes": "INTEGER",
+    "engine": "TEXT",
+    "shared": "INTEGER",
+    "status": "TEXT",
+    "commit": "TEXT",
+    "machine": "TEXT",
+    "python": "TEXT",
+    "timestamp": "REAL",
+}
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+@functools.cache
+def environment() -> dict[str, str | None]:
+    """Describes where the run happens. The commit is None outside of a git checkout.
+
+    Returns:
+        dict[str, str | None]: commit, machine and Python version
+    """
+
+    try:
+        commit: str | None = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "machine": f"{platform.node()}/{platform.machine()}",
+        "python": platform.python_version(),
+    }
+
+
+def record(result: Result, input_path: str | None = None) -> dict[str, Any]:
+    """Builds the report record of one solve.
+
+    Args:
+        result (Result): result of the solve
+        input_path (str | None): input file the result was solved from
+
+    Returns:
+        dict[str, Any]: JSON friendly record with the keys of `COLUMNS`
+    """
+
+    return {
+        "day": result.day,
+        "part": result.part,
+        "answer": result.answer,
+        "seconds": round(result.seconds, 6),
+        "cpu_seconds": round(result.cpu_seconds, 6),
+        "peak_rss": result.peak_rss,
+        "input": input_path,
+        "input_bytes": result.input_bytes,
+        "engine": result.engine,
+        "shared": result.shared,
+        "status": result.status,
+        **environment(),
+        "timestamp": round(time.time(), 3),
+    }
+
+
+def connect(path: str = HISTORY) -> sqlite3.Connection:
+    """Opens the history database, creating the table on first use and adding columns
+    that are newer than the table.
+
+    Args:
+        path (str): database file
+
+    Returns:
+        sqlite3.Connection: open connection
+    """
+
+    connection = sqlite3.connect(path)
+
+    # Names are quoted since `commit` is an SQL keyword
+    columns = ", ".join(f'"{name}" {kind}' for name, kind in COLUMNS.items())
+    connection.execute(f"CREATE TABLE IF NOT EXISTS runs ({columns})")
+
+    existing = {row[1] for row in connection.execute("PRAGMA table_info(runs)")}
+    for name, kind in COLUMNS.items():
+        if name not in existing:
+            connection.execute(f'ALTER TABLE runs ADD COLUMN "{name}" {kind}')
+
+    return connection
+
+
+def store(records: list[dict[str, Any]], path: str = HISTORY) -> None:
+    """Appends records to the history.
+
+    Args:
+        records (list[dict[str, Any]]): records from `record`
+        path (str): database file
+    """
+
+    names = ", ".join(f'"{name}"' for name in COLUMNS)
+    marks = ", ".join("?" for _ in COLUMNS)
+    rows = [
+        tuple(
+            str(r[name]) if name == "answer" and r[name] is not None else r[name]
+            for name in COLUMNS
+        )
+        for r in records
+    ]
+
+    with contextlib.closing(connect(path)) as connection, connection:
+        connection.executemany(f"INSERT INTO runs ({names}) VALUES ({marks})", rows)
+
+
+def trend(
+    path: str = HISTORY,
+    days: list[int] | None = None,
+    parts: list[int] | None = None,
+    limit: int = 20,
+) -> list[tuple[Any, ...]]:
+    """Summarizes the history per commit and machine, most recent first. Solves that
+    went over budget are left out, their times are only the cutoff.
+
+    Args:
+        path (str): database file
+        days (list[int] | None): days to keep, all when empty
+        parts (list[int] | None): parts to keep, all when empty
+        limit (int): rows to return
+
+    Returns:
+        list[tuple[Any, ...]]: `(commit, machine, day, part, engine, runs,
+            best_seconds, mean_seconds, max_peak_rss)` rows
+    """
+
+    where, params = ["COALESCE(status, 'ok') = 'ok'"], []
+    for name, values in (("day", days), ("part", parts)):
+        if values:
+            where.append(f"{name} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+
+    query = f"""
+        SELECT "commit", machine, day, part, engine, COUNT(*), MIN(seconds),
+            AVG(seconds), MAX(peak_rss)
+        FROM runs
+        WHERE {" AND ".join(where)}
+        GROUP BY "commit", machine, day, part, engine
+        ORDER BY MAX(timestamp) DESC, day, part
+        LIMIT ?
+    """
+
+    with contextlib.closing(connect(path)) as connection:
+        return connection.execute(query, [*params, limit]).fetchall()
+
+
+def write_jsonl(records: list[dict[str, Any]], f: IO[str]) -> None:
+    for r in records:
+        f.write(json.dumps(r) + "\n")
+    f.flush()
+
+
+def format_trend(row: tuple[Any, ...]) -> str:
+    commit, machine, day, part, engine, runs, best, mean, peak = row
+    memory = (
+        f"peak {peak / 1024 / 1024:.1f} MiB" if peak is not None else "peak unknown"
+    )
+    return (
+        f"{(commit or 'unknown')[:10]:<11}{machine:<24} day{day:02d} part{part} "
+        f"{engine:<10}{runs:>4} runs  best {best:.4f}s  mean {mean:.4f}s  {memory}"
+    )
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_store(tmp_path: Any) -> None:
+    import io
+    from aoc.runner import Result
+
+    path = str(tmp_path / "history.sqlite")
+    records = [
+        record(Result(1, 1, 11, 0.5, cpu_seconds=0.4, peak_rss=2048), "input.txt"),
+        record(Result(1, 1, 11, 0.25, cpu_seconds=0.2, peak_rss=1024), "input.txt"),
+        record(Result(1, 1, None, 9.0, status="over-time"), "input.txt"),
+    ]
+
+    f = io.StringIO()
+    write_jsonl(records, f)
+    assert json.loads(f.getvalue().splitlines()[0])["answer"] == 11
+
+    store(records, path)
+    (row,) = trend(path, days=[1])
+    assert row[2:] == (1, 1, "reference", 2, 0.25, 0.375, 2048)
+    assert trend(path, days=[2]) == []
+    assert format_trend(row[:-1] + (None,)).endswith("peak unknown")
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Show run history per commit and machine."
+    )
+    parser.add_argument("days", nargs="*", type=int, help="days to show (default: all)")
+    parser.add_argument(
+        "-p", "--part", dest="parts", type=int, action="append", choices=(1, 2)
+    )
+    parser.add_argument("--history", default=HISTORY, help="history database")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.history):
+        print(f"no history at {args.history}", file=sys.stderr)
+        return 1
+
+    for row in trend(args.history, args.days, args.parts, args.limit):
+        print(format_trend(row))
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
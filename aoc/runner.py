@@ -0,0 +1,1045 @@
+from __future__ import annotations
+import os
+import re
+import sys
+import glob
+import errno
+import json
+import time
+import argparse
+import importlib
+import importlib.util
+from aoc import cache, counters, engines, lazy, loader, memo
+from aoc.testing import parametrize
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(DIR)
+DAY_PATTERN = re.compile(r"^day(\d{2})$")
+PART_PATTERN = re.compile(r"^part(\d)\.py$")
+
+# Slowest parts on the real inputs, slowest first. The pool starts these first so the
+# total wall time is close to the slowest part instead of whatever runs last.
+HEAVY: list[tuple[int, int]] = [(9, 2), (7, 2), (6, 2)]
+
+# Outcome of a solve, see `run_budgeted`
+OK = "ok"
+OVER_TIME = "over-time"
+OVER_MEMORY = "over-memory"
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+class Puzzle(NamedTuple):
+    day: int
+    part: int
+    module: str
+
+
+class Options(NamedTuple):
+    data_file: str | None = None  # Input file to use instead of each day's input.txt
+    cache_dir: str | None = None  # Parsed input cache, None keeps it in memory only
+    mmap: bool = False  # Memory map inputs of parts that define `parse_buffer`
+    memo_dir: str | None = None  # Store of earlier answers, None always solves
+    engine: str = engines.REFERENCE  # Engine of parts that have it, see `aoc.engines`
+    verify: bool = False  # Check every answer against the reference engine
+    counters: bool = False  # Collect `aoc.counters` for every solve
+    timeout: float | None = None  # Wall clock budget of every solve, in seconds
+    max_memory: int | None = None  # Address space budget of every solve, in bytes
+
+
+class Result(NamedTuple):
+    day: int
+    part: int
+    answer: int | None  # None when the solve went over budget
+    seconds: float
+    shared: bool = False  # Solved together with the other part, seconds cover both
+    counters: dict[str, int] | None = None  # Set when `aoc.counters` is enabled
+    cpu_seconds: float = 0.0
+    peak_rss: int | None = None  # Peak RSS during the solve in bytes, see `_peak_rss`
+    input_bytes: int = 0
+    engine: str = engines.REFERENCE
+    status: str = OK
+
+
+def discover(root: str = ROOT) -> list[Puzzle]:
+    """Finds every `dayNN/partN.py` module under root.
+
+    Args:
+        root (str): directory containing the day folders
+
+    Returns:
+        list[Puzzle]: puzzles sorted by day and then part
+    """
+
+    puzzles: list[Puzzle] = []
+    for day_dir in os.listdir(root):
+        day_match = DAY_PATTERN.match(day_dir)
+        if not day_match or not os.path.isdir(os.path.join(root, day_dir)):
+            continue
+
+        for file in os.listdir(os.path.join(root, day_dir)):
+            part_match = PART_PATTERN.match(file)
+            if not part_match:
+                continue
+
+            day, part = int(day_match.group(1)), int(part_match.group(1))
+            puzzles.append(Puzzle(day, part, f"{day_dir}.{file[:-3]}"))
+
+    return sorted(puzzles)
+
+
+def select(
+    puzzles: list[Puzzle], days: list[int] | None, parts: list[int] | None
+) -> list[Puzzle]:
+    """Filters the puzzles down to the requested days and parts.
+    An empty or missing filter selects everything.
+
+    Args:
+        puzzles (list[Puzzle]): puzzles to filter
+        days (list[int] | None): days to keep
+        parts (list[int] | None): parts to keep
+
+    Returns:
+        list[Puzzle]: selected puzzles
+    """
+
+    return [
+        p
+        for p in puzzles
+        if (not days or p.day in days) and (not parts or p.part in parts)
+    ]
+
+
+def load(puzzle: Puzzle) -> ModuleType:
+    """Imports the module of a puzzle. Modules are imported once per process.
+
+    Args:
+        puzzle (Puzzle): puzzle to load
+
+    Returns:
+        ModuleType: module that defines `solve`
+    """
+    return importlib.import_module(puzzle.module)
+
+
+def _start() -> tuple[float, float, bool]:
+    """Starts measuring a solve, resetting the counters when they are enabled and the
+    peak RSS of the process where the system allows it.
+
+    Returns:
+        tuple[float, float, bool]: wall clock and CPU clock at the start, and whether
+            the peak RSS was reset
+    """
+
+    if counters.ENABLED:
+        counters.reset()
+
+    return time.perf_counter(), time.process_time(), _reset_peak_rss()
+
+
+def _usage(start: tuple[float, float, bool]) -> dict[str, Any]:
+    """Measures a solve started with `_start`.
+
+    Args:
+        start (tuple[float, float, bool]): values returned by `_start`
+
+    Returns:
+        dict[str, Any]: time, memory and counter fields of `Result`
+    """
+
+    return {
+        "seconds": time.perf_counter() - start[0],
+        "cpu_seconds": time.process_time() - start[1],
+        "peak_rss": _peak_rss() if start[2] else None,
+        "counters": counters.snapshot() if counters.ENABLED else None,
+    }
+
+
+def _reset_peak_rss() -> bool:
+    """Resets the peak RSS of this process, which only Linux allows. Without a reset
+    the peak covers everything the process did before, so it is not reported.
+
+    Returns:
+        bool: True if the peak was reset
+    """
+
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def _peak_rss() -> int | None:
+    """Peak RSS of this process since `_reset_peak_rss`.
+
+    Returns:
+        int | None: bytes, None if the peak cannot be read
+    """
+
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def run(
+    puzzle: Puzzle,
+    input_string: str,
+    cache_dir: str | None = None,
+    memo_dir: str | None = None,
+    engine: str = engines.REFERENCE,
+    verify: bool = False,
+) -> Result:
+    """Solves a single puzzle and times parsing and solving together. Parsed inputs
+    are shared through `aoc.cache`, so a second part skips parsing.
+
+    Args:
+        puzzle (Puzzle): puzzle to solve
+        input_string (str): contents of the input file
+        cache_dir (str | None): directory of the parsed input cache, None keeps parsed
+            inputs in memory only
+        memo_dir (str | None): directory of stored answers, see `aoc.memo`
+        engine (str): engine to solve with, parts without it use the reference
+        verify (bool): solve again with the reference, outside of the timing, and
+            never trust a stored answer
+
+    Raises:
+        RuntimeError: verify is on and the engine disagrees with the reference
+
+    Returns:
+        Result: answer and wall time in seconds
+    """
+
+    module = load(puzzle)
+    solve = engines.select_engine(module, engine, fallback=True)
+    if engine not in engines.engines(module):
+        engine = engines.REFERENCE
+
+    start = _start()
+    key = memo.memo_key(module, input_string, engine) if memo_dir else ""
+    answer = memo.get(key, memo_dir) if memo_dir and not verify else None
+    if answer is None:
+        # Engines with their own parse function skip the cache, which holds `parse`
+        engine_parse = engines.engine_parser(module, engine)
+        answer = solve(
+            engine_parse(input_string)
+            if engine_parse
+            else cache.load_parsed(module, input_string, cache_dir)
+        )
+        if memo_dir:
+            memo.put(key, answer, memo_dir)
+    usage = _usage(start)
+
+    if verify:
+        expected = module.solve_parsed(
+            cache.load_parsed(module, input_string, cache_dir)
+        )
+        if answer != expected:
+            raise RuntimeError(
+                f"{puzzle.module}: engine {engine} answered {answer}, "
+                f"{engines.REFERENCE} answered {expected}"
+            )
+
+    return Result(
+        puzzle.day,
+        puzzle.part,
+        answer,
+        input_bytes=len(input_string.encode()),
+        engine=engine,
+        **usage,
+    )
+
+
+def both_module(puzzle: Puzzle) -> str | None:
+    """Name of the day's `both` module, which solves both parts in one go.
+
+    Args:
+        puzzle (Puzzle): either part of the day
+
+    Returns:
+        str | None: module name, or None if the day has no `both.py`
+    """
+
+    name = f"{puzzle.module.rpartition('.')[0]}.both"
+    return name if importlib.util.find_spec(name) is not None else None
+
+
+def group(puzzles: list[Puzzle]) -> list[list[Puzzle]]:
+    """Splits puzzles into units of work. Both parts of a day that has a `both` module
+    go together when they are next to each other, every other part runs alone.
+
+    Args:
+        puzzles (list[Puzzle]): puzzles to split
+
+    Returns:
+        list[list[Puzzle]]: units in the same order as puzzles
+    """
+
+    units: list[list[Puzzle]] = []
+    for puzzle in puzzles:
+        previous = units[-1] if units else []
+        if (
+            len(previous) == 1
+            and (previous[0].day, previous[0].part, puzzle.part) == (puzzle.day, 1, 2)
+            and both_module(puzzle) is not None
+        ):
+            previous.append(puzzle)
+        else:
+            units.append([puzzle])
+
+    return units
+
+
+def run_both(
+    puzzles: list[Puzzle], input_string: str, cache_dir: str | None = None
+) -> list[Result]:
+    """Solves both parts of a day with its `both` module, which does the work the parts
+    have in common once.
+
+    Args:
+        puzzles (list[Puzzle]): part 1 and part 2 of the same day
+        input_string (str): contents of the input file
+        cache_dir (str | None): directory of the parsed input cache, None keeps parsed
+            inputs in memory only
+
+    Returns:
+        list[Result]: results of both parts, each timed with the shared run
+    """
+
+    module = importlib.import_module(both_module(puzzles[0]) or "")
+
+    start = _start()
+    answers = module.solve_both_parsed(
+        cache.load_parsed(module, input_string, cache_dir)
+    )
+    usage = _usage(start)
+    input_bytes = len(input_string.encode())
+
+    # Counters also cover both parts, so they are only reported once
+    return [
+        Result(
+            puzzles[0].day,
+            1,
+            answers[0],
+            shared=True,
+            input_bytes=input_bytes,
+            **{**usage, "counters": None},
+        ),
+        Result(
+            puzzles[1].day, 2, answers[1], shared=True, input_bytes=input_bytes, **usage
+        ),
+    ]
+
+
+def run_mapped(puzzle: Puzzle, path: str) -> Result:
+    """Solves a single puzzle straight from a memory mapped input file, using the
+    part's `parse_buffer` instead of decoding the file into a `str`.
+
+    Args:
+        puzzle (Puzzle): puzzle to solve, its module must define `parse_buffer`
+        path (str): input file
+
+    Returns:
+        Result: answer and wall time in seconds, including the mapping
+    """
+
+    module = load(puzzle)
+
+    start = _start()
+    with loader.mapped(path) as buffer:
+        answer = module.solve_parsed(module.parse_buffer(buffer))
+        input_bytes = buffer.nbytes
+    usage = _usage(start)
+
+    return Result(puzzle.day, puzzle.part, answer, input_bytes=input_bytes, **usage)
+
+
+def run_budgeted(unit: list[Puzzle], options: Options) -> list[Result]:
+    """Solves a unit of puzzles in a child process that is stopped once it goes over
+    the time budget. The memory budget caps the child's address space, so a solve that
+    goes over it fails to allocate instead of taking the machine down.
+
+    Args:
+        unit (list[Puzzle]): puzzles solved together, see `_units`
+        options (Options): how to solve them, with the budgets
+
+    Raises:
+        Exception: whatever the solve raised, other than running out of memory
+        RuntimeError: the child died without an answer and without a memory budget
+
+    Returns:
+        list[Result]: results of the unit, or over budget results without answers
+    """
+
+    import multiprocessing
+
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_solve_within,
+        args=(sender, unit, options._replace(timeout=None, max_memory=None)),
+        kwargs={"max_memory": options.max_memory},
+    )
+
+    start = time.perf_counter()
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(options.timeout):
+            status, value = receiver.recv()
+        else:
+            status, value = OVER_TIME, None
+    except EOFError:
+        status, value = OVER_MEMORY, None
+    finally:
+        if process.is_alive():
+            process.terminate()
+            process.join(1)
+            if process.is_alive():
+                process.kill()
+        process.join()
+        receiver.close()
+    seconds = time.perf_counter() - start
+
+    if status == OK:
+        return value
+    if isinstance(value, Exception):
+        raise value
+
+    # Without a memory budget, a child that dies silently was killed by something else
+    if status == OVER_MEMORY and options.max_memory is None:
+        raise RuntimeError(
+            f"{unit[0].module} exited with code {process.exitcode} without an answer"
+        )
+
+    return [
+        Result(puzzle.day, puzzle.part, None, seconds, status=status) for puzzle in unit
+    ]
+
+
+def _solve_within(
+    connection: Any, unit: list[Puzzle], options: Options, max_memory: int | None
+) -> None:
+    try:
+        # Parts, the libraries they import lazily and the input are loaded before the
+        # address space is capped, so a missing file is reported as such and only the
+        # solve itself can run out of memory
+        inputs: dict[str, str] = {}
+        for puzzle in unit:
+            module = load(puzzle)
+            path = options.data_file or module.INPUT_TXT
+            if not _mapped(module, options) and path not in inputs:
+                with open(path) as f:
+                    inputs[path] = f.read()
+        lazy.load_pending()
+
+        if max_memory is not None:
+            import resource
+
+            resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+        reply: tuple[str, Any] = (OK, _run_unit(unit, options, inputs))
+    except MemoryError:
+        reply = (OVER_MEMORY, None)
+    except Exception as e:
+        # Mapping memory past the cap fails with ENOMEM
+        if isinstance(e, OSError) and e.errno == errno.ENOMEM:
+            reply = (OVER_MEMORY, None)
+        else:
+            reply = ("error", e)
+
+    connection.send(reply)
+    connection.close()
+
+
+def run_all(
+    puzzles: list[Puzzle],
+    options: Options = Options(),
+    inputs: dict[str, str] | None = None,
+) -> Iterator[Result]:
+    """Solves puzzles one after another in this process, yielding as they finish.
+    Both parts of a day are solved together when the day has a `both` module, unless
+    answers are stored per part (`memo_dir`) or inputs are memory mapped. With a budget
+    every unit is solved in its own child process, see `run_budgeted`.
+
+    Args:
+        puzzles (list[Puzzle]): puzzles to solve
+        options (Options): where inputs come from and how they are parsed
+        inputs (dict[str, str] | None): input texts already read, by path
+
+    Yields:
+        Result: results in the same order as puzzles
+    """
+
+    if options.counters:
+        counters.enable()
+
+    inputs = {} if inputs is None else inputs
+    for unit in _units(puzzles, options):
+        if options.timeout is not None or options.max_memory is not None:
+            yield from run_budgeted(unit, options)
+            continue
+
+        puzzle = unit[0]
+        module = load(puzzle)
+        path = options.data_file or module.INPUT_TXT
+
+        if _mapped(module, options):
+            yield run_mapped(puzzle, path)
+            continue
+
+        if path not in inputs:
+            with open(path) as f:
+                inputs[path] = f.read()
+
+        if len(unit) == 2:
+            yield from run_both(unit, inputs[path], options.cache_dir)
+        else:
+            yield run(
+                puzzle,
+                inputs[path],
+                options.cache_dir,
+                options.memo_dir,
+                options.engine,
+                options.verify,
+            )
+
+
+def _mapped(module: ModuleType, options: Options) -> bool:
+
+    # A stored answer needs the input text to look it up, and mapped inputs are only
+    # solved by the reference, so stored answers, another engine of the part and
+    # verifying all win over mmap
+    other_engine = options.engine != engines.REFERENCE and options.engine in (
+        engines.engines(module)
+    )
+    return (
+        options.mmap
+        and hasattr(module, "parse_buffer")
+        and not (options.memo_dir or other_engine or options.verify)
+    )
+
+
+def _units(puzzles: list[Puzzle], options: Options) -> list[list[Puzzle]]:
+
+    # Stored answers are kept per part, `both` modules do not read mapped inputs and
+    # only have the reference engine
+    if (
+        options.memo_dir is None
+        and not options.mmap
+        and options.engine == engines.REFERENCE
+        and not options.verify
+    ):
+        return group(puzzles)
+
+    return [[puzzle] for puzzle in puzzles]
+
+
+def _run_unit(
+    unit: list[Puzzle], options: Options, inputs: dict[str, str] | None = None
+) -> list[Result]:
+    return list(run_all(unit, options, inputs))
+
+
+def schedule(puzzles: list[Puzzle]) -> list[Puzzle]:
+    """Orders puzzles so the known heavy parts are submitted first.
+
+    Args:
+        puzzles (list[Puzzle]): puzzles to order
+
+    Returns:
+        list[Puzzle]: heavy parts first, then the rest in their original order
+    """
+
+    def weight(puzzle: Puzzle) -> int:
+        key = (puzzle.day, puzzle.part)
+        return HEAVY.index(key) if key in HEAVY else len(HEAVY)
+
+    return sorted(puzzles, key=weight)
+
+
+def run_parallel(
+    puzzles: list[Puzzle],
+    options: Options = Options(),
+    jobs: int | None = None,
+) -> Iterator[Result]:
+    """Solves puzzles on a pool of processes. Heavy parts are submitted first, but
+    results are still yielded in the same order as puzzles. Parts that run together
+    in `run_all` are one job.
+
+    Args:
+        puzzles (list[Puzzle]): puzzles to solve
+        options (Options): where inputs come from and how they are parsed
+        jobs (int | None): number of processes, defaults to the number of cores
+
+    Yields:
+        Result: results in the same order as puzzles
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    units = _units(puzzles, options)
+    order = schedule(puzzles)
+
+    def weight(i: int) -> int:
+        return min(order.index(puzzle) for puzzle in units[i])
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        futures: dict[int, Future[list[Result]]] = {
+            i: executor.submit(_run_unit, units[i], options)
+            for i in sorted(range(len(units)), key=weight)
+        }
+
+        for i in range(len(units)):
+            yield from futures[i].result()
+
+
+def expand(patterns: list[str]) -> list[str]:
+    """Expands glob patterns into input files. Patterns without wildcards are kept as
+    they are, so a missing file is reported when it is opened.
+
+    Args:
+        patterns (list[str]): file names or glob patterns
+
+    Returns:
+        list[str]: files in the order given, each pattern's matches sorted
+    """
+
+    paths: list[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(path for path in matches if path not in paths)
+
+    return paths
+
+
+def run_batch(
+    puzzles: list[Puzzle],
+    paths: list[str],
+    options: Options = Options(),
+    jobs: int | None = None,
+) -> Iterator[tuple[str, Result | Exception]]:
+    """Solves every puzzle on every input file on a pool of processes, so a batch of
+    files pays for one interpreter start per worker instead of one per file. A file
+    that fails to solve does not stop the rest of the batch. Batch inputs are usually
+    seen once, so they are never written to the parsed input cache on disk.
+
+    Args:
+        puzzles (list[Puzzle]): puzzles to solve
+        paths (list[str]): input files
+        options (Options): how inputs are parsed, `data_file` and `cache_dir` are
+            ignored
+        jobs (int | None): number of processes, defaults to the number of cores
+
+    Yields:
+        tuple[str, Result | Exception]: input file and result, or the error raised
+            while solving it, file by file in the order given
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        units = _units(puzzles, options)
+        futures = [
+            (
+                path,
+                unit,
+                executor.submit(
+                    _run_unit, unit, options._replace(data_file=path, cache_dir=None)
+                ),
+            )
+            for path in paths
+            for unit in units
+        ]
+
+        for path, unit, future in futures:
+            try:
+                results: list[Result | Exception] = list(future.result())
+            except Exception as e:
+                results = [e] * len(unit)
+
+            for result in results:
+                yield path, result
+
+
+def format_throughput(files: int, size: int, seconds: float) -> str:
+    mb = size / 1_000_000
+    return (
+        f"{files} inputs, {mb:.2f} MB in {seconds:.3f}s: "
+        f"{files / seconds:.1f} inputs/s, {mb / seconds:.2f} MB/s"
+    )
+
+
+def format_counters(result: Result, as_json: bool = False) -> str:
+    if as_json:
+        return json.dumps(
+            {"day": result.day, "part": result.part, "counters": result.counters}
+        )
+    return counters.format_counters(result.counters or {})
+
+
+def format_result(result: Result) -> str:
+    if result.status != OK:
+        return (
+            f"day{result.day:02d} part{result.part}: "
+            f"over budget, {result.status} after {result.seconds:.3f}s"
+        )
+
+    shared = ", both parts" if result.shared else ""
+    return (
+        f"day{result.day:02d} part{result.part}: "
+        f"{result.answer} ({result.seconds:.3f}s{shared})"
+    )
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_discover() -> None:
+    puzzles = discover()
+    assert Puzzle(1, 1, "day01.part1") in puzzles
+    assert Puzzle(12, 1, "day12.part1") in puzzles
+    assert puzzles == sorted(puzzles)
+
+
+@parametrize(
+    ("days", "parts", "expected"),
+    (
+        ([1], [2], [Puzzle(1, 2, "day01.part2")]),
+        ([1, 2], [1], [Puzzle(1, 1, "day01.part1"), Puzzle(2, 1, "day02.part1")]),
+    ),
+)
+def test_select(days: list[int], parts: list[int], expected: list[Puzzle]) -> None:
+    assert select(discover(), days, parts) == expected
+
+
+def test_schedule() -> None:
+    puzzles = select(discover(), [1, 6, 9], None)
+    assert schedule(puzzles)[:2] == [
+        Puzzle(9, 2, "day09.part2"),
+        Puzzle(6, 2, "day06.part2"),
+    ]
+
+
+def test_group() -> None:
+    puzzles = select(discover(), [1, 10], None)
+    assert [len(unit) for unit in group(puzzles)] == [1, 1, 2]
+    assert group(puzzles[:1] + puzzles[3:]) == [[puzzles[0]], [puzzles[3]]]
+
+    results = list(run_all(puzzles[2:]))
+    assert [(r.part, r.shared) for r in results] == [(1, True), (2, True)]
+
+
+def test_run_parallel() -> None:
+    puzzles = select(discover(), [1, 2], None)
+    expected = [result.answer for result in run_all(puzzles)]
+    assert [result.answer for result in run_parallel(puzzles, jobs=2)] == expected
+
+
+def test_run_batch(tmp_path: Any) -> None:
+    import day01.part1 as module
+
+    for name, text in (("a.txt", module.INPUT_S), ("b.txt", "not an input\n")):
+        (tmp_path / name).write_text(text)
+
+    paths = expand([str(tmp_path / "*.txt")])
+    assert [os.path.basename(path) for path in paths] == ["a.txt", "b.txt"]
+
+    puzzles = [Puzzle(1, 1, "day01.part1")]
+    (_, result), (_, error) = run_batch(puzzles, paths, jobs=2)
+    assert isinstance(result, Result) and result.answer == module.EXPECTED
+    assert isinstance(error, ValueError)
+
+
+def test_run_mapped(tmp_path: Any) -> None:
+    import day04.part2 as module
+
+    path = tmp_path / "input.txt"
+    path.write_text(module.INPUT_S)
+
+    result = run_mapped(Puzzle(4, 2, "day04.part2"), str(path))
+    assert result.answer == module.EXPECTED
+
+    # Another engine of the part reads the text instead of solving with the reference
+    import day09.part2 as other
+
+    path.write_text(other.INPUT_S)
+    options = Options(str(path), mmap=True, engine="heaps", verify=True)
+    (result,) = run_all([Puzzle(9, 2, "day09.part2")], options)
+    assert (result.answer, result.engine) == (other.EXPECTED, "heaps")
+
+
+def test_run() -> None:
+    puzzle = Puzzle(1, 1, "day01.part1")
+    module = load(puzzle)
+    result = run(puzzle, module.INPUT_S)
+    assert (result.day, result.part, result.answer) == (1, 1, module.EXPECTED)
+
+
+def test_peak_rss() -> None:
+    import pytest
+
+    if not _reset_peak_rss():
+        pytest.skip("the peak RSS cannot be reset here")
+
+    # A large allocation in an earlier solve does not count towards the next one
+    start = _start()
+    peak = bytearray(256 * 1024 * 1024)
+    before = _usage(start)["peak_rss"]
+    del peak
+    after = _usage(_start())["peak_rss"]
+    assert before - after > 128 * 1024 * 1024
+
+
+def test_run_engine() -> None:
+    puzzle = Puzzle(9, 2, "day09.part2")
+    module = load(puzzle)
+
+    result = run(puzzle, module.INPUT_S, engine="heaps", verify=True)
+    assert result.answer == module.EXPECTED
+
+    # Parts without the engine fall back to the reference
+    import day01.part1 as other
+
+    result = run(Puzzle(1, 1, "day01.part1"), other.INPUT_S, engine="heaps")
+    assert result.answer == other.EXPECTED
+
+    # and engines with their own parse function get their input in its shape
+    result = run(
+        Puzzle(1, 1, "day01.part1"), other.INPUT_S, engine="numpy", verify=True
+    )
+    assert result.answer == other.EXPECTED
+
+
+def test_run_counters() -> None:
+    puzzle = Puzzle(7, 1, "day07.part1")
+    module = load(puzzle)
+
+    counters.enable()
+    try:
+        result = run(puzzle, module.INPUT_S)
+    finally:
+        counters.enable(False)
+
+    assert (
+        result.counters and result.counters["day07.part1._can_make_valid_helper.misses"]
+    )
+    assert run(puzzle, module.INPUT_S).counters is None
+
+
+def test_run_budgeted(tmp_path: Any) -> None:
+    import pytest
+    from aoc.generate import generate
+
+    puzzles = select(discover(), [6], [2])
+    (result,) = run_all(puzzles, Options(cache_dir=None, timeout=0.1))
+    assert (result.answer, result.status) == (None, OVER_TIME)
+    assert result.seconds < 5
+
+    puzzles = select(discover(), [1], None)
+    results = list(run_all(puzzles, Options(timeout=60, max_memory=1 << 40)))
+    assert [r.answer for r in results] == [r.answer for r in run_all(puzzles)]
+    assert all(r.status == OK for r in results)
+
+    # Running out of memory in one unit does not stop the others
+    path = tmp_path / "input.txt"
+    path.write_text(generate(1, 1000000))
+    options = Options(str(path), cache_dir=None, max_memory=1 << 20)
+    results = list(run_all(select(discover(), [1, 2], [1]), options))
+    assert [(r.day, r.status) for r in results] == [
+        (1, OVER_MEMORY),
+        (2, OVER_MEMORY),
+    ]
+
+    # but a missing input is still an error
+    options = options._replace(data_file=str(tmp_path / "missing.txt"))
+    with pytest.raises(FileNotFoundError):
+        list(run_all(select(discover(), [1], [1]), options))
+
+
+def test_run_memo(tmp_path: Any) -> None:
+    puzzle = Puzzle(1, 2, "day01.part2")
+    module = load(puzzle)
+
+    memo.put(memo.memo_key(module, module.INPUT_S), -1, str(tmp_path))
+    assert run(puzzle, module.INPUT_S, memo_dir=str(tmp_path)).answer == -1
+
+    # Another engine does not read the reference's answer
+    result = run(puzzle, module.INPUT_S, memo_dir=str(tmp_path), engine="numpy")
+    assert (result.answer, result.engine) == (module.EXPECTED, "numpy")
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    from aoc import report
+
+    parser = argparse.ArgumentParser(
+        description="Solve many puzzles in a single process."
+    )
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument(
+        "-p", "--part", dest="parts", type=int, action="append", choices=(1, 2)
+    )
+    inputs = parser.add_mutually_exclusive_group()
+    inputs.add_argument("--input", dest="data_file", help="input file for every day")
+    inputs.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="FILE",
+        help="input files or globs, each solved by every selected part on a pool",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache_dir",
+        action="store_const",
+        const=None,
+        default=cache.CACHE_DIR,
+        help="do not read or write the parsed input cache",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        help="solve on a pool of processes (default size: number of cores)",
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="memory map inputs of parts that can parse straight from bytes",
+    )
+    parser.add_argument(
+        "--memo",
+        dest="memo_dir",
+        action="store_const",
+        const=memo.MEMO_DIR,
+        help="reuse answers of unchanged parts on unchanged inputs",
+    )
+    parser.add_argument(
+        "--engine",
+        default=engines.REFERENCE,
+        help="engine of the parts that have it, the others use the reference",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="check every answer against the reference engine",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="stop a solve that runs longer and report it as over budget",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=float,
+        metavar="MB",
+        help="address space limit of every solve, beyond it the solve is over budget",
+    )
+    parser.add_argument(
+        "--counters",
+        nargs="?",
+        const="text",
+        choices=("text", "json"),
+        help="print hot loop counters and cache statistics after each solve",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        help="write a JSON line per solve, - for stdout instead of the result lines",
+    )
+    parser.add_argument(
+        "--history",
+        nargs="?",
+        const="",
+        metavar="DB",
+        help=f"append every solve to the SQLite run history (default: {report.HISTORY})",
+    )
+    args = parser.parse_args()
+
+    puzzles = select(discover(), args.days, args.parts)
+    if not puzzles:
+        parser.error("no puzzles match the requested days and parts")
+
+    options = Options(
+        args.data_file,
+        args.cache_dir,
+        args.mmap,
+        args.memo_dir,
+        args.engine,
+        args.verify,
+        args.counters is not None,
+        args.timeout,
+        int(args.max_memory * 1024 * 1024) if args.max_memory else None,
+    )
+
+    # With the report on stdout, the human readable lines move to stderr
+    out = sys.stderr if args.report == "-" else sys.stdout
+    records: list[dict[str, Any]] = []
+    status = 0
+    sink = None
+    if args.report:
+        sink = sys.stdout if args.report == "-" else open(args.report, "w")
+
+    def emit(result: Result, path: str, prefix: str = "") -> None:
+        nonlocal status
+        if result.status != OK:
+            status = 1
+
+        print(f"{prefix}{format_result(result)}", file=out, flush=True)
+        if result.counters:
+            print(format_counters(result, args.counters == "json"), file=out)
+
+        if sink is not None or args.history is not None:
+
+            records.append(report.record(result, path))
+            if sink is not None:
+                report.write_jsonl(records[-1:], sink)
+
+    start = time.perf_counter()
+    if args.batch:
+        paths = expand(args.batch)
+        for path, result in run_batch(puzzles, paths, options, args.jobs):
+            if isinstance(result, Exception):
+                print(f"{path}: {type(result).__name__}: {result}", file=out)
+                status = 1
+            else:
+                emit(result, path, f"{path}: ")
+
+        size = sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+        summary = format_throughput(len(paths), size, time.perf_counter() - start)
+    else:
+        if args.jobs is None:
+            results = run_all(puzzles, options)
+        else:
+            results = run_parallel(puzzles, options, args.jobs)
+
+        for puzzle, result in zip(puzzles, results):
+            emit(result, args.data_file or load(puzzle).INPUT_TXT)
+
+        summary = f"total: {time.perf_counter() - start:.3f}s"
+
+    print(summary, file=out)
+
+    if sink is not None and sink is not sys.stdout:
+        sink.close()
+
+    if args.history is not None:
+
+        report.store(records, args.history or report.HISTORY)
+
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
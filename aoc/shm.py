@@ -0,0 +1,160 @@
+from __future__ import annotations
+import contextlib
+from typing import TYPE_CHECKING, Iterator, NamedTuple
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+    from multiprocessing.shared_memory import SharedMemory
+else:
+    np = lazy_import("numpy")
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+# The parent copies an array into shared memory once and hands workers a `Handle`, which
+# pickles to a few bytes. Workers attach with `attach` and get a NumPy view over the
+# same pages, so nothing is copied per worker or per task.
+class Handle(NamedTuple):
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+# Segments attached by this process, kept open for as long as the process lives
+_attached: dict[str, SharedMemory] = {}
+
+
+@contextlib.contextmanager
+def shared(array: np.ndarray) -> Iterator[Handle]:
+    """Copies an array into a new shared memory segment, which is removed on exit.
+
+    Args:
+        array (np.ndarray): array to share
+
+    Yields:
+        Handle: handle to pass to workers
+    """
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    segment = SharedMemory(create=True, size=max(1, array.nbytes))
+    try:
+        view: np.ndarray = np.ndarray(array.shape, array.dtype, buffer=segment.buf)
+        view[...] = array
+        del view
+
+        yield Handle(segment.name, array.shape, array.dtype.str)
+    finally:
+        _attached.pop(segment.name, None)
+        segment.close()
+        segment.unlink()
+
+
+def attach(handle: Handle) -> np.ndarray:
+    """Returns a read only view over a shared array. Attaching is done once per
+    process, later calls with the same handle reuse the segment.
+
+    Args:
+        handle (Handle): handle from `shared`
+
+    Returns:
+        np.ndarray: view over the shared memory
+    """
+
+    if handle.name not in _attached:
+        from multiprocessing.shared_memory import SharedMemory
+
+        # Workers share the resource tracker of the parent, so the segment is only
+        # removed when the parent leaves `shared`
+        _attached[handle.name] = SharedMemory(name=handle.name)
+
+    view: np.ndarray = np.ndarray(
+        handle.shape, np.dtype(handle.dtype), buffer=_attached[handle.name].buf
+    )
+    view.flags.writeable = False
+    return view
+
+
+RowsHandle = tuple[Handle, Handle]
+
+
+@contextlib.contextmanager
+def shared_rows(rows: list[list[int]]) -> Iterator[RowsHandle]:
+    """Shares rows of integers of different lengths as one flat array of values and
+    one array of offsets into it.
+
+    Args:
+        rows (list[list[int]]): rows to share, every value must fit in 64 bits
+
+    Yields:
+        RowsHandle: handles to pass to `attach_rows`
+    """
+
+    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.fromiter(
+        (v for row in rows for v in row), dtype=np.int64, count=int(offsets[-1])
+    )
+
+    with shared(values) as values_handle, shared(offsets) as offsets_handle:
+        yield values_handle, offsets_handle
+
+
+def attach_rows(handles: RowsHandle, start: int, stop: int) -> list[list[int]]:
+    """Returns rows `start` to `stop` of rows shared with `shared_rows`.
+
+    Args:
+        handles (RowsHandle): handles from `shared_rows`
+        start (int): first row
+        stop (int): row after the last one
+
+    Returns:
+        list[list[int]]: the rows, as Python integers
+    """
+
+    values, offsets = attach(handles[0]), attach(handles[1])
+    bounds = offsets[start : stop + 1].tolist()
+    return [values[a:b].tolist() for a, b in zip(bounds, bounds[1:])]
+
+
+def chunks(n: int, parts: int) -> list[tuple[int, int]]:
+    """Splits `range(n)` into at most parts contiguous `(start, stop)` ranges of
+    nearly equal size.
+
+    Args:
+        n (int): number of items
+        parts (int): number of ranges
+
+    Returns:
+        list[tuple[int, int]]: non empty ranges in order
+    """
+
+    parts = max(1, min(parts, n))
+    bounds = [n * i // parts for i in range(parts + 1)]
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def _total(handle: Handle, start: int, stop: int) -> int:
+    return int(attach(handle)[start:stop].sum())
+
+
+def test_shared() -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    array = np.arange(1000, dtype=np.int64)
+    with shared(array) as handle, ProcessPoolExecutor(2) as executor:
+        ranges = chunks(len(array), 7)
+        totals = executor.map(
+            _total, [handle] * len(ranges), *zip(*ranges)  # type: ignore
+        )
+        assert sum(totals) == int(array.sum())
+
+    rows = [[190, 10, 19], [], [3267, 81, 40, 27]]
+    with shared_rows(rows) as handles:
+        assert attach_rows(handles, 0, 3) == rows
+        assert attach_rows(handles, 2, 3) == rows[2:]
+
+    assert chunks(5, 3) == [(0, 1), (1, 3), (3, 5)]
+    assert chunks(2, 8) == [(0, 1), (1, 2)]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+import os
+import re
+import sys
+import argparse
+import subprocess
+from typing import NamedTuple
+
+from aoc.runner import discover
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(DIR)
+IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+# Modules that must never be loaded just to solve a puzzle
+HEAVY = ("pytest", "numpy")
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def production_modules() -> list[str]:
+    return ["aoc.runner", *(puzzle.module for puzzle in discover())]
+
+
+def import_times(modules: list[str]) -> list[ImportTime]:
+    """Imports modules in a fresh interpreter with `-X importtime` and collects the
+    time spent on every module that got imported along the way.
+
+    Args:
+        modules (list[str]): modules to import
+
+    Returns:
+        list[ImportTime]: one entry per imported module, in import order
+    """
+
+    code = "; ".join(f"import {module}" for module in modules)
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    ).stderr
+
+    times: list[ImportTime] = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            times.append(
+                ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+
+    return times
+
+
+def total_us(times: list[ImportTime]) -> int:
+    return sum(t.cumulative_us for t in times if t.depth == 0)
+
+
+def heavy_imports(times: list[ImportTime]) -> list[str]:
+    return [t.module for t in times if t.module.split(".")[0] in HEAVY]
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_production_startup_is_light() -> None:
+    assert heavy_imports(import_times(production_modules())) == []
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Report the import time of the production entry path."
+    )
+    parser.add_argument(
+        "modules", nargs="*", help="modules to import (default: runner and solutions)"
+    )
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to show")
+    parser.add_argument(
+        "--budget-ms", type=float, help="fail when the total import time is higher"
+    )
+    args = parser.parse_args()
+
+    times = import_times(args.modules or production_modules())
+    for t in sorted(times, key=lambda t: t.self_us, reverse=True)[: args.top]:
+        print(
+            f"{t.self_us / 1000:>8.2f}ms  {t.cumulative_us / 1000:>8.2f}ms  {t.module}"
+        )
+
+    total_ms = total_us(times) / 1000
+    print(f"total: {total_ms:.2f}ms over {len(times)} modules")
+
+    status = 0
+    heavy = heavy_imports(times)
+    if heavy:
+        print(f"heavy imports on the startup path: {', '.join(heavy[:5])}")
+        status = 1
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"over budget: {total_ms:.2f}ms > {args.budget_ms:.2f}ms")
+        status = 1
+
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,30 @@
+from __future__ import annotations
+import sys
+from typing import Any, Callable, Iterable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+def parametrize(argnames: str | tuple[str, ...], argvalues: Iterable[Any]) -> Any:
+    """Stands in for `pytest.mark.parametrize` so solutions can define their test cases
+    without importing pytest. Under pytest the real marker is applied. Anywhere else
+    pytest is not loaded and the test function is returned unchanged.
+
+    Args:
+        argnames (str | tuple[str, ...]): names of the test arguments
+        argvalues (Iterable[Any]): values of each test case
+
+    Returns:
+        Any: decorator for the test function
+    """
+
+    if "pytest" in sys.modules:
+        import pytest
+
+        return pytest.mark.parametrize(argnames, argvalues)
+
+    def decorator(func: F) -> F:
+        return func
+
+    return decorator
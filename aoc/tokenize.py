@@ -0,0 +1,168 @@
+from __future__ import annotations
+import itertools
+from typing import TYPE_CHECKING, Any, NamedTuple
+from aoc.lazy import lazy_import
+from aoc.testing import parametrize
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import("numpy")
+
+# CONSTANTS ----------------------------------------------------------------------------
+MAX_DIGITS = 18  # Longest integer that always fits in an int64
+CHUNK = 64  # Lines converted to Python integers at a time
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+class Tokens(NamedTuple):
+    values: np.ndarray  # Every integer of the input in order, as int64
+    offsets: np.ndarray  # Line i holds `values[offsets[i] : offsets[i + 1]]`
+
+
+def integers(data: Any, signed: bool = False) -> Tokens:
+    """Pulls every integer out of an input in one vectorized pass over its bytes.
+    Anything that is not a digit separates integers, and lines are split on `\\n` the
+    way `str.splitlines` does, so a final newline does not start an empty line.
+
+    Args:
+        data (Any): `str` or bytes like object
+        signed (bool): read a `-` right before a number as its sign
+
+    Raises:
+        ValueError: an integer has more than `MAX_DIGITS` digits
+
+    Returns:
+        Tokens: values and per line offsets
+    """
+
+    raw = data.encode() if isinstance(data, str) else data
+    buffer = np.frombuffer(raw, dtype=np.uint8)
+
+    # Digits switch on at the start of every number and off after its end, so with a
+    # non digit on both sides the switches alternate between starts and ends
+    digit = (buffer >= ord("0")) & (buffer <= ord("9"))
+    edges = np.flatnonzero(np.diff(digit, prepend=False, append=False))
+    del digit
+
+    # Positions fit in 32 bits for any input under 2 GiB, which halves the temporaries
+    position: type[np.integer[Any]] = np.int32 if len(buffer) < 2**31 else np.int64
+    starts = edges[::2].astype(position)
+    lengths = edges[1::2] - edges[::2]
+    del edges
+
+    longest = int(lengths.max()) if len(lengths) else 0
+    if longest > MAX_DIGITS:
+        raise ValueError(f"Integers are limited to {MAX_DIGITS} digits")
+    lengths = lengths.astype(np.int8)
+
+    # Numbers are built a digit at a time, which only needs arrays with one entry per
+    # number instead of one per digit
+    values = np.zeros(len(starts), dtype=np.int64)
+    last = np.int32(len(buffer) - 1)
+    for j in range(longest):
+        more = lengths > j
+        digits = buffer[np.minimum(starts + j, last)]
+        np.multiply(values, 10, out=values, where=more)
+        np.add(values, digits, out=values, where=more)
+        np.subtract(values, ord("0"), out=values, where=more)
+
+    if signed and len(starts):
+        negative = (starts > 0) & (buffer[np.maximum(starts - 1, 0)] == ord("-"))
+        values[negative] *= -1
+
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    n_lines = len(newlines) + (len(buffer) > 0 and buffer[-1] != ord("\n"))
+    counts = np.bincount(np.searchsorted(newlines, starts), minlength=n_lines)
+    offsets = np.zeros(n_lines + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    return Tokens(values, offsets)
+
+
+def rows(tokens: Tokens) -> list[list[int]]:
+    """Turns tokens into one list of Python integers per line.
+
+    Args:
+        tokens (Tokens): tokens from `integers`
+
+    Returns:
+        list[list[int]]: integers of each line, empty for lines without any
+    """
+
+    # Inputs with the same number of integers on every line skip the slicing
+    widths = np.diff(tokens.offsets)
+    if len(widths) and widths[0] and (widths == widths[0]).all():
+        return tokens.values.reshape(-1, int(widths[0])).tolist()
+
+    # Otherwise a chunk of lines at a time, so only one chunk of values is ever held
+    # twice, once as a flat list and once as rows
+    result: list[list[int]] = []
+    for first in range(0, len(widths), CHUNK):
+        offsets = tokens.offsets[first : first + CHUNK + 1].tolist()
+        base = offsets[0]
+        values = tokens.values[base : offsets[-1]].tolist()
+        result.extend(
+            values[start - base : stop - base]
+            for start, stop in zip(offsets, offsets[1:])
+        )
+
+    return result
+
+
+def columns(rows: list[list[int]], width: int) -> np.ndarray:
+    """Packs rows that all hold width integers into an int64 array, several times
+    faster than `np.array` on the nested lists.
+
+    Args:
+        rows (list[list[int]]): rows such as those from `rows`
+        width (int): integers per row
+
+    Returns:
+        np.ndarray: array of shape `(len(rows), width)`
+    """
+
+    flat = np.fromiter(
+        itertools.chain.from_iterable(rows), dtype=np.int64, count=len(rows) * width
+    )
+    return flat.reshape(-1, width)
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize(
+    ("input_s", "expected"),
+    (
+        ("3   4\n4   3\n", [[3, 4], [4, 3]]),
+        ("47|53\n\n75,47,61\n", [[47, 53], [], [75, 47, 61]]),
+        ("190: 10 19\r\n3267: 81 40 27", [[190, 10, 19], [3267, 81, 40, 27]]),
+        ("Button A: X+94, Y+34\n", [[94, 34]]),
+        (b"p=0,4 v=3,-3\n", [[0, 4, 3, 3]]),
+        ("", []),
+        ("\n", [[]]),
+    ),
+)
+def test_integers(input_s: Any, expected: list[list[int]]) -> None:
+    assert rows(integers(input_s)) == expected
+
+
+def test_chunks(monkeypatch: Any) -> None:
+    import sys
+
+    lines = [[i] * (i % 3) for i in range(10)]
+    text = "".join(" ".join(map(str, line)) + "\n" for line in lines)
+
+    monkeypatch.setattr(sys.modules[__name__], "CHUNK", 4)
+    assert rows(integers(text)) == lines
+
+
+def test_columns() -> None:
+    array = columns(rows(integers("3   4\n4   3\n")), 2)
+    assert array.shape == (2, 2) and array[:, 1].tolist() == [4, 3]
+
+
+def test_signed() -> None:
+    import pytest
+
+    assert rows(integers("p=0,4 v=3,-3\n-7", signed=True)) == [[0, 4, 3, -3], [-7]]
+    with pytest.raises(ValueError):
+        integers("1" * (MAX_DIGITS + 1))
@@ -0,0 +1,227 @@
+from __future__ import annotations
+import math
+import itertools
+from typing import Iterable, Iterator
+
+# CONSTANTS ----------------------------------------------------------------------------
+LEFT = 0
+RIGHT = 1
+
+# Location ids have five digits
+LOW = 0
+HIGH = 100_000
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+class Index:
+    """Both location lists of day 1 as a count per id over a bounded range of ids,
+    keeping the answers of both parts up to date as ids are added and removed.
+
+    The similarity score is `sum(id * left[id] * right[id])`, so an update changes it
+    by one term. The total distance between the sorted lists of equal length is the
+    sum over every id t of `|D(t)|`, where `D(t)` is the number of left ids minus the
+    number of right ids that are at most t. Adding or removing an id shifts `D` by one
+    from that id up, so `D` is split into blocks of about `sqrt(range)` ids, each with
+    a lazy offset for shifts that cover the whole block and a histogram of its values,
+    which gives the change of the block's sum in O(1). An update then costs
+    O(sqrt(range)) instead of a new sort.
+    """
+
+    def __init__(
+        self, pairs: Iterable[Iterable[int]] = (), low: int = LOW, high: int = HIGH
+    ):
+        self.low = low
+        self.size = high - low
+        self.block = max(1, math.isqrt(self.size))
+        self.counts: tuple[list[int], list[int]] = ([0] * self.size, [0] * self.size)
+        self.lengths = [0, 0]
+
+        for n1, n2 in pairs:
+            for side, value in ((LEFT, n1), (RIGHT, n2)):
+                i = self._position(value)
+                self.counts[side][i] += 1
+                self.lengths[side] += 1
+
+        self.similarity = sum(
+            (self.low + i) * n1 * n2
+            for i, (n1, n2) in enumerate(zip(*self.counts))
+            if n1 and n2
+        )
+        self._build()
+
+    def _build(self) -> None:
+        """Computes `D` and the state of every block from the counts."""
+
+        # Raw values of D, each block's lazy offset is added on top
+        self._raw = list(itertools.accumulate(n1 - n2 for n1, n2 in zip(*self.counts)))
+        self._lazy: list[int] = []
+        self._below: list[int] = []  # Values that are negative, offset included
+        self._histograms: list[dict[int, int]] = []
+        self._sizes: list[int] = []
+
+        for start in range(0, self.size, self.block):
+            values = self._raw[start : start + self.block]
+            histogram: dict[int, int] = {}
+            for x in values:
+                histogram[x] = histogram.get(x, 0) + 1
+
+            self._lazy.append(0)
+            self._below.append(sum(x < 0 for x in values))
+            self._histograms.append(histogram)
+            self._sizes.append(len(values))
+
+        self._distance = sum(map(abs, self._raw))
+
+    def _position(self, value: int) -> int:
+        i = value - self.low
+        if not 0 <= i < self.size:
+            raise ValueError(
+                f"Id {value} is outside of [{self.low}, {self.low + self.size})"
+            )
+        return i
+
+    @property
+    def distance(self) -> int:
+        """Total distance between the sorted lists, the part 1 answer.
+
+        Raises:
+            ValueError: the lists do not have the same length
+
+        Returns:
+            int: total distance
+        """
+
+        if self.lengths[LEFT] != self.lengths[RIGHT]:
+            raise ValueError(
+                f"Lists of {self.lengths[LEFT]} and {self.lengths[RIGHT]} ids "
+                "cannot be paired up"
+            )
+        return self._distance
+
+    def count(self, side: int, value: int) -> int:
+        return self.counts[side][self._position(value)]
+
+    def ids(self, side: int) -> Iterator[int]:
+        """Ids of one list in sorted order, repeated as often as they occur."""
+
+        for i, n in enumerate(self.counts[side]):
+            yield from itertools.repeat(self.low + i, n)
+
+    def add(self, side: int, value: int) -> None:
+        """Adds an id to one of the lists.
+
+        Args:
+            side (int): `LEFT` or `RIGHT`
+            value (int): id to add
+
+        Raises:
+            ValueError: the id is outside of the range of the index
+        """
+
+        i = self._position(value)
+        self.counts[side][i] += 1
+        self.lengths[side] += 1
+        self.similarity += value * self.counts[1 - side][i]
+        self._shift(i, 1 if side == LEFT else -1)
+
+    def remove(self, side: int, value: int) -> None:
+        """Removes one occurrence of an id from one of the lists.
+
+        Args:
+            side (int): `LEFT` or `RIGHT`
+            value (int): id to remove
+
+        Raises:
+            ValueError: the list does not hold the id
+        """
+
+        i = self._position(value)
+        if self.counts[side][i] == 0:
+            raise ValueError(f"Id {value} is not in the list")
+
+        self.counts[side][i] -= 1
+        self.lengths[side] -= 1
+        self.similarity -= value * self.counts[1 - side][i]
+        self._shift(i, -1 if side == LEFT else 1)
+
+    def _shift(self, start: int, delta: int) -> None:
+        """Adds delta, 1 or -1, to `D` from position start to the end of the range.
+
+        Args:
+            start (int): first position to shift
+            delta (int): 1 or -1
+        """
+
+        # The rest of the first block is shifted value by value
+        b = start // self.block
+        histogram, lazy = self._histograms[b], self._lazy[b]
+        for i in range(start, min((b + 1) * self.block, self.size)):
+            x = self._raw[i]
+            y = x + lazy
+            histogram[x] -= 1
+            histogram[x + delta] = histogram.get(x + delta, 0) + 1
+            self._raw[i] = x + delta
+
+            self._distance += abs(y + delta) - abs(y)
+            self._below[b] += (y + delta < 0) - (y < 0)
+
+        # Later blocks are shifted whole. Going up, the absolute value of every value
+        # that is not negative grows by one and that of every negative one shrinks,
+        # and values at -1 stop being negative. Going down, values at 0 or below grow,
+        # the others shrink, and values at 0 become negative.
+        for b in range(b + 1, len(self._lazy)):
+            lazy, below = self._lazy[b], self._below[b]
+            if delta > 0:
+                change = self._sizes[b] - 2 * below
+                self._below[b] = below - self._histograms[b].get(-1 - lazy, 0)
+            else:
+                zeros = self._histograms[b].get(-lazy, 0)
+                change = 2 * (below + zeros) - self._sizes[b]
+                self._below[b] = below + zeros
+
+            self._lazy[b] = lazy + delta
+            self._distance += change
+
+
+# TEST CASES ---------------------------------------------------------------------------
+def test_index() -> None:
+    import random
+    import pytest
+    from day01 import part1, part2
+
+    pairs = part1.parse(part1.INPUT_S)
+    index = Index(pairs, low=0, high=12)
+    assert (index.distance, index.similarity) == (part1.EXPECTED, part2.EXPECTED)
+
+    rng = random.Random(1)
+    lists: tuple[list[int], list[int]] = (
+        [n1 for n1, _ in pairs],
+        [n2 for _, n2 in pairs],
+    )
+    for _ in range(300):
+        side = rng.choice((LEFT, RIGHT))
+        if lists[side] and rng.random() < 0.45:
+            value = rng.choice(lists[side])
+            lists[side].remove(value)
+            index.remove(side, value)
+        else:
+            value = rng.randrange(12)
+            lists[side].append(value)
+            index.add(side, value)
+
+        expected = sum(v * lists[RIGHT].count(v) for v in lists[LEFT])
+        assert index.similarity == expected
+
+        if len(lists[LEFT]) == len(lists[RIGHT]):
+            assert index.distance == part1.solve_parsed(
+                [[n1, n2] for n1, n2 in zip(*lists)]
+            )
+        else:
+            with pytest.raises(ValueError):
+                index.distance
+
+    assert list(index.ids(RIGHT)) == sorted(lists[RIGHT])
+    with pytest.raises(ValueError):
+        index.add(LEFT, 12)
+    with pytest.raises(ValueError):
+        Index(low=0, high=4).remove(RIGHT, 3)
@@ -1,22 +1,54 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from typing import TYPE_CHECKING, Any, Iterable
+from aoc import cli, tokenize
+from aoc.lazy import lazy_import
+from aoc.testing import parametrize
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import("numpy")
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "rows"
+
+# Columns whose ids span at most this many times their length are counted into a dense
+# histogram instead of being sorted
+DENSE_FACTOR = 4
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
+
+
+def parse(input_string: str) -> list[list[int]]:
+    """Parses each line into its pair of location ids.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[list[int]]: one `[left, right]` pair per line
+    """
+    return tokenize.rows(tokenize.integers(input_string, signed=True))
+
+
+def parse_buffer(buffer: memoryview) -> list[list[int]]:
+    """Same as `parse`, but tokenizes a memory mapped input in place."""
+    return tokenize.rows(tokenize.integers(buffer, signed=True))
+
+
+def solve_parsed(pairs: list[list[int]]) -> int:
 
     l1, l2 = [], []
 
-    for line in input_string.splitlines():
-        n1, n2 = line.split()
-        l1.append(int(n1))
-        l2.append(int(n2))
+    for n1, n2 in pairs:
+        l1.append(n1)
+        l2.append(n2)
 
     l1.sort()
     l2.sort()
@@ -24,6 +56,121 @@ def solve(input_string: str) -> int:
     return sum([abs(i - j) for i, j in zip(l1, l2)])
 
 
+def _parse_numpy(data: Any) -> np.ndarray:
+    """Same as `parse`, but reshapes the integers straight into an array, without
+    going through Python lists.
+
+    Args:
+        data (Any): puzzle input, `str` or bytes like object
+
+    Returns:
+        np.ndarray: `(n, 2)` array of the `[left, right]` pair of each line
+    """
+    return tokenize.integers(data, signed=True).values.reshape(-1, 2)
+
+
+def _solve_numpy(columns: np.ndarray) -> int:
+    """Same as `solve_parsed`, with both columns sorted and subtracted as arrays.
+    Columns of bounded ids are sorted in linear time, see `_sort`.
+
+    Args:
+        columns (np.ndarray): `(n, 2)` array from `_parse_numpy`
+
+    Returns:
+        int: total distance between the lists
+    """
+
+    left, right = _sort(columns[:, 0]), _sort(columns[:, 1])
+    return int(np.abs(left - right).sum())
+
+
+def _sort(column: np.ndarray) -> np.ndarray:
+    """Sorts a column of ids. When the ids span a small range compared to their count,
+    a counting sort over a histogram of the range runs in O(n + range) instead of
+    O(n log n).
+
+    Args:
+        column (np.ndarray): ids to sort
+
+    Returns:
+        np.ndarray: sorted ids
+    """
+
+    if len(column) == 0:
+        return column
+
+    low, high = int(column.min()), int(column.max())
+    if high - low >= DENSE_FACTOR * len(column):
+        return np.sort(column)
+
+    counts = np.bincount(column - low, minlength=high - low + 1)
+    return np.repeat(np.arange(low, high + 1, dtype=column.dtype), counts)
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    """Solves from an iterable of lines, such as an open file, without reading the
+    whole input. Pairing the sorted lists needs every id, so only a count per distinct
+    id is kept. Memory grows with the range of ids instead of the number of lines.
+
+    Args:
+        lines (Iterable[str]): lines of the puzzle input
+
+    Returns:
+        int: total distance between the lists
+    """
+
+    c1: dict[int, int] = dict()
+    c2: dict[int, int] = dict()
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        n1, n2 = map(int, line.split())
+        c1[n1] = c1.get(n1, 0) + 1
+        c2[n2] = c2.get(n2, 0) + 1
+
+    return _paired_distance(c1, c2)
+
+
+def _paired_distance(c1: dict[int, int], c2: dict[int, int]) -> int:
+    """Sums the distance between the sorted lists from the count of each id, walking
+    both sets of ids in order like `zip` walks the sorted lists.
+
+    Args:
+        c1 (dict[int, int]): count of each id in the left list
+        c2 (dict[int, int]): count of each id in the right list
+
+    Returns:
+        int: total distance between the lists
+    """
+
+    k1, k2 = sorted(c1), sorted(c2)
+    i = j = 0
+    r1 = c1[k1[0]] if k1 else 0
+    r2 = c2[k2[0]] if k2 else 0
+
+    total = 0
+    while i < len(k1) and j < len(k2):
+        pairs = min(r1, r2)
+        total += pairs * abs(k1[i] - k2[j])
+        r1, r2 = r1 - pairs, r2 - pairs
+
+        if r1 == 0:
+            i += 1
+            r1 = c1[k1[i]] if i < len(k1) else 0
+
+        if r2 == 0:
+            j += 1
+            r2 = c2[k2[j]] if j < len(k2) else 0
+
+    return total
+
+
+ENGINES = {"numpy": _solve_numpy}
+PARSERS = {"numpy": _parse_numpy}
+
+
 # TEST CASES ---------------------------------------------------------------------------
 INPUT_S = """\
 3   4
@@ -36,7 +183,7 @@ INPUT_S = """\
 EXPECTED = 11
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -44,16 +191,35 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-# MAIN ---------------------------------------------------------------------------------
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
+@parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, EXPECTED),),
+)
+def test_lines(input_s: str, expected: int) -> None:
+    assert solve_lines(input_s.splitlines(keepends=True)) == expected
+
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
+def test_signed() -> None:
+    input_s = "-3   4\n4   -3\n-2   5\n"
+    assert solve(input_s) == solve_lines(input_s.splitlines(keepends=True))
 
-    return 0
+
+@parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, EXPECTED), ("", 0)),
+)
+def test_numpy(input_s: str, expected: int) -> None:
+    assert _solve_numpy(_parse_numpy(input_s)) == expected
+
+
+@parametrize("ids", ([3, 1, 2, 1], [70000, 10, 5, 99999], []))
+def test_sort(ids: list[int]) -> None:
+    assert _sort(np.array(ids, dtype=np.int64)).tolist() == sorted(ids)
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,27 +1,135 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from typing import TYPE_CHECKING, Any, Iterable
+from aoc import cli, tokenize
+from aoc.lazy import lazy_import
+from aoc.testing import parametrize
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import("numpy")
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "rows"
+
+# Ids spanning at most this many times the number of lines are counted into dense
+# histograms instead of with `np.unique`
+DENSE_FACTOR = 4
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
+
+
+def parse(input_string: str) -> list[list[int]]:
+    """Parses each line into its pair of location ids.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[list[int]]: one `[left, right]` pair per line
+    """
+    return tokenize.rows(tokenize.integers(input_string, signed=True))
+
+
+def parse_buffer(buffer: memoryview) -> list[list[int]]:
+    """Same as `parse`, but tokenizes a memory mapped input in place."""
+    return tokenize.rows(tokenize.integers(buffer, signed=True))
+
+
+def solve_parsed(pairs: list[list[int]]) -> int:
 
     l = []
     count: dict[int, int] = dict()
 
-    for line in input_string.splitlines():
-        n1, n2 = line.split()
-        l.append(int(n1))
-        count[int(n2)] = count.get(int(n2), 0) + 1
+    for n1, n2 in pairs:
+        l.append(n1)
+        count[n2] = count.get(n2, 0) + 1
 
     return sum([i * count.get(i, 0) for i in l])
 
 
+def _parse_numpy(data: Any) -> np.ndarray:
+    """Same as `parse`, but reshapes the integers straight into an array, without
+    going through Python lists.
+
+    Args:
+        data (Any): puzzle input, `str` or bytes like object
+
+    Returns:
+        np.ndarray: `(n, 2)` array of the `[left, right]` pair of each line
+    """
+    return tokenize.integers(data, signed=True).values.reshape(-1, 2)
+
+
+def _solve_numpy(columns: np.ndarray) -> int:
+    """Same as `solve_parsed`, with the right column counted by `np.unique` and every
+    left id looked up in the distinct ids with a binary search. When the ids span a
+    small range compared to their count, both columns are counted into histograms of
+    the range instead, which takes linear time.
+
+    Args:
+        columns (np.ndarray): `(n, 2)` array from `_parse_numpy`
+
+    Returns:
+        int: similarity score
+    """
+
+    left, right = columns[:, 0], columns[:, 1]
+    if len(columns) == 0:
+        return 0
+
+    low = int(min(left.min(), right.min()))
+    high = int(max(left.max(), right.max()))
+    if high - low < DENSE_FACTOR * len(columns):
+        size = high - low + 1
+        left_counts = np.bincount(left - low, minlength=size)
+        right_counts = np.bincount(right - low, minlength=size)
+        ids = np.arange(low, high + 1, dtype=np.int64)
+        return int((ids * left_counts * right_counts).sum())
+
+    distinct, counts = np.unique(right, return_counts=True)
+    if len(distinct) == 0:
+        return 0
+
+    i = np.searchsorted(distinct, left).clip(max=len(distinct) - 1)
+    return int((left * counts[i] * (distinct[i] == left)).sum())
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    """Solves from an iterable of lines, such as an open file, without reading the
+    whole input. Both lists are folded into a count per distinct id.
+
+    Args:
+        lines (Iterable[str]): lines of the puzzle input
+
+    Returns:
+        int: similarity score
+    """
+
+    c1: dict[int, int] = dict()
+    c2: dict[int, int] = dict()
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        n1, n2 = map(int, line.split())
+        c1[n1] = c1.get(n1, 0) + 1
+        c2[n2] = c2.get(n2, 0) + 1
+
+    return sum([i * n * c2.get(i, 0) for i, n in c1.items()])
+
+
+ENGINES = {"numpy": _solve_numpy}
+PARSERS = {"numpy": _parse_numpy}
+
+
 # TEST CASES ---------------------------------------------------------------------------
 INPUT_S = """\
 3   4
@@ -34,7 +142,7 @@ INPUT_S = """\
 EXPECTED = 31
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -42,16 +150,30 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-# MAIN ---------------------------------------------------------------------------------
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
+@parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, EXPECTED),),
+)
+def test_lines(input_s: str, expected: int) -> None:
+    assert solve_lines(input_s.splitlines(keepends=True)) == expected
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
 
-    return 0
+def test_signed() -> None:
+    input_s = "-3   4\n4   -3\n-2   5\n"
+    assert solve(input_s) == solve_lines(input_s.splitlines(keepends=True))
+
+
+@parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, EXPECTED), ("", 0), ("10   99999\n99999   99999\n", 199998)),
+)
+def test_numpy(input_s: str, expected: int) -> None:
+    assert _solve_numpy(_parse_numpy(input_s)) == expected
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,54 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from typing import Iterable
+from aoc import cli, tokenize
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "rows"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
+
+
+def parse(input_string: str) -> list[list[int]]:
+    """Parses each line into the levels of a report.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[list[int]]: levels of each report
+    """
+    return tokenize.rows(tokenize.integers(input_string, signed=True))
+
+
+def parse_buffer(buffer: memoryview) -> list[list[int]]:
+    """Same as `parse`, but tokenizes a memory mapped input in place."""
+    return tokenize.rows(tokenize.integers(buffer, signed=True))
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    """Solves from an iterable of lines, such as an open file, one report at a time.
+
+    Args:
+        lines (Iterable[str]): lines of the puzzle input
+
+    Returns:
+        int: number of safe reports
+    """
+    return solve_parsed(list(map(int, line.split())) for line in lines if line.strip())
+
+
+def solve_parsed(reports: Iterable[list[int]]) -> int:
 
     safe = 0
 
-    for report in input_string.splitlines():
-        levels = list(map(int, report.split()))
+    for levels in reports:
         mode: str | None = None
 
         for i in range(len(levels) - 1):
@@ -50,7 +84,7 @@ INPUT_S = """\
 EXPECTED = 2
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -58,16 +92,22 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-# MAIN ---------------------------------------------------------------------------------
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
+@parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, EXPECTED),),
+)
+def test_lines(input_s: str, expected: int) -> None:
+    assert solve_lines(input_s.splitlines(keepends=True)) == expected
+
+
+def test_signed() -> None:
+    input_s = "-1 -2 -3\n-5 -3 -1\n1 -1 -2 -4\n-7 2 -8 -9\n"
+    assert solve(input_s) == solve_lines(input_s.splitlines(keepends=True))
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
 
-    return 0
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,47 +1,108 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from typing import Iterable, Sequence
+from aoc import cli, tokenize
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "rows"
+REMOVALS = 1  # Bad levels the problem dampener can remove from a report
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    safe = 0
 
-    for report in input_string.splitlines():
-        levels = list(map(int, report.split()))
+def parse(input_string: str) -> list[list[int]]:
+    """Parses each line into the levels of a report.
 
-        # Variation of reports
-        removed = [levels[0:i] + levels[i + 1 :] for i in range(len(levels))]
+    Args:
+        input_string (str): puzzle input
 
-        for possibility in removed:
-            mode: str | None = None
-            for i in range(len(possibility) - 1):
+    Returns:
+        list[list[int]]: levels of each report
+    """
+    return tokenize.rows(tokenize.integers(input_string, signed=True))
 
-                cur, nex = possibility[i], possibility[i + 1]
 
-                # Reports are safe if they are monotonically decreasing or increasing.
-                adj_mode = "d" if cur > nex else "i"
-                mode = mode if mode is not None else adj_mode
-                if mode != adj_mode:
-                    break
+def parse_buffer(buffer: memoryview) -> list[list[int]]:
+    """Same as `parse`, but tokenizes a memory mapped input in place."""
+    return tokenize.rows(tokenize.integers(buffer, signed=True))
 
-                # Reports that are safe also have have adjacent levels be at least one and
-                # at most three apart.
-                diff = abs(cur - nex)
-                if not (diff > 0 and diff <= 3):
-                    break
 
-            else:
-                safe += 1
-                break
+def solve_lines(lines: Iterable[str]) -> int:
+    """Solves from an iterable of lines, such as an open file, one report at a time.
 
-    return safe
+    Args:
+        lines (Iterable[str]): lines of the puzzle input
+
+    Returns:
+        int: number of safe reports
+    """
+    return solve_parsed(list(map(int, line.split())) for line in lines if line.strip())
+
+
+def solve_parsed(reports: Iterable[list[int]], removals: int = REMOVALS) -> int:
+    return sum(1 for levels in reports if _is_safe(levels, removals))
+
+
+def _is_safe(levels: Sequence[int], removals: int) -> bool:
+    """Returns whether a report is safe once at most removals levels are taken out.
+    Reports are safe if they are monotonically increasing or decreasing with adjacent
+    levels one to three apart, which is checked for each direction in one pass.
+
+    Args:
+        levels (Sequence[int]): levels of the report
+        removals (int): number of levels that can be removed
+
+    Returns:
+        bool: True if the report can be made safe
+    """
+
+    # A report that can lose all but one of its levels is always safe
+    if 0 < len(levels) <= removals + 1:
+        return True
+
+    return any(_fits(levels, sign, removals, [], 0) for sign in (1, -1))
+
+
+def _fits(
+    levels: Sequence[int], sign: int, removals: int, kept: list[int], i: int
+) -> bool:
+    """Scans levels from i on after the safe levels in kept, all in the direction of
+    sign. At the first pair that breaks the rules one of the two levels has to go, so
+    both choices are tried with one removal less. That is at most `2 ** removals` scans
+    of O(n) each.
+
+    Args:
+        levels (Sequence[int]): levels of the report
+        sign (int): 1 for increasing, -1 for decreasing
+        removals (int): number of levels that can still be removed
+        kept (list[int]): levels kept so far, safe in this direction
+        i (int): next level to scan
+
+    Returns:
+        bool: True if the rest of the report can be made safe
+    """
+
+    while i < len(levels):
+        if not kept or 1 <= sign * (levels[i] - kept[-1]) <= 3:
+            kept.append(levels[i])
+            i += 1
+            continue
+
+        if removals == 0:
+            return False
+
+        # Drop the current level, or drop the last kept one and check the current again
+        return _fits(levels, sign, removals - 1, kept.copy(), i + 1) or _fits(
+            levels, sign, removals - 1, kept[:-1], i
+        )
+
+    return bool(kept)
 
 
 # TEST CASES ---------------------------------------------------------------------------
@@ -56,7 +117,7 @@ INPUT_S = """\
 EXPECTED = 4
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -64,16 +125,44 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-# MAIN ---------------------------------------------------------------------------------
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
+@parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, EXPECTED),),
+)
+def test_lines(input_s: str, expected: int) -> None:
+    assert solve_lines(input_s.splitlines(keepends=True)) == expected
+
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
+def test_signed() -> None:
+    input_s = "-1 -2 -3\n-5 -3 -1\n1 -1 -2 -4\n-7 2 -8 -9\n"
+    assert solve(input_s) == solve_lines(input_s.splitlines(keepends=True))
 
-    return 0
+
+def test_removals() -> None:
+    import random
+    import itertools
+
+    def brute_force(levels: list[int], removals: int) -> bool:
+        for n in range(removals + 1):
+            for removed in itertools.combinations(range(len(levels)), n):
+                rest = [v for i, v in enumerate(levels) if i not in removed]
+                steps = [b - a for a, b in zip(rest, rest[1:])]
+                if rest and (
+                    all(1 <= s <= 3 for s in steps) or all(-3 <= s <= -1 for s in steps)
+                ):
+                    return True
+        return False
+
+    rng = random.Random(2)
+    for _ in range(500):
+        levels = [rng.randrange(10) for _ in range(rng.randrange(1, 9))]
+        for removals in range(3):
+            assert _is_safe(levels, removals) == brute_force(levels, removals)
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
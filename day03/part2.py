@@ -1,7 +1,7 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli
+from aoc.testing import parametrize
 import re
 
 # CONSTANTS ----------------------------------------------------------------------------
@@ -11,9 +11,18 @@ INPUT_TXT = os.path.join(DIR, "input.txt")
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
+
+
+def parse(input_string: str) -> list[str]:
+    """Parses the input into its lines of corrupted memory."""
+    return input_string.splitlines()
+
+
+def solve_parsed(lines: list[str]) -> int:
 
     s = ""
-    for line in input_string.splitlines():
+    for line in lines:
         s += line
 
     # First find the don't operations
@@ -46,7 +55,7 @@ xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))
 EXPECTED = 48
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -56,14 +65,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,13 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, loader
+from aoc.grid import Grid
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "grid"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
@@ -22,39 +24,61 @@ DIRECTIONS = [
 
 
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    grid: list[str] = []
-    for line in input_string.splitlines():
-        grid.append(line.strip())
 
-    row, col = len(grid), len(grid[0])
+def parse(input_string: str) -> list[str]:
+    """Parses the input into the rows of the grid.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[str]: rows of the grid
+    """
+    return [line.strip() for line in input_string.splitlines()]
+
+
+def parse_buffer(buffer: memoryview) -> list[memoryview]:
+    """Same as `parse`, but returns rows as views over a memory mapped input."""
+    return loader.lines(buffer)
+
+
+def solve_parsed(rows: list[str]) -> int:
+
+    word = b"XMAS"
+
+    # Pad enough that a word starting on the edge only runs into border cells
+    grid = Grid(rows, pad=len(word) - 1)
+    offsets = grid.offsets(DIRECTIONS)
 
     found = 0
-    for y in range(row):
-        for x in range(col):
-            for direction in DIRECTIONS:
-                found += look_for_word_at(grid, x, y, "XMAS", direction)
+    for i in grid.find(word[0]):
+        for offset in offsets:
+            found += look_for_word_at(grid.cells, i, word, offset)
 
     return found
 
 
-def look_for_word_at(
-    grid: list[str], x: int, y: int, word: str, direction: tuple[int, int]
-) -> int:
+def look_for_word_at(cells: bytearray, i: int, word: bytes, offset: int) -> int:
+    """Returns 1 if word is spelled starting at cell i and moving by offset.
 
-    # word found
-    if len(word) == 0:
-        return 1
+    Args:
+        cells (bytearray): cells of the grid
+        i (int): index of the first letter
+        word (bytes): word to look for
+        offset (int): index offset of the direction to read in
 
-    # out of bounds?
-    if y < 0 or x < 0 or y >= len(grid) or x >= len(grid[y]):
-        return 0
+    Returns:
+        int: 1 if the word was found, otherwise 0
+    """
 
-    if word[0] != grid[y][x]:
-        return 0
+    for letter in word:
+        if cells[i] != letter:
+            return 0
+        i += offset
 
-    x_delta, y_delta = direction
-    return look_for_word_at(grid, x + x_delta, y + y_delta, word[1:], direction)
+    return 1
 
 
 # TEST CASES ---------------------------------------------------------------------------
@@ -73,7 +97,7 @@ MXMXAXMASX
 EXPECTED = 18
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -83,14 +107,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
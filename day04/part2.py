@@ -1,11 +1,13 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, loader
+from aoc.grid import Grid
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "grid"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
@@ -18,38 +20,58 @@ DIRECTIONS = [
 
 
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    grid: list[str] = []
-    for line in input_string.splitlines():
-        grid.append(line.strip())
 
-    row, col = len(grid), len(grid[0])
+def parse(input_string: str) -> list[str]:
+    """Parses the input into the rows of the grid.
 
-    found = 0
-    for y in range(row):
-        for x in range(col):
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[str]: rows of the grid
+    """
+    return [line.strip() for line in input_string.splitlines()]
+
+
+def parse_buffer(buffer: memoryview) -> list[memoryview]:
+    """Same as `parse`, but returns rows as views over a memory mapped input."""
+    return loader.lines(buffer)
+
+
+MAS = {ord("M"), ord("S")}
+
+
+def solve_parsed(rows: list[str]) -> int:
 
-            # Check for X-MAS
-            if grid[y][x] == "A":
-                found += check_x_mas(grid, x, y)
+    grid = Grid(rows)
+    offsets = grid.offsets([(dx, dy) for dx, dy in DIRECTIONS])
+
+    found = 0
+    for i in grid.find(ord("A")):
+        found += check_x_mas(grid.cells, i, offsets)
 
     return found
 
 
-def check_x_mas(grid: list[str], x: int, y: int) -> int:
+def check_x_mas(cells: bytearray, i: int, offsets: list[int]) -> int:
+    """Returns 1 if the `A` at cell i is the middle of two crossing `MAS`. An `A` on the
+    edge has border cells on its diagonals, so it never matches.
+
+    Args:
+        cells (bytearray): cells of the grid
+        i (int): index of the `A`
+        offsets (list[int]): index offsets of up left, up right, down left, down right
+
+    Returns:
+        int: 1 if it forms an X-MAS, otherwise 0
+    """
 
-    # Won't be in bounds
-    if not (1 <= x < len(grid[0]) - 1 and 1 <= y < len(grid) - 1):
-        return 0
+    up_left, up_right, down_left, down_right = (cells[i + o] for o in offsets)
 
     # Forms X-MAS
-    if (
-        (grid[y - 1][x - 1] == "M" and grid[y + 1][x + 1] == "S")
-        or (grid[y - 1][x - 1] == "S" and grid[y + 1][x + 1] == "M")
-    ) and (
-        (grid[y - 1][x + 1] == "M" and grid[y + 1][x - 1] == "S")
-        or (grid[y - 1][x + 1] == "S" and grid[y + 1][x - 1] == "M")
-    ):
+    if {up_left, down_right} == MAS and {up_right, down_left} == MAS:
         return 1
 
     return 0
@@ -71,7 +93,7 @@ MXMXAXMASX
 EXPECTED = 9
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -81,14 +103,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
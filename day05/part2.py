@@ -1,7 +1,7 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, tokenize
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
@@ -10,15 +10,33 @@ INPUT_TXT = os.path.join(DIR, "input.txt")
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    raw_lines = input_string.splitlines()
-    index = raw_lines.index("")  # Index of rules splitting
-    rules, updates = raw_lines[:index], raw_lines[index + 1 :]
+
+def parse(input_string: str) -> tuple[list[list[int]], list[list[int]]]:
+    """Parses the page ordering rules and the updates.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        tuple[list[list[int]], list[list[int]]]: `[before, after]` pairs of each rule
+            and the pages of each update
+    """
+
+    lines = tokenize.rows(tokenize.integers(input_string, signed=True))
+    index = lines.index([])  # Index of rules splitting
+
+    return lines[:index], lines[index + 1 :]
+
+
+def solve_parsed(parsed: tuple[list[list[int]], list[list[int]]]) -> int:
+
+    rules, updates_clean = parsed
 
     # Build graph of rules
     graph: dict[int, Rule] = {}
-    for rule in rules:
-        pre, dep = list(map(int, rule.split("|")))
+    for pre, dep in rules:
 
         graph[pre] = graph.get(pre, Rule(pre))
         graph[dep] = graph.get(dep, Rule(dep))
@@ -26,7 +44,6 @@ def solve(input_string: str) -> int:
         graph[pre].add_dependent(graph[dep])
         graph[dep].add_prerequisite(graph[pre])
 
-    updates_clean = [list(map(int, update.split(","))) for update in updates]
     invalid_updates = list(
         filter(lambda update: not is_valid_update(update, graph), updates_clean)
     )
@@ -115,7 +132,7 @@ INPUT_S = """\
 EXPECTED = 123
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -125,14 +142,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
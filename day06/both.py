@@ -0,0 +1,63 @@
+from __future__ import annotations
+import os
+from aoc import cli
+from aoc.grid import Grid
+from aoc.testing import parametrize
+from day06 import part1, part2
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = part2.CACHE
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+parse = part2.parse
+parse_buffer = part2.parse_buffer
+
+
+def solve_both(input_string: str) -> tuple[int, int]:
+    return solve_both_parsed(parse(input_string))
+
+
+def solve_both_parsed(rows: list[str]) -> tuple[int, int]:
+    """Walks the guard once. The visited cells are the part 1 answer and also the only
+    cells where a new obstacle can change the guard's path in part 2.
+
+    Args:
+        rows (list[str]): rows of the grid
+
+    Returns:
+        tuple[int, int]: answers of part 1 and part 2
+    """
+
+    grid = Grid(rows)
+    guards = grid.find(ord("^"))
+    if not guards:
+        raise RuntimeError("Guard cannot be found!")
+
+    initial_pos = guards[-1]
+    visited = part2._get_visited(initial_pos, grid, 0)
+
+    prospects = visited - {initial_pos}
+    loops = len(list(filter(lambda x: part2._loop(initial_pos, x, grid, 0), prospects)))
+
+    return len(visited), loops
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize(
+    ("input_s", "expected"),
+    ((part1.INPUT_S, (part1.EXPECTED, part2.EXPECTED)),),
+)
+def test(input_s: str, expected: tuple[int, int]) -> None:
+    assert solve_both(input_s) == expected
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_both_parsed, INPUT_TXT)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
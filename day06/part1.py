@@ -1,11 +1,13 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, loader
+from aoc.grid import BORDER, Grid
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "grid"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
@@ -14,83 +16,58 @@ DOWN = (0, 1)
 RIGHT = (1, 0)
 LEFT = (-1, 0)
 ORDER: list[tuple[int, int]] = [UP, RIGHT, DOWN, LEFT]
+OBSTACLE = ord("#")
 
 
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    area: list[list[str]] = []
-    for line in input_string.splitlines():
-        area.append(list(line))
 
-    initial_pos: tuple[int, int] | None = None
-    for x in range(len(area[0])):
-        for y in range(len(area)):
-            if area[y][x] == "^":
-                initial_pos = (x, y)
+def parse(input_string: str) -> list[str]:
+    """Parses the input into the rows of the grid.
 
-    if not initial_pos:
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[str]: rows of the grid
+    """
+    return [line.strip() for line in input_string.splitlines()]
+
+
+def parse_buffer(buffer: memoryview) -> list[memoryview]:
+    """Same as `parse`, but returns rows as views over a memory mapped input."""
+    return loader.lines(buffer)
+
+
+def solve_parsed(rows: list[str]) -> int:
+
+    grid = Grid(rows)
+    guards = grid.find(ord("^"))
+    if not guards:
         raise RuntimeError("Guard cannot be found!")
 
+    cells = grid.cells
+    offsets = grid.offsets(ORDER)
+
     visited = set()
     direction_index: int = 0
-    cur_pos = initial_pos
+    cur_pos = guards[-1]
 
     # Loop while guard is in bounds
-    while _in_bounds(cur_pos, area):
+    while cells[cur_pos] != BORDER:
         visited.add(cur_pos)
 
         # Turn?
-        while _turn(cur_pos, ORDER[direction_index], area):
+        while cells[cur_pos + offsets[direction_index]] == OBSTACLE:
             direction_index = (direction_index + 1) % len(ORDER)
 
         # Update position
-        x, y = cur_pos
-        x_delta, y_delta = ORDER[direction_index]
-        cur_pos = (x + x_delta, y + y_delta)
+        cur_pos += offsets[direction_index]
 
     return len(visited)
 
 
-def _in_bounds(
-    pos: tuple[int, int],
-    area: list[list[str]],
-) -> bool:
-    """Determines whether or not the the current position is within the area of the grid
-
-    Args:
-        pos (tuple[int, int]): position of the guard
-        area (list[list[str]]): 2D array representing the area
-
-    Returns:
-        bool: returns True if position is in bounds, False otherwise
-    """
-    x, y = pos
-    return 0 <= x < len(area[0]) and 0 <= y < len(area)
-
-
-def _turn(
-    pos: tuple[int, int],
-    direction: tuple[int, int],
-    area: list[list[str]],
-) -> bool:
-    """Determines if guard needs to turn.
-    The guard will need to move if there is a `#` in their way.
-
-    Args:
-        pos (tuple[int, int]): position of the guard
-        direction (tuple[int, int]): direction the guard is going
-        area (list[list[str]]): 2D array representing the area
-
-    Returns:
-        bool: returns True if the guard needs to turn, False otherwise
-    """
-
-    x, y = pos
-    x_delta, y_delta = direction
-    new_x, new_y = x + x_delta, y + y_delta
-    return _in_bounds((new_x, new_y), area) and area[new_y][new_x] == "#"
-
-
 # TEST CASES ---------------------------------------------------------------------------
 INPUT_S = """\
 ....#.....
@@ -107,7 +84,7 @@ INPUT_S = """\
 EXPECTED = 41
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -117,14 +94,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
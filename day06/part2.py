@@ -1,11 +1,21 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+import itertools
+from typing import TYPE_CHECKING
+from aoc import cli, counters, loader, shm
+from aoc.grid import BORDER, Grid
+from aoc.lazy import lazy_import
+from aoc.testing import parametrize
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import("numpy")
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "grid"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
@@ -14,153 +24,217 @@ DOWN = (0, 1)
 RIGHT = (1, 0)
 LEFT = (-1, 0)
 ORDER: list[tuple[int, int]] = [UP, RIGHT, DOWN, LEFT]
+OBSTACLE = ord("#")
+EMPTY = ord(".")
 
 
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    area: list[list[str]] = []
-    for line in input_string.splitlines():
-        area.append(list(line))
 
-    initial_pos: tuple[int, int] | None = None
-    for x in range(len(area[0])):
-        for y in range(len(area)):
-            if area[y][x] == "^":
-                initial_pos = (x, y)
+def parse(input_string: str) -> list[str]:
+    """Parses the input into the rows of the grid.
 
-    if not initial_pos:
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[str]: rows of the grid
+    """
+    return [line.strip() for line in input_string.splitlines()]
+
+
+def parse_buffer(buffer: memoryview) -> list[memoryview]:
+    """Same as `parse`, but returns rows as views over a memory mapped input."""
+    return loader.lines(buffer)
+
+
+def solve_parsed(rows: list[str]) -> int:
+
+    grid = Grid(rows)
+    guards = grid.find(ord("^"))
+    if not guards:
         raise RuntimeError("Guard cannot be found!")
 
-    prospects = _get_visited(initial_pos, area, 0)
+    initial_pos = guards[-1]
+    prospects = _get_visited(initial_pos, grid, 0)
     prospects.remove(initial_pos)
 
-    return len(list(filter(lambda x: _loop(initial_pos, x, area, 0), prospects)))
+    return len(list(filter(lambda x: _loop(initial_pos, x, grid, 0), prospects)))
 
 
 def _loop(
-    initial_pos: tuple[int, int],
-    obstacle: tuple[int, int],
-    area: list[list[str]],
+    initial_pos: int,
+    obstacle: int,
+    grid: Grid,
     direction_index: int,
 ) -> bool:
     """Returns a boolean indicating whether adding an obstacle at position `obstacle`
     will result in an infinite loop.
 
     Args:
-        initial_pos (tuple[int, int]): initial position
-        obstacle (tuple[int, int]): coordinate of obstacle
-        area (list[list[str]]): 2D array representing area
+        initial_pos (int): index of the initial position
+        obstacle (int): index of the obstacle
+        grid (Grid): grid representing the area
         direction_index (int): direction the guard is traveling
 
     Returns:
         bool: Returns True if set up will result in an infinite loop, otherwise False
     """
 
-    obs_x, obs_y = obstacle
-    area[obs_y][obs_x] = "#"
+    cells = grid.cells
+    offsets = grid.offsets(ORDER)
+    cells[obstacle] = OBSTACLE
 
     cur_pos = initial_pos
     visited = set()
+    loops = False
 
-    # Loop until we come back to a spot facing in the same direction
-    while (*cur_pos, direction_index) not in visited:
-        visited.add((*cur_pos, direction_index))
-
-        # Break out if we have left the area
-        if not _in_bounds(cur_pos, area):
+    # Walk until we leave the area or come back to a spot facing in the same direction
+    while cells[cur_pos] != BORDER:
+        state = cur_pos * len(ORDER) + direction_index
+        if state in visited:
+            loops = True
             break
+        visited.add(state)
 
         # Turn?
-        while _turn(cur_pos, ORDER[direction_index], area):
+        while cells[cur_pos + offsets[direction_index]] == OBSTACLE:
             direction_index = (direction_index + 1) % len(ORDER)
 
         # Update position
-        x, y = cur_pos
-        x_delta, y_delta = ORDER[direction_index]
-        cur_pos = (x + x_delta, y + y_delta)
+        cur_pos += offsets[direction_index]
+
+    cells[obstacle] = EMPTY
 
-    # Reach this branch if we have exited out of the loop naturally
-    else:
-        area[obs_y][obs_x] = "."
-        return True
+    # Every step added one state, so the steps are counted without touching the loop
+    if counters.ENABLED:
+        counters.add("loop_checks")
+        counters.add("guard_steps", len(visited))
 
-    area[obs_y][obs_x] = "."
-    return False
+    return loops
+
+
+def _solve_parallel(rows: list[str], jobs: int | None = None) -> int:
+    """Tries the candidate obstacles on a pool of processes. The grid and the
+    candidates are shared once, and workers read them in place without ever placing
+    an obstacle in the grid.
+
+    Args:
+        rows (list[str]): rows of the grid
+        jobs (int | None): number of processes, defaults to the number of cores
+
+    Returns:
+        int: number of obstacle positions that trap the guard in a loop
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    grid = Grid(rows)
+    guards = grid.find(ord("^"))
+    if not guards:
+        raise RuntimeError("Guard cannot be found!")
+
+    initial_pos = guards[-1]
+    prospects = _get_visited(initial_pos, grid, 0)
+    prospects.remove(initial_pos)
+    if not prospects:
+        return 0
+
+    cells = np.frombuffer(grid.cells, dtype=np.uint8)
+    obstacles = np.fromiter(sorted(prospects), dtype=np.int64, count=len(prospects))
+
+    jobs = jobs or os.cpu_count() or 1
+    ranges = shm.chunks(len(obstacles), jobs * 4)
+    with (
+        shm.shared(cells) as cells_handle,
+        shm.shared(obstacles) as obstacles_handle,
+        ProcessPoolExecutor(jobs) as executor,
+    ):
+        counts = executor.map(
+            _count_loops,
+            itertools.repeat(cells_handle),
+            itertools.repeat(obstacles_handle),
+            itertools.repeat(grid.offsets(ORDER)),
+            itertools.repeat(initial_pos),
+            *zip(*ranges),
+        )
+        return sum(counts)
+
+
+def _count_loops(
+    cells_handle: shm.Handle,
+    obstacles_handle: shm.Handle,
+    offsets: list[int],
+    initial_pos: int,
+    start: int,
+    stop: int,
+) -> int:
+    # A memoryview over the shared cells indexes to plain ints, as fast as a bytearray
+    cells = shm.attach(cells_handle).data
+    obstacles = shm.attach(obstacles_handle)[start:stop].tolist()
+
+    total = 0
+    for obstacle in obstacles:
+        cur_pos = initial_pos
+        direction_index = 0
+        visited = set()
+
+        while cells[cur_pos] != BORDER:
+            state = cur_pos * len(ORDER) + direction_index
+            if state in visited:
+                total += 1
+                break
+            visited.add(state)
+
+            # The obstacle is checked by position since the shared grid is read only
+            next_pos = cur_pos + offsets[direction_index]
+            while cells[next_pos] == OBSTACLE or next_pos == obstacle:
+                direction_index = (direction_index + 1) % len(ORDER)
+                next_pos = cur_pos + offsets[direction_index]
+
+            cur_pos = next_pos
+
+    return total
 
 
 def _get_visited(
-    initial_pos: tuple[int, int],
-    area: list[list[str]],
+    initial_pos: int,
+    grid: Grid,
     direction_index: int,
-) -> set[tuple[int, int]]:
-    """Return visited coordinates with the passed in conditions.
+) -> set[int]:
+    """Return visited positions with the passed in conditions.
 
     Args:
-        initial_pos (tuple[int, int]): initial position of guard
-        area (list[list[str]]): 2D array representing area
+        initial_pos (int): index of the initial position of guard
+        grid (Grid): grid representing the area
         direction_index (int): direction the guard is traveling
 
     Returns:
-        set[tuple[int, int]]: distinct locations visited by the guard
+        set[int]: indices of distinct locations visited by the guard
     """
 
+    cells = grid.cells
+    offsets = grid.offsets(ORDER)
+
     visited = set()
     cur_pos = initial_pos
 
     # Loop while guard is in bounds
-    while _in_bounds(cur_pos, area):
+    while cells[cur_pos] != BORDER:
         visited.add(cur_pos)
 
         # Turn?
-        while _turn(cur_pos, ORDER[direction_index], area):
+        while cells[cur_pos + offsets[direction_index]] == OBSTACLE:
             direction_index = (direction_index + 1) % len(ORDER)
 
         # Update position
-        x, y = cur_pos
-        x_delta, y_delta = ORDER[direction_index]
-        cur_pos = (x + x_delta, y + y_delta)
+        cur_pos += offsets[direction_index]
 
     return visited
 
 
-def _in_bounds(
-    pos: tuple[int, int],
-    area: list[list[str]],
-) -> bool:
-    """Determines whether or not the the current position is within the area of the grid
-
-    Args:
-        pos (tuple[int, int]): position of the guard
-        area (list[list[str]]): 2D array representing the area
-
-    Returns:
-        bool: returns True if position is in bounds, False otherwise
-    """
-    x, y = pos
-    return 0 <= x < len(area[0]) and 0 <= y < len(area)
-
-
-def _turn(
-    pos: tuple[int, int],
-    direction: tuple[int, int],
-    area: list[list[str]],
-) -> bool:
-    """Determines if guard needs to turn.
-    The guard will need to move if there is a `#` in their way.
-
-    Args:
-        pos (tuple[int, int]): position of the guard
-        direction (tuple[int, int]): direction the guard is going
-        area (list[list[str]]): 2D array representing the area
-
-    Returns:
-        bool: returns True if the guard needs to turn, False otherwise
-    """
-
-    x, y = pos
-    x_delta, y_delta = direction
-    new_x, new_y = x + x_delta, y + y_delta
-    return _in_bounds((new_x, new_y), area) and area[new_y][new_x] == "#"
+ENGINES = {"parallel": _solve_parallel}
 
 
 # TEST CASES ---------------------------------------------------------------------------
@@ -179,7 +253,7 @@ INPUT_S = """\
 EXPECTED = 6
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -187,16 +261,14 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-# MAIN ---------------------------------------------------------------------------------
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
+@parametrize("jobs", (1, 2))
+def test_parallel(jobs: int) -> None:
+    assert _solve_parallel(parse(INPUT_S), jobs) == EXPECTED
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
 
-    return 0
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,15 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+import itertools
+from typing import Iterable
+from aoc import cli, counters, shm, tokenize
+from aoc.testing import parametrize
 import functools
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "rows"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
@@ -18,22 +21,105 @@ ORDER: list[tuple[int, int]] = [UP, RIGHT, DOWN, LEFT]
 
 
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    equations: list[tuple[int, tuple[int, ...]]] = []
-    for line in input_string.splitlines():
-        value, nums = line.split(":")
-        nums_tup = tuple(map(int, nums.strip().split(" ")))
-        equations.append((int(value.strip()), nums_tup))
+
+def parse(input_string: str) -> list[list[int]]:
+    """Parses each equation into its test value followed by its numbers.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[list[int]]: `[value, *nums]` for each equation
+    """
+
+    return tokenize.rows(tokenize.integers(input_string, signed=True))
+
+
+def parse_buffer(buffer: memoryview) -> list[list[int]]:
+    """Same as `parse`, but tokenizes a memory mapped input in place."""
+    return tokenize.rows(tokenize.integers(buffer, signed=True))
+
+
+def _parse_line(line: str) -> list[int]:
+    value, nums = line.split(":")
+    return [int(value.strip()), *map(int, nums.strip().split(" "))]
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    """Solves from an iterable of lines, such as an open file, one equation at a time.
+    The memo only helps within an equation, so it is cleared after each one to keep
+    memory flat.
+
+    Args:
+        lines (Iterable[str]): lines of the puzzle input
+
+    Returns:
+        int: total calibration result
+    """
+
+    total = 0
+    for line in lines:
+        if not line.strip():
+            continue
+
+        row = _parse_line(line)
+        if _can_make_valid((row[0], tuple(row[1:]))):
+            total += row[0]
+
+        _can_make_valid_helper.cache_clear()
+
+    return total
+
+
+def solve_parsed(rows: list[list[int]]) -> int:
+
+    equations: list[tuple[int, tuple[int, ...]]] = [
+        (row[0], tuple(row[1:])) for row in rows
+    ]
 
     valid = list(filter(_can_make_valid, equations))
     return sum([eq[0] for eq in valid])
 
 
+def _solve_parallel(rows: list[list[int]], jobs: int | None = None) -> int:
+    """Checks the equations on a pool of processes. The equations are shared once
+    instead of being pickled for every worker, so test values must fit in 64 bits.
+
+    Args:
+        rows (list[list[int]]): parsed equations
+        jobs (int | None): number of processes, defaults to the number of cores
+
+    Returns:
+        int: total calibration result
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not rows:
+        return 0
+
+    jobs = jobs or os.cpu_count() or 1
+    ranges = shm.chunks(len(rows), jobs * 4)
+    with shm.shared_rows(rows) as handles, ProcessPoolExecutor(jobs) as executor:
+        return sum(executor.map(_total, itertools.repeat(handles), *zip(*ranges)))
+
+
+def _total(handles: shm.RowsHandle, start: int, stop: int) -> int:
+    return sum(
+        row[0]
+        for row in shm.attach_rows(handles, start, stop)
+        if _can_make_valid((row[0], tuple(row[1:])))
+    )
+
+
 def _can_make_valid(equation: tuple[int, tuple[int, ...]]) -> bool:
     target, nums = equation[0], equation[1]
     return _can_make_valid_helper(target, nums[0], nums[1:])
 
 
+@counters.track_cache
 @functools.cache
 def _can_make_valid_helper(target: int, current: int, nums: tuple[int, ...]) -> bool:
 
@@ -54,6 +140,9 @@ def _can_make_valid_helper(target: int, current: int, nums: tuple[int, ...]) ->
     )
 
 
+ENGINES = {"parallel": _solve_parallel}
+
+
 # TEST CASES ---------------------------------------------------------------------------
 INPUT_S = """\
 190: 10 19
@@ -69,7 +158,7 @@ INPUT_S = """\
 EXPECTED = 3749
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -77,16 +166,27 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-# MAIN ---------------------------------------------------------------------------------
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
+@parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, EXPECTED),),
+)
+def test_lines(input_s: str, expected: int) -> None:
+    assert solve_lines(input_s.splitlines(keepends=True)) == expected
+
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
+def test_signed() -> None:
+    input_s = "6: -2 -3\n-5: -2 3\n4: -1 5\n"
+    assert solve(input_s) == solve_lines(input_s.splitlines(keepends=True))
 
-    return 0
+
+@parametrize("jobs", (1, 2))
+def test_parallel(jobs: int) -> None:
+    assert _solve_parallel(parse(INPUT_S), jobs) == EXPECTED
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,43 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, loader
+from aoc.grid import Grid
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "grid"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
+EMPTY = ord(".")
+
+
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
+
+
+def parse(input_string: str) -> list[str]:
+    """Parses the input into the rows of the grid.
 
-    area: list[list[str]] = []
-    for line in input_string.splitlines():
-        trimmed = line.strip()
-        area.append(list(trimmed))
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[str]: rows of the grid
+    """
+    return [line.strip() for line in input_string.splitlines()]
+
+
+def parse_buffer(buffer: memoryview) -> list[memoryview]:
+    """Same as `parse`, but returns rows as views over a memory mapped input."""
+    return loader.lines(buffer)
+
+
+def solve_parsed(rows: list[str]) -> int:
+
+    area = Grid(rows)
 
     # Find coordinates for each signal
     coordinates = _find_coordinates(area)
@@ -28,12 +51,12 @@ def solve(input_string: str) -> int:
 
 
 def _find_coordinates(
-    area: list[list[str]],
+    area: Grid,
 ) -> dict[str, set[tuple[int, int]]]:
     """Finds the coordinates for each signal.
 
     Args:
-        area (list[list[str]]): 2D array representing the array
+        area (Grid): grid representing the area
 
     Returns:
         dict[str, set[tuple[int, int]]]: A map where each key is the signal and the
@@ -41,18 +64,18 @@ def _find_coordinates(
     """
 
     coordinates: dict[str, set[tuple[int, int]]] = dict()
-    for y in range(len(area)):
-        for x in range(len(area[y])):
-            if area[y][x] == ".":
-                continue
-            coordinates[area[y][x]] = coordinates.get(area[y][x], set())
-            coordinates[area[y][x]].add((x, y))
+    for i in area.positions():
+        if area[i] == EMPTY:
+            continue
+        signal = chr(area[i])
+        coordinates[signal] = coordinates.get(signal, set())
+        coordinates[signal].add(area.coordinates(i))
 
     return coordinates
 
 
 def _find_anti_nodes(
-    coordinates: dict[str, set[tuple[int, int]]]
+    coordinates: dict[str, set[tuple[int, int]]],
 ) -> set[tuple[int, int]]:
     """Finds anti nodes for all signals
 
@@ -90,7 +113,7 @@ def _process_signal(locations: set[tuple[int, int]]) -> set[tuple[int, int]]:
             x1, y1 = p1
             x2, y2 = p2
 
-            (rise, run) = _find_slope(p1, p2)
+            rise, run = _find_slope(p1, p2)
             anti_nodes.add((x1 - run, y1 - rise))
             anti_nodes.add((x2 + run, y2 + rise))
 
@@ -118,19 +141,18 @@ def _find_slope(
 
 def _in_bounds(
     pos: tuple[int, int],
-    area: list[list[str]],
+    area: Grid,
 ) -> bool:
     """Determines whether or not the the current position is within the area of the grid
 
     Args:
         pos (tuple[int, int]): position of the guard
-        area (list[list[str]]): 2D array representing the area
+        area (Grid): grid representing the area
 
     Returns:
         bool: returns True if position is in bounds, False otherwise
     """
-    x, y = pos
-    return 0 <= y < len(area) and 0 <= x < len(area[y])
+    return area.contains(*pos)
 
 
 # TEST CASES ---------------------------------------------------------------------------
@@ -151,7 +173,7 @@ INPUT_S = """\
 EXPECTED = 14
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -161,14 +183,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,43 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, loader
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "digits"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
+
+
+def parse(input_string: str) -> list[int]:
+    """Parses the disk map into its digits.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[int]: alternating file and free space lengths
+    """
 
     disk_map = ""
     for line in input_string.splitlines():
         disk_map += line.strip()
 
+    return list(map(int, disk_map))
+
+
+def parse_buffer(buffer: memoryview) -> bytes:
+    """Same as `parse`, but reads a memory mapped input into one compact copy."""
+    return loader.digits(buffer)
+
+
+def solve_parsed(disk_map: list[int]) -> int:
+
     blocks = _get_block(disk_map)
     reordered = _reorder(blocks)
     end = reordered.index(".")
@@ -22,11 +45,11 @@ def solve(input_string: str) -> int:
     return sum([int(id) * i for i, id in enumerate(reordered[:end])])
 
 
-def _get_block(disk_map: str) -> list[str]:
+def _get_block(disk_map: list[int]) -> list[str]:
     """Converts disk_map to individual blocks
 
     Args:
-        disk_map (str): disk block of data
+        disk_map (list[int]): disk block of data
 
     Returns:
         list[str]: returns a list where each item is a block
@@ -35,9 +58,9 @@ def _get_block(disk_map: str) -> list[str]:
     l: list[str] = []
     for i, val in enumerate(disk_map):
         if i % 2 == 0:
-            l.extend([str(i // 2)] * int(val))
+            l.extend([str(i // 2)] * val)
         else:
-            l.extend(["."] * int(val))
+            l.extend(["."] * val)
 
     return l
 
@@ -86,7 +109,7 @@ INPUT_S = """\
 EXPECTED = 1928
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -96,14 +119,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,31 +1,56 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+import heapq
+from typing import Sequence
+from aoc import cli, counters, loader
+from aoc.testing import parametrize
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "digits"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
+
+
+def parse(input_string: str) -> list[int]:
+    """Parses the disk map into its digits.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[int]: alternating file and free space lengths
+    """
 
     disk_map = ""
     for line in input_string.splitlines():
         disk_map += line.strip()
 
+    return list(map(int, disk_map))
+
+
+def parse_buffer(buffer: memoryview) -> bytes:
+    """Same as `parse`, but reads a memory mapped input into one compact copy."""
+    return loader.digits(buffer)
+
+
+def solve_parsed(disk_map: list[int]) -> int:
+
     blocks = _get_block(disk_map)
     reordered = _reorder(blocks)
 
     return sum([int(id) * i for i, id in enumerate(reordered) if id != "."])
 
 
-def _get_block(disk_map: str) -> list[str]:
+def _get_block(disk_map: list[int]) -> list[str]:
     """Converts disk_map to individual blocks
 
     Args:
-        disk_map (str): disk block of data
+        disk_map (list[int]): disk block of data
 
     Returns:
         list[str]: returns a list where each item is a block
@@ -34,9 +59,9 @@ def _get_block(disk_map: str) -> list[str]:
     l: list[str] = []
     for i, val in enumerate(disk_map):
         if i % 2 == 0:
-            l.extend([str(i // 2)] * int(val))
+            l.extend([str(i // 2)] * val)
         else:
-            l.extend(["."] * int(val))
+            l.extend(["."] * val)
 
     return l
 
@@ -105,14 +130,77 @@ def _find_start(block: list[str], file: str) -> int:
             num += 1
 
             if count == num:
+                if counters.ENABLED:
+                    counters.add("scanned_cells", i + 1)
                 return i - num + 1
 
         else:
             num = 0
 
+    if counters.ENABLED:
+        counters.add("scanned_cells", right)
     return -1
 
 
+def _solve_heaps(disk_map: Sequence[int]) -> int:
+    """Same answer as `solve_parsed` without building the blocks. Free spans are kept
+    in one heap of start positions per span length, so the leftmost span that fits a
+    file is the smallest head among the heaps of lengths at least the file's.
+
+    Args:
+        disk_map (Sequence[int]): alternating file and free space lengths
+
+    Returns:
+        int: filesystem checksum
+    """
+
+    files: list[tuple[int, int]] = []
+    spans: list[tuple[int, int]] = []
+
+    pos = 0
+    for i, length in enumerate(disk_map):
+        if i % 2 == 0:
+            files.append((pos, length))
+        elif spans and sum(spans[-1]) == pos:
+
+            # Free space around an empty file is one span
+            spans[-1] = (spans[-1][0], spans[-1][1] + length)
+        elif length:
+            spans.append((pos, length))
+        pos += length
+
+    # Files are at most 9 blocks long, so longer spans all go in the last heap
+    free: list[list[tuple[int, int]]] = [[] for _ in range(10)]
+    for span in spans:
+        free[min(span[1], 9)].append(span)
+
+    checksum = 0
+    for file_id in range(len(files) - 1, -1, -1):
+        start, length = files[file_id]
+        if length == 0:
+            continue
+
+        best = None
+        for size in range(length, len(free)):
+            if free[size] and free[size][0][0] < start:
+                if best is None or free[size][0] < free[best][0]:
+                    best = size
+
+        if best is not None:
+            span_start, span_length = heapq.heappop(free[best])
+            start = span_start
+            if span_length > length:
+                rest = (span_start + length, span_length - length)
+                heapq.heappush(free[min(rest[1], 9)], rest)
+
+        checksum += file_id * (start * length + length * (length - 1) // 2)
+
+    return checksum
+
+
+ENGINES = {"heaps": _solve_heaps}
+
+
 # TEST CASES ---------------------------------------------------------------------------
 INPUT_S = """\
 2333133121414131402
@@ -120,7 +208,7 @@ INPUT_S = """\
 EXPECTED = 2858
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -128,16 +216,14 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-# MAIN ---------------------------------------------------------------------------------
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
+@parametrize("input_s", (INPUT_S, "12031\n", "1020304\n"))
+def test_heaps(input_s: str) -> None:
+    assert _solve_heaps(parse(input_s)) == solve_parsed(parse(input_s))
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
 
-    return 0
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
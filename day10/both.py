@@ -0,0 +1,61 @@
+from __future__ import annotations
+import os
+from aoc import cli
+from aoc.grid import Grid
+from aoc.testing import parametrize
+from day10 import part1, part2
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = part2.CACHE
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+parse = part2.parse
+parse_buffer = part2.parse_buffer
+
+
+def solve_both(input_string: str) -> tuple[int, int]:
+    return solve_both_parsed(parse(input_string))
+
+
+def solve_both_parsed(rows: list[str]) -> tuple[int, int]:
+    """Builds the trail graph once and scores every trailhead for both parts on it.
+
+    Args:
+        rows (list[str]): rows of the grid
+
+    Returns:
+        tuple[int, int]: answers of part 1 and part 2
+    """
+
+    grid = Grid(rows)
+    graph = part2._create_graph(grid)
+    offsets = grid.offsets(part2.DIRECTIONS)
+    target = ord("9")
+
+    score = rating = 0
+    for node in grid.find(ord("0")):
+        score += part1._bfs(graph, offsets, node, grid.cells, target)
+        rating += part2._search(graph, offsets, node, grid.cells, target)
+
+    return score, rating
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize(
+    ("input_s", "expected"),
+    ((part1.INPUT_S, (part1.EXPECTED, part2.EXPECTED)),),
+)
+def test(input_s: str, expected: tuple[int, int]) -> None:
+    assert solve_both(input_s) == expected
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_both_parsed, INPUT_TXT)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,14 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, counters, loader
+from aoc.grid import Grid
+from aoc.testing import parametrize
 from collections import deque
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "grid"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
@@ -23,99 +25,106 @@ DIRECTIONS = [
 
 
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    area: list[list[int]] = []
-    for line in input_string.splitlines():
-        area.append(list(map(int, line.strip())))
 
-    graph = _create_graph(area)
-    starting_nodes = [v for v in graph.values() if v.get_height() == 0]
+def parse(input_string: str) -> list[str]:
+    """Parses the input into the rows of the grid.
 
-    return sum([_search(node, 9) for node in starting_nodes])
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[str]: rows of the grid
+    """
+    return [line.strip() for line in input_string.splitlines()]
+
+
+def parse_buffer(buffer: memoryview) -> list[memoryview]:
+    """Same as `parse`, but returns rows as views over a memory mapped input."""
+    return loader.lines(buffer)
 
 
-def _create_graph(area: list[list[int]]) -> dict[tuple[int, int], Node]:
-    """Creates a graph using the 2D representation of the area
+def solve_parsed(rows: list[str]) -> int:
+
+    grid = Grid(rows)
+    graph = _create_graph(grid)
+    offsets = grid.offsets(DIRECTIONS)
+    starting_nodes = grid.find(ord("0"))
+
+    return sum(
+        [_search(graph, offsets, node, grid.cells, ord("9")) for node in starting_nodes]
+    )
+
+
+def _create_graph(grid: Grid) -> bytearray:
+    """Creates a graph using the grid representation of the area. The graph has one
+    byte per cell, where bit `k` is set if the trail can go from that cell to its
+    neighbor in `DIRECTIONS[k]`.
 
     Args:
-        area (list[list[int]]): 2D array representation of the area
+        grid (Grid): grid representation of the area
 
     Returns:
-        dict[tuple[int, int], Node]: Key is the coordinate, Value is the Node
+        bytearray: neighbor bit masks, indexed like the cells of the grid
     """
 
-    graph: dict[tuple[int, int], Node] = dict()
-    for y in range(len(area)):
-        for x in range(len(area[y])):
-
-            # Create node if it doesn't exist
-            graph[(x, y)] = graph.get((x, y), Node(x, y, area[y][x]))
-            for dx, dy in DIRECTIONS:
-                nx, ny = x + dx, y + dy
+    cells = grid.cells
+    offsets = grid.offsets(DIRECTIONS)
 
-                # Out of bounds
-                if not (0 <= ny < len(area) and 0 <= nx < len(area[ny])):
-                    continue
+    graph = bytearray(len(cells))
+    for i in grid.positions():
 
-                # Create neighbor node if doesn't exist
-                graph[(nx, ny)] = graph.get((nx, ny), Node(nx, ny, area[ny][nx]))
-
-                # Add neighbor if traversable
-                if graph[(x, y)].get_height() + 1 == graph[(nx, ny)].get_height():
-                    graph[(x, y)].add_neighbor(graph[((nx, ny))])
+        # Border cells are 0, so they are never one higher than a height
+        for bit, offset in enumerate(offsets):
+            if cells[i] + 1 == cells[i + offset]:
+                graph[i] |= 1 << bit
 
     return graph
 
 
-def _search(starting_node: Node, target_height: int) -> int:
+def _search(
+    graph: bytearray,
+    offsets: list[int],
+    starting_node: int,
+    cells: bytearray,
+    target_height: int,
+) -> int:
     """Conducts a search from the starting node to see if it can reach a node with
     the desired target height. Since the graph is a DAG, we don't have to worry about
     cycles.
 
     Args:
-        starting_node (Node): starting node
+        graph (bytearray): neighbor bit masks from `_create_graph`
+        offsets (list[int]): index offsets of `DIRECTIONS`
+        starting_node (int): index of the starting cell
+        cells (bytearray): cells of the grid
         target_height (int): desired height of a node we want to be able to reach
 
     Returns:
         int: number of times we hit a node with the height target_height
     """
 
-    q: deque[Node] = deque()
-    visited: set[Node] = set()
-
-    visited.add(starting_node)
+    q: deque[int] = deque()
     q.append(starting_node)
 
-    paths = 0
+    paths = expanded = 0
     while q:
         node = q.popleft()
+        expanded += 1
 
-        for neighbor in node.get_neighbors():
-            paths += 1 if neighbor.get_height() == target_height else 0
+        for bit, offset in enumerate(offsets):
+            if not graph[node] >> bit & 1:
+                continue
 
-            visited.add(neighbor)
+            neighbor = node + offset
+            paths += 1 if cells[neighbor] == target_height else 0
             q.append(neighbor)
 
-    return paths
-
-
-class Node:
-    def __init__(self, x: int, y: int, h: int):
-        self.__id = (x, y)
-        self.__height = h
-        self.__neighbors: set[Node] = set()
-
-    def add_neighbor(self, other: Node) -> None:
-        self.__neighbors.add(other)
+    if counters.ENABLED:
+        counters.add("nodes_expanded", expanded)
 
-    def get_height(self) -> int:
-        return self.__height
-
-    def get_neighbors(self) -> set[Node]:
-        return self.__neighbors
-
-    def __repr__(self) -> str:
-        return f"Node(loc={self.__id}, h={self.__height}): neighbors={[n.__id for n in self.__neighbors]}"
+    return paths
 
 
 # TEST CASES ---------------------------------------------------------------------------
@@ -132,7 +141,7 @@ INPUT_S = """\
 EXPECTED = 81
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -142,14 +151,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
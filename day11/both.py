@@ -0,0 +1,67 @@
+from __future__ import annotations
+import os
+from aoc import cli
+from aoc.testing import parametrize
+from day11 import part1, part2
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+INPUT_TXT = os.path.join(DIR, "input.txt")
+BLINKS = (part1.BLINKS, part2.BLINKS)
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+parse = part2.parse
+
+
+def solve_both(
+    input_string: str, input_blinks: tuple[int, int] = BLINKS
+) -> tuple[int, int]:
+    return solve_both_parsed(parse(input_string), input_blinks)
+
+
+def solve_both_parsed(
+    stones: list[str], input_blinks: tuple[int, int] = BLINKS
+) -> tuple[int, int]:
+    """Blinks once up to the larger number of blinks, reading off the stone count of
+    the smaller one on the way instead of starting over.
+
+    Args:
+        stones (list[str]): stones before blinking
+        input_blinks (tuple[int, int]): blinks of part 1 and part 2
+
+    Returns:
+        tuple[int, int]: number of stones after each number of blinks
+    """
+
+    stones_count: dict[str, int] = dict()
+    for stone in stones:
+        stones_count[stone] = stones_count.get(stone, 0) + 1
+
+    totals: dict[int, int] = {0: len(stones)}
+    for blink in range(1, max(input_blinks) + 1):
+        stones_count = part2._blink(stones_count)
+        if blink in input_blinks:
+            totals[blink] = sum(stones_count.values())
+
+    return totals[input_blinks[0]], totals[input_blinks[1]]
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize(
+    ("input_s", "input_blinks", "expected"),
+    ((part2.INPUT_S, (6, part2.INPUT_BLINKS), (22, part2.EXPECTED)),),
+)
+def test(
+    input_s: str, input_blinks: tuple[int, int], expected: tuple[int, int]
+) -> None:
+    assert solve_both(input_s, input_blinks) == expected
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_both_parsed, INPUT_TXT)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,21 +1,32 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, counters
+from aoc.testing import parametrize
 from functools import cache
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+BLINKS = 25
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
-def solve(input_string: str, input_blinks: int) -> int:
+def solve(input_string: str, input_blinks: int = BLINKS) -> int:
+    return solve_parsed(parse(input_string), input_blinks)
+
+
+def parse(input_string: str) -> list[str]:
+    """Parses the input into the numbers engraved on the stones, kept as strings."""
 
     stones: list[str] = []
     for line in input_string.splitlines():
         stones.extend(line.strip().split(" "))
 
+    return stones
+
+
+def solve_parsed(stones: list[str], input_blinks: int = BLINKS) -> int:
+
     # Count stones
     stones_count: dict[str, int] = dict()
     for stone in stones:
@@ -49,6 +60,7 @@ def _blink(stones_count: dict[str, int]) -> dict[str, int]:
 
 
 # Cache because i'm too lazy to implement memoization LOL
+@counters.track_cache
 @cache
 def process(stone: str) -> list[str]:
     """Process the stone. Rules follow the following order:
@@ -91,7 +103,7 @@ INPUT_BLINKS = 25
 EXPECTED = 55312
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "input_blinks", "expected"),
     ((INPUT_S, INPUT_BLINKS, EXPECTED),),
 )
@@ -101,14 +113,7 @@ def test(input_s: str, input_blinks: int, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read(), 25))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,14 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
+from aoc import cli, loader
+from aoc.grid import Grid
+from aoc.testing import parametrize
 from collections import deque
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "grid"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
@@ -23,121 +25,82 @@ DIRECTIONS = [
 
 
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    area: list[str] = []
-    for line in input_string.splitlines():
-        area.append(line.strip())
 
-    graph = _make_graph(area)
-    return _get_cost(set(v for v in graph.values()))
-
-
-def _make_graph(area: list[str]) -> dict[tuple[int, int], Node]:
-    """Constructs a graph of plants based off the 2D representation of the garden.
+def parse(input_string: str) -> list[str]:
+    """Parses the input into the rows of the grid.
 
     Args:
-        area (list[list[str]]): 2D representation of the garden.
+        input_string (str): puzzle input
 
     Returns:
-        dict[tuple[int, int], Node]: Dictionary, where each key is a coordinate and
-        each value is a Node.
+        list[str]: rows of the grid
     """
+    return [line.strip() for line in input_string.splitlines()]
 
-    graph: dict[tuple[int, int], Node] = {}
-    for y in range(len(area)):
-        for x in range(len(area[y])):
-            plant = area[y][x]
-            graph[(x, y)] = graph.get((x, y), Node((x, y), plant))
-
-            for dx, dy in DIRECTIONS:
-                nx, ny = dx + x, dy + y
-
-                if not (0 <= ny < len(area) and 0 <= nx < len(area[ny])):
-                    continue
 
-                new_plant = area[ny][nx]
-                graph[(nx, ny)] = graph.get((nx, ny), Node((nx, ny), new_plant))
+def parse_buffer(buffer: memoryview) -> list[memoryview]:
+    """Same as `parse`, but returns rows as views over a memory mapped input."""
+    return loader.lines(buffer)
 
-                # Neighbors
-                if plant == new_plant:
-                    graph[(nx, ny)].add_neighbor(graph[(x, y)])
-                    graph[(x, y)].add_neighbor(graph[(nx, ny)])
 
-    return graph
+def solve_parsed(area: list[str]) -> int:
+    return _get_cost(Grid(area))
 
 
-def _get_cost(nodes: set[Node]) -> int:
+def _get_cost(grid: Grid) -> int:
     """Gets cost of fencing for the area.
-    Uses a modified BFS.
+    Uses a modified DFS over the cells of each region.
 
     Args:
-        nodes (set[Node]): nodes representing the garden
+        grid (Grid): grid representing the garden
 
     Returns:
         int: total cost
     """
 
-    visited: set[Node] = set()
+    cells = grid.cells
+    offsets = grid.offsets(DIRECTIONS)
+    visited = bytearray(len(cells))
     cost = 0
 
-    # Attempt to start a BFS at each node
-    for node in nodes:
+    # Attempt to start a search at each cell
+    for node in grid.positions():
 
         # If already in a group, skip
-        if node in visited:
+        if visited[node]:
             continue
 
-        # Perform BFS as this start node, this will be one group
+        # Perform search at this start node, this will be one group
+        plant = cells[node]
         d = deque([node])
-        visited.add(node)
+        visited[node] = 1
 
-        fence = 4
-        volume = 1
+        fence = 0
+        volume = 0
 
         while d:
             popped = d.pop()
-
-            for neighbor in popped.get_neighbors():
-
-                # Share a border
-                if neighbor in visited:
-
-                    # Need to consider a pair of adjacent plants only once
-                    neighbor.remove_neighbor(popped)
-                    fence -= 2
-
+            volume += 1
+
+            # Every side that doesn't touch the same plant needs a fence. Border cells
+            # never hold a plant, so the edge of the garden is fenced too.
+            for offset in offsets:
+                neighbor = popped + offset
+                if cells[neighbor] != plant:
+                    fence += 1
                     continue
 
-                visited.add(neighbor)
-                d.append(neighbor)
-
-                fence += 4
-                volume += 1
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    d.append(neighbor)
 
         cost += fence * volume
 
     return cost
 
 
-class Node:
-    def __init__(self, coordinates: tuple[int, int], plant: str):
-        self._coordinates = coordinates
-        self._plant = plant
-        self._neighbors: set[Node] = set()
-
-    def add_neighbor(self, other: Node) -> None:
-        self._neighbors.add(other)
-
-    def get_neighbors(self) -> set[Node]:
-        return self._neighbors
-
-    def remove_neighbor(self, other: Node):
-        self._neighbors.discard(other)
-
-    def __repr__(self):
-        return f"Node(coordinates={self._coordinates}, plant={self._plant}, neighbors={[node._coordinates for node in self._neighbors]})"
-
-
 # TEST CASES ---------------------------------------------------------------------------
 INPUT_S = """\
 RRRRIICCFF
@@ -154,7 +117,7 @@ MMMISSJEEE
 EXPECTED = 1930
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -164,14 +127,7 @@ def test(input_s: str, expected: int) -> None:
 
 # MAIN ---------------------------------------------------------------------------------
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f:
-        print(solve(f.read()))
-
-    return 0
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":
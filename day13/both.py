@@ -0,0 +1,75 @@
+from __future__ import annotations
+import os
+from aoc import cli
+from aoc.lazy import lazy_import
+from aoc.testing import parametrize
+from day13 import part1, part2
+
+np = lazy_import("numpy")
+
+# CONSTANTS ----------------------------------------------------------------------------
+DIR = os.path.dirname(os.path.abspath(__file__))
+INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = part2.CACHE
+OFFSET = 10000000000000
+
+
+# BUSINESS LOGIC -----------------------------------------------------------------------
+parse = part2.parse
+
+
+def solve_both(input_string: str) -> tuple[int, int]:
+    return solve_both_parsed(parse(input_string))
+
+
+def solve_both_parsed(rows: list[list[int]]) -> tuple[int, int]:
+    """Solves each machine's buttons once for both prize locations, passing the part 1
+    and part 2 prizes as two right hand sides of the same system.
+
+    Args:
+        rows (list[list[int]]): `[xa, ya, xb, yb, px, py]` for each machine
+
+    Returns:
+        tuple[int, int]: answers of part 1 and part 2
+    """
+
+    tokens = [0, 0]
+    for xa, ya, xb, yb, px, py in rows:
+        x = np.array(
+            [
+                [xa, xb],
+                [ya, yb],
+            ]
+        )
+        y = np.array(
+            [
+                [px, px + OFFSET],
+                [py, py + OFFSET],
+            ]
+        )
+        presses = np.rint(np.linalg.solve(x, y))
+
+        for i, offset in enumerate((0, OFFSET)):
+            sa, sb = presses[:, i]
+            if sa * xa + sb * xb == px + offset and sa * ya + sb * yb == py + offset:
+                tokens[i] += int(3 * sa + sb)
+
+    return tokens[0], tokens[1]
+
+
+# TEST CASES ---------------------------------------------------------------------------
+@parametrize(
+    ("input_s", "expected"),
+    ((part1.INPUT_S, (part1.EXPECTED, part2.EXPECTED)),),
+)
+def test(input_s: str, expected: tuple[int, int]) -> None:
+    assert solve_both(input_s) == expected
+
+
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_both_parsed, INPUT_TXT)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
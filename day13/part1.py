@@ -1,33 +1,73 @@
 from __future__ import annotations
 import os
-import argparse
-import pytest
-import re
-import numpy as np
+from typing import Iterable
+from aoc import cli, tokenize
+from aoc.lazy import lazy_import
+from aoc.testing import parametrize
+
+np = lazy_import("numpy")
 
 # CONSTANTS ----------------------------------------------------------------------------
 DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_TXT = os.path.join(DIR, "input.txt")
+CACHE = "rows"
 
 
 # BUSINESS LOGIC -----------------------------------------------------------------------
 def solve(input_string: str) -> int:
+    return solve_parsed(parse(input_string))
 
-    machines: list[tuple[tuple[int, int], tuple[int, int], tuple[int, int]]] = []
-    for line in input_string.strip().split("\n\n"):
-        a, b, prize = line.split("\n")
 
-        movement_pattern = r"\+(\d+)"
-        xa, ya = re.findall(movement_pattern, a)
-        xb, yb = re.findall(movement_pattern, b)
+def parse(input_string: str) -> list[list[int]]:
+    """Parses each machine into the movements of both buttons and the prize location.
+
+    Args:
+        input_string (str): puzzle input
+
+    Returns:
+        list[list[int]]: `[xa, ya, xb, yb, px, py]` for each machine
+    """
+
+    values = tokenize.integers(input_string).values
+    if len(values) % 6:
+        raise ValueError("Every machine needs six numbers")
+
+    return values.reshape(-1, 6).tolist()
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    """Solves from an iterable of lines, such as an open file, one machine at a time.
+    Each machine is a block of three lines and blank lines between blocks are skipped.
+
+    Args:
+        lines (Iterable[str]): lines of the puzzle input
+
+    Returns:
+        int: fewest tokens to win every possible prize
+    """
+
+    total = 0
+    block: list[str] = []
+    for line in lines:
+        if line.strip():
+            block.append(line.strip())
+
+        if len(block) == 3:
+            total += solve_parsed(parse("\n".join(block)))
+            block.clear()
 
-        prize_pattern = r"=(\d+)"
-        px, py = re.findall(prize_pattern, prize)
+    return total
+
+
+def solve_parsed(rows: list[list[int]]) -> int:
+
+    machines: list[tuple[tuple[int, int], tuple[int, int], tuple[int, int]]] = []
+    for xa, ya, xb, yb, px, py in rows:
         machines.append(
             (
-                (int(xa), int(ya)),
-                (int(xb), int(yb)),
-                (int(px), int(py)),
+                (xa, ya),
+                (xb, yb),
+                (px, py),
             )
         )
 
@@ -81,7 +121,7 @@ Prize: X=18641, Y=10279
 EXPECTED = 480
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -89,16 +129,17 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-# MAIN ---------------------------------------------------------------------------------
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
-    args = parser.parse_args()
+@parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, EXPECTED),),
+)
+def test_lines(input_s: str, expected: int) -> None:
+    assert solve_lines(input_s.splitlines(keepends=True)) == expected
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
 
-    return 0
+# MAIN ---------------------------------------------------------------------------------
+def main() -> int:
+    return cli.main(parse, solve_parsed, INPUT_TXT)
 
 
 if __name__ == "__main__":